@@ -0,0 +1,166 @@
+"""Clip descriptors and their struct-of-arrays storage.
+
+`ClipDescriptor` describes one source clip placed in a project. `ClipTable` keeps numeric clip fields (in/out points, mute flags) in contiguous numpy
+arrays and the remaining fields in parallel Python lists. Bulk timeline queries
+(durations, range selection, sorting by in point) become single vectorized calls
+instead of Python loops over descriptor objects.
+
+Unset in/out points are stored as NaN. Indexing or iterating yields `ClipDescriptor`
+snapshots, so existing call sites reading `project.clips[i].in_point` keep working;
+mutate through the table (`append`, `pop`, `set_range`) rather than the snapshots.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+
+
+# Slotted: the table builds a fresh descriptor per index/iteration, so they stay
+# small and cheap to construct.
+@dataclass(slots=True)
+class ClipDescriptor:
+    path: str  # original file path
+    in_point: Optional[float] = None  # seconds
+    out_point: Optional[float] = None  # seconds
+    mute: bool = False
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def duration_range(self) -> Optional[float]:
+        if self.in_point is None or self.out_point is None:
+            return None
+        return max(0.0, self.out_point - self.in_point)
+
+
+class ClipTable:
+    def __init__(self, clips: Iterable[ClipDescriptor] = ()):
+        self._size = 0
+        self._in = np.empty(0, dtype=np.float64)
+        self._out = np.empty(0, dtype=np.float64)
+        self._mute = np.empty(0, dtype=bool)
+        self.paths: list[str] = []
+        self.metadata: list[dict[str, Any]] = []
+        for clip in clips:
+            self.append(clip)
+
+    # --- Column views (length == len(self)) ---
+    @property
+    def in_points(self) -> np.ndarray:
+        return self._in[: self._size]
+
+    @property
+    def out_points(self) -> np.ndarray:
+        return self._out[: self._size]
+
+    @property
+    def mute(self) -> np.ndarray:
+        return self._mute[: self._size]
+
+    def durations(self) -> np.ndarray:
+        """Per-clip ``out - in`` clamped at zero; NaN where a point is unset."""
+        return np.clip(self.out_points - self.in_points, 0.0, None)
+
+    # --- Mutation ---
+    def append(self, clip: ClipDescriptor) -> None:
+        if self._size == self._in.shape[0]:
+            self._grow(max(8, self._size * 2))
+        i = self._size
+        self._in[i] = _to_float(clip.in_point)
+        self._out[i] = _to_float(clip.out_point)
+        self._mute[i] = clip.mute
+        self.paths.append(clip.path)
+        self.metadata.append(clip.metadata)
+        self._size += 1
+
+    def pop(self, index: int) -> ClipDescriptor:
+        index = self._normalize(index)
+        clip = self[index]
+        n = self._size
+        for column in (self._in, self._out, self._mute):
+            column[index : n - 1] = column[index + 1 : n]
+        del self.paths[index]
+        del self.metadata[index]
+        self._size -= 1
+        return clip
+
+    def set_range(
+        self, index: int, in_point: Optional[float], out_point: Optional[float]
+    ) -> None:
+        index = self._normalize(index)
+        self._in[index] = _to_float(in_point)
+        self._out[index] = _to_float(out_point)
+
+    def _grow(self, capacity: int) -> None:
+        n = self._size
+        for name in ("_in", "_out", "_mute"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(self, name, new)
+
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
+            raise IndexError("clip index out of range")
+        return index
+
+    # --- Sequence protocol ---
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> ClipDescriptor:
+        index = self._normalize(index)
+        return ClipDescriptor(
+            path=self.paths[index],
+            in_point=_from_float(self._in[index]),
+            out_point=_from_float(self._out[index]),
+            mute=bool(self._mute[index]),
+            metadata=self.metadata[index],
+        )
+
+    def __iter__(self) -> Iterator[ClipDescriptor]:
+        for i in range(self._size):
+            yield self[i]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ClipTable):
+            return self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ClipTable({list(self)!r})"
+
+    # --- Serialization ---
+    def to_list(self) -> list[dict[str, Any]]:
+        return list(self.iter_dicts())
+
+    def iter_dicts(self) -> Iterator[dict[str, Any]]:
+        """Yield one JSON-ready dict per clip without materializing the whole list."""
+        ins = self.in_points.tolist()
+        outs = self.out_points.tolist()
+        mutes = self.mute.tolist()
+        for i in range(self._size):
+            yield {
+                "path": self.paths[i],
+                "in_point": None if math.isnan(ins[i]) else ins[i],
+                "out_point": None if math.isnan(outs[i]) else outs[i],
+                "mute": mutes[i],
+                "metadata": self.metadata[i],
+            }
+
+
+def _to_float(value: Optional[float]) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _from_float(value: float) -> Optional[float]:
+    return None if math.isnan(value) else float(value)
+
+
+__all__ = ["ClipDescriptor", "ClipTable"]
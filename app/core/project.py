@@ -2,38 +2,39 @@
 
 In the future this will include tracks (video/audio/text), transitions, effects,
 caption layers, etc. For now it's a minimal list of clip descriptors with basic
-serialization.
+serialization. Clips are stored column-wise in a `ClipTable` (see `clips.py`) so
+bulk timeline queries can be vectorized.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Any
+from dataclasses import dataclass, field
+from typing import Any
 import json
 from pathlib import Path
 
+import numpy as np
 
-@dataclass
-class ClipDescriptor:
-    path: str  # original file path
-    in_point: Optional[float] = None  # seconds
-    out_point: Optional[float] = None  # seconds
-    mute: bool = False
-    metadata: dict[str, Any] = field(default_factory=dict)
+from .clips import ClipDescriptor, ClipTable
 
-    def duration_range(self) -> Optional[float]:
-        if self.in_point is None or self.out_point is None:
-            return None
-        return max(0.0, self.out_point - self.in_point)
+try:  # optional C-accelerated JSON codec; output stays plain JSON either way
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 
 @dataclass
 class Project:
     name: str = "Untitled"
-    clips: List[ClipDescriptor] = field(default_factory=list)
+    clips: ClipTable = field(default_factory=ClipTable)
     version: int = 1
     extra: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Accept any iterable of ClipDescriptor (e.g. a list) for convenience.
+        if not isinstance(self.clips, ClipTable):
+            self.clips = ClipTable(self.clips)
+
     def add_clip(self, clip: ClipDescriptor) -> None:
         self.clips.append(clip)
 
@@ -42,8 +43,17 @@ class Project:
             raise IndexError("clip index out of range")
         return self.clips.pop(index)
 
+    def total_duration(self) -> float:
+        """Sum of trimmed clip durations in seconds (clips without a range count as 0)."""
+        return float(np.nansum(self.clips.durations()))
+
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "clips": self.clips.to_list(),
+            "version": self.version,
+            "extra": self.extra,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Project":
@@ -57,14 +67,30 @@ class Project:
         )
 
     def save(self, path: str | Path) -> None:
-        p = Path(path)
-        p.write_text(json.dumps(self.to_dict(), indent=2))
+        # Streamed one clip per line so large projects never hold a second,
+        # fully materialized copy of the clip list (as to_dict() would).
+        with Path(path).open("wb") as f:
+            f.write(b'{\n  "name": ' + _dumps(self.name) + b',\n  "clips": [')
+            for i, clip in enumerate(self.clips.iter_dicts()):
+                f.write(b",\n    " if i else b"\n    ")
+                f.write(_dumps(clip))
+            f.write(b"\n  ]" if len(self.clips) else b"]")
+            f.write(b',\n  "version": ' + _dumps(self.version))
+            f.write(b',\n  "extra": ' + _dumps(self.extra) + b"\n}\n")
 
     @classmethod
     def load(cls, path: str | Path) -> "Project":
-        p = Path(path)
-        data = json.loads(p.read_text())
+        # Read bytes: both codecs decode UTF-8 themselves, so no locale-dependent
+        # text layer is involved.
+        raw = Path(path).read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         return cls.from_dict(data)
 
 
+def _dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+
 __all__ = ["Project", "ClipDescriptor"]
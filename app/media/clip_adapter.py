@@ -1,66 +1,250 @@
 """Thread-safe adapter around MoviePy VideoFileClip providing simplified access.
 
-Encapsulates mutex locking strategy so UI/services can call without duplicating code.
+Encapsulates locking so UI/services can call without duplicating code. The adapter's
+lock only serializes the GUI thread (seeks) and the playback decoder thread, which
+share one ffmpeg pipe. Background generators (thumbnails, waveform) must not share
+it: they decode from an independent clip (`thumbnail_clone()` / `open_private_clip`,
+or `SharedPrivateClip` to keep one open across jobs) so they never stall playback.
+
+Sequential decoding:
+``get_frame(t)`` goes through MoviePy's time based lookup on every call. For linear
+playback the adapter also exposes ``next_frame()`` which reads straight from the
+clip's open ffmpeg pipe (``clip.reader``) and ``seek(t)`` which repositions that pipe.
+Only explicit seeks pay for re-spawning the decoder; continuous playback amortizes
+to a single decode pass. ``grab_to(index)`` serves frame-skipping playback: frames
+between the pipe position and ``index`` are read and discarded without being turned
+into arrays, and only the target frame is materialized. Clips without a reader
+(e.g. generated clips) fall back to time based ``get_frame`` transparently.
+
+The sequential paths (``next_frame``/``grab_to``) read straight from the pipe into
+buffers leased from a `FramePool`, so steady playback does not allocate a new frame
+array per read; the caller hands each one back with ``release_frame`` once done with
+it. ``seek``/``get_frame`` results are fresh arrays the caller owns outright, since
+callers may cache them indefinitely.
 """
 
 from __future__ import annotations
 
+import threading
+
+from .frame_pool import FramePool
+from .moviepy_loader import video_file_clip_class
+
+# Beyond this many frames ahead re-spawning ffmpeg at the target beats draining the pipe
+# (mirrors MoviePy's own FFMPEG_VideoReader.get_frame heuristic).
+_MAX_GRAB_SKIP = 100
 
-try:
-    from moviepy import VideoFileClip
-except ImportError:  # pragma: no cover
-    try:
-        from moviepy.editor import VideoFileClip  # type: ignore
-    except ImportError:  # pragma: no cover
-        VideoFileClip = None  # type: ignore
 
-from PySide6.QtCore import QMutex
+def open_private_clip(clip):
+    """Open an independent video-only MoviePy clip on the same source file as ``clip``.
+
+    Returns None when ``clip`` is not file backed (e.g. generated clips), in which
+    case callers fall back to the shared clip. The caller owns the result and must
+    ``close()`` it.
+    """
+    path = getattr(clip, "filename", None)
+    if not path:
+        return None
+    return video_file_clip_class()(path, audio=False)
+
+
+class SharedPrivateClip:
+    """A private clip (see `open_private_clip`) reused by successive background jobs.
+
+    Regenerating thumbnails for the same media (e.g. on resize) used to spawn and tear
+    down an ffmpeg process per generation. The handle opens the private clip on first
+    use and keeps it until ``close()``. Only one job uses it at a time: ``with handle
+    as clip`` holds its lock and yields the private clip, or None when the source is
+    not file backed / cannot be opened.
+    """
+
+    def __init__(self, clip):
+        self._source = clip
+        self._lock = threading.Lock()
+        self._clip = None
+        self._opened = False
+
+    def __enter__(self):
+        self._lock.acquire()
+        if not self._opened:
+            self._opened = True
+            try:
+                self._clip = open_private_clip(self._source)
+            except Exception:
+                self._clip = None
+        return self._clip
+
+    def __exit__(self, *exc):
+        self._lock.release()
+        return False
+
+    def close(self) -> None:
+        """Close the private clip; waits for the job currently using it."""
+        with self._lock:
+            if self._clip is not None:
+                try:
+                    self._clip.close()
+                except Exception:
+                    pass
+                self._clip = None
+            # A later job on a closed handle falls back to the shared clip.
+            self._opened = True
 
 
 class ClipAdapter:
     def __init__(self, clip):
         self._clip = clip
-        self._mutex = QMutex()
-        # Attach mutex to underlying clip for legacy workers if needed
-        try:
-            setattr(self._clip, "_external_mutex", self._mutex)
-        except Exception:  # pragma: no cover
-            pass
+        self._lock = threading.Lock()
+        # Clip timing never changes after load; read it once instead of per call.
+        self.duration = float(getattr(clip, "duration", 0.0) or 0.0)
+        self.fps = float(getattr(clip, "fps", 0.0) or 0.0)
+        # Frame <-> time conversions assume 24 fps when the clip reports none.
+        self._index_fps = self.fps or 24.0
+        self._index_fps_inv = 1.0 / self._index_fps
+        # Index returned by the next next_frame() call.
+        self._next_index = 0
+        self._pool = FramePool()
+        # Pooled buffer last stored as the reader's last_read (see _detach).
+        self._pooled_last = None
 
     @property
     def clip(self):
         return self._clip
 
+
     @property
-    def duration(self) -> float:
-        return float(getattr(self._clip, "duration", 0.0))
+    def frame_count(self) -> int:
+        """Number of decodable frames (container metadata can overstate fps * duration)."""
+        reader = getattr(self._clip, "reader", None)
+        n_frames = getattr(reader, "n_frames", None)
+        if n_frames:
+            return int(n_frames)
+        duration = self.duration
+        return int(round(self.fps * duration)) if duration > 0 else 0
 
     @property
-    def fps(self) -> float:
-        return float(getattr(self._clip, "fps", 0.0))
+    def _reader(self):
+        # Sequential access assumes an unmodified VideoFileClip (as loaded by the
+        # app); anything without a live ffmpeg reader uses get_frame instead.
+        reader = getattr(self._clip, "reader", None)
+        if reader is None or getattr(reader, "proc", None) is None:
+            return None
+        return reader
+
+    def next_frame(self):
+        """Return the frame following the last ``seek``/``next_frame`` (linear playback path)."""
+        with self._lock:
+            return self._read_index(self._next_index, pooled=True)
+
+    def grab_to(self, index: int):
+        """Advance the sequential decoder to frame ``index`` and return it.
+
+        Intended for forward playback that may drop frames; backwards or distant
+        targets re-position the decoder like ``seek``.
+        """
+        with self._lock:
+            return self._read_index(index, pooled=True)
+
+    def seek(self, t: float):
+        """Reposition the sequential decoder at ``t`` and return that frame.
+
+        Subsequent ``next_frame()`` calls continue from the frame after ``t``.
+        """
+        with self._lock:
+            return self._read_index(int(t * self._index_fps + 1e-5))
+
+    def _read_index(self, index: int, pooled: bool = False):
+        # Caller holds the lock.
+        self._next_index = index + 1
+        reader = self._reader
+        if reader is None:
+            return self._clip.get_frame(index * self._index_fps_inv)
+        skip = index - reader.pos
+        if 0 <= skip <= _MAX_GRAB_SKIP:
+            if pooled:
+                return self._rgb(self._read_pooled(reader, skip))
+            # Drain skipped frames as raw bytes; only the target becomes an array.
+            if skip:
+                reader.skip_frames(skip)
+            return self._rgb(self._detach(reader.read_frame(), pooled))
+        if skip == -1 and hasattr(reader, "last_read"):
+            # last_read may be a pooled buffer already lent out; never alias it.
+            last = reader.last_read
+            if pooled:
+                buf = self._pool.acquire(last.shape)
+                buf[...] = last
+                return self._rgb(buf)
+            return self._rgb(last).copy()
+        frame = reader.get_frame(index * self._index_fps_inv)
+        return self._rgb(self._detach(frame, pooled))
+
+    def _detach(self, frame, pooled: bool):
+        # On a short read at the end of the stream MoviePy returns reader.last_read,
+        # which may be a pooled buffer that is lent out or back on the free list.
+        if frame is None or frame is not self._pooled_last:
+            return frame
+        if pooled:
+            buf = self._pool.acquire(frame.shape)
+            buf[...] = frame
+            return buf
+        return frame.copy()
+
+    def _read_pooled(self, reader, skip: int):
+        """Pooled equivalent of ``skip_frames(skip)`` + ``read_frame()``."""
+        w, h = reader.size
+        buf = self._pool.acquire((h, w, reader.depth))
+        stdout = reader.proc.stdout
+        # Skipped frames are drained into the same buffer the target then overwrites.
+        for _ in range(skip):
+            _read_exact(stdout, buf)
+        reader.pos += skip + 1
+        if not _read_exact(stdout, buf):
+            # Short read at the end of the stream: like MoviePy, repeat the last frame.
+            self._pool.release(buf)
+            last = getattr(reader, "last_read", None)
+            if last is None:
+                raise IOError(f"failed to read first frame of {reader.filename}")
+            # last_read may still be lent out; the caller gets a lease of its own.
+            buf = self._pool.acquire(last.shape)
+            buf[...] = last
+            return buf
+        reader.last_read = buf
+        self._pooled_last = buf
+        return buf
+
+    def release_frame(self, frame) -> None:
+        """Return a frame from ``next_frame``/``grab_to`` to the pool for reuse.
+
+        Any other array (e.g. from ``seek``) is ignored, so callers need not track
+        where a frame came from. The frame must not be read afterwards.
+        """
+        self._pool.release(frame)
+
+    @staticmethod
+    def _rgb(frame):
+        # Readers for clips with alpha emit RGBA; consumers expect RGB like get_frame.
+        if frame is not None and frame.ndim == 3 and frame.shape[2] == 4:
+            return frame[:, :, :3]
+        return frame
 
     def get_frame(self, t: float):
-        self._mutex.lock()
-        try:
+        with self._lock:
             return self._clip.get_frame(t)
-        finally:
-            self._mutex.unlock()
 
     def audio_array(self, fps: int = 200):
         audio = getattr(self._clip, "audio", None)
         if audio is None:
             return None
-        self._mutex.lock()
-        try:
+        with self._lock:
             return audio.to_soundarray(fps=fps)
-        finally:
-            self._mutex.unlock()
+
+    def thumbnail_clone(self):
+        """Independent video-only clip for background frame sampling (caller closes)."""
+        return open_private_clip(self._clip)
 
     @classmethod
     def from_path(cls, path: str) -> "ClipAdapter":
-        if VideoFileClip is None:
-            raise RuntimeError("MoviePy not available")
-        clip = VideoFileClip(path)
+        clip = video_file_clip_class()(path)
         return cls(clip)
 
     @classmethod
@@ -68,4 +252,16 @@ class ClipAdapter:
         return cls(clip)
 
 
-__all__ = ["ClipAdapter"]
+def _read_exact(stream, buf) -> bool:
+    """Fill ``buf`` from ``stream``; False if the stream ends first."""
+    view = memoryview(buf).cast("B")
+    filled = 0
+    while filled < len(view):
+        n = stream.readinto(view[filled:])
+        if not n:
+            return False
+        filled += n
+    return True
+
+
+__all__ = ["ClipAdapter", "SharedPrivateClip", "open_private_clip"]
@@ -0,0 +1,209 @@
+"""Background frame decoder feeding the playback controller.
+
+`DecoderWorker` lives on a dedicated QThread and reads frames ahead of the playhead
+into a small bounded lookahead buffer (sized by the controller to ~250ms of video).
+The GUI-thread timer in `VideoPlaybackController` only pops the newest frame that
+is due, so a slow decode never blocks the event loop.
+
+Threading contract:
+- All session state (buffer, next index, active flag) is guarded by `_mutex`; the
+  GUI thread talks to the worker only through `start()`, `stop()`, `take()`,
+  `drain()`, `retain_from()` and `shutdown()`. The worker's `run()` loop owns its thread, so
+  queued slot calls would never be delivered while it runs; plain mutex-guarded
+  requests are used instead.
+- Decoding itself happens outside `_mutex` and relies on the adapter's own lock,
+  so GUI-thread seeks on the same adapter stay safe.
+- Backpressure: when the buffer is full the worker sleeps on `_wake` until the
+  consumer takes a frame or the session changes.
+- Stride: a session may decode only every ``stride``-th frame (the display cannot
+  show the rest); the adapter's ``grab_to`` drains the frames in between.
+- Ownership: frames come from the adapter's frame pool. Frames handed out by
+  `take()`/`drain()` belong to the caller; every frame the worker drops itself
+  (skipped, cleared or stale) goes back via the adapter's ``release_frame``.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal, QMutex, QWaitCondition
+
+
+class DecoderWorker(QObject):
+    failed = Signal(str)
+
+    def __init__(self, capacity: int = 2):
+        super().__init__()
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+        self._buffer: deque = deque()  # (frame_index, frame) in decode order
+        self._capacity = max(1, capacity)
+        self._adapter = None
+        self._next_index = 0
+        self._end_index = 0
+        self._stride = 1
+        self._active = False
+        self._quit = False
+        # Bumped per session so a frame decoded for a stale session is discarded.
+        self._session = 0
+
+    # --- Control API (GUI thread) ---
+    def start(
+        self,
+        adapter,
+        start_index: int,
+        end_index: int,
+        capacity: Optional[int] = None,
+        stride: int = 1,
+    ):
+        """Begin decoding ``[start_index, end_index)`` from ``adapter``.
+
+        ``capacity`` sets how many frames are prefetched ahead of the consumer;
+        ``stride`` decodes only every n-th frame of the range.
+        """
+        self._mutex.lock()
+        try:
+            self._session += 1
+            if capacity is not None:
+                self._capacity = max(1, capacity)
+            self._releaseBuffered()
+            self._adapter = adapter
+            self._stride = max(1, stride)
+            self._next_index = max(0, start_index)
+            self._end_index = end_index
+            self._active = True
+            self._wake.wakeAll()
+        finally:
+            self._mutex.unlock()
+
+    def stop(self):
+        """Idle the worker and drop buffered frames (thread keeps running)."""
+        self._mutex.lock()
+        try:
+            self._session += 1
+            self._active = False
+            self._releaseBuffered()
+            self._wake.wakeAll()
+        finally:
+            self._mutex.unlock()
+
+    def shutdown(self):
+        """Make `run()` return so the owning thread can finish."""
+        self._mutex.lock()
+        try:
+            self._quit = True
+            self._active = False
+            self._wake.wakeAll()
+        finally:
+            self._mutex.unlock()
+
+    def retain_from(self, index: int) -> bool:
+        """Keep prefetched frames from ``index`` on if it lies inside the buffer.
+
+        Returns False (buffer untouched) when ``index`` is outside the prefetched
+        window, in which case the caller should `start()` a new session.
+        """
+        self._mutex.lock()
+        try:
+            if not self._active or not self._buffer:
+                return False
+            if not self._buffer[0][0] <= index <= self._buffer[-1][0]:
+                return False
+            while self._buffer[0][0] < index:
+                _release(self._adapter, self._buffer.popleft()[1])
+            self._wake.wakeAll()
+            return True
+        finally:
+            self._mutex.unlock()
+
+    def take(self, index: int) -> Optional[tuple[int, object]]:
+        """Pop buffered frames up to ``index`` and return the newest of them.
+
+        Returns None when no frame at or before ``index`` is ready. If the worker
+        has fallen behind ``index`` it skips ahead so late frames are never decoded.
+        """
+        self._mutex.lock()
+        try:
+            latest = None
+            while self._buffer and self._buffer[0][0] <= index:
+                if latest is not None:
+                    _release(self._adapter, latest[1])
+                latest = self._buffer.popleft()
+            if not self._buffer and self._next_index < index:
+                self._next_index = index
+            self._wake.wakeAll()
+            return latest
+        finally:
+            self._mutex.unlock()
+
+    def drain(self) -> list[tuple[int, object]]:
+        """Pop and return every buffered ``(frame_index, frame)``, oldest first."""
+        self._mutex.lock()
+        try:
+            frames = list(self._buffer)
+            self._buffer.clear()
+            self._wake.wakeAll()
+            return frames
+        finally:
+            self._mutex.unlock()
+
+    def _releaseBuffered(self):
+        # Caller holds _mutex; buffered frames always belong to self._adapter.
+        for _, frame in self._buffer:
+            _release(self._adapter, frame)
+        self._buffer.clear()
+
+    # --- Worker loop (decoder thread) ---
+    def run(self):
+        while True:
+            self._mutex.lock()
+            try:
+                while not self._quit and (
+                    not self._active
+                    or len(self._buffer) >= self._capacity
+                    or self._next_index >= self._end_index
+                ):
+                    self._wake.wait(self._mutex)
+                if self._quit:
+                    return
+                adapter = self._adapter
+                index = self._next_index
+                session = self._session
+            finally:
+                self._mutex.unlock()
+            try:
+                if hasattr(adapter, "grab_to"):
+                    frame = adapter.grab_to(index)
+                else:
+                    frame = adapter.get_frame(index / (adapter.fps or 24.0))
+            except Exception as e:
+                self._mutex.lock()
+                try:
+                    if session == self._session:
+                        self._active = False
+                finally:
+                    self._mutex.unlock()
+                self.failed.emit(f"decode error at frame {index}: {e}")
+                continue
+            self._mutex.lock()
+            try:
+                if session == self._session:
+                    # take() may have moved next_index past us while decoding.
+                    if self._next_index <= index:
+                        self._buffer.append((index, frame))
+                        self._next_index = index + self._stride
+                        frame = None
+                if frame is not None:
+                    _release(adapter, frame)
+            finally:
+                self._mutex.unlock()
+
+
+def _release(adapter, frame):
+    release = getattr(adapter, "release_frame", None)
+    if release is not None:
+        release(frame)
+
+
+__all__ = ["DecoderWorker"]
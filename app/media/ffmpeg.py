@@ -0,0 +1,259 @@
+"""Direct ffmpeg helpers for jobs MoviePy's readers handle poorly.
+
+MoviePy resolves audio through time-indexed lookups on a float64 buffer at the
+file's native rate. Analysis passes (waveform envelopes) only need a compact mono
+signal, so ffmpeg downmixes and resamples in C and streams float32 samples over
+one pipe instead.
+
+Likewise a thumbnail strip sampled through ``get_frame(t)`` re-spawns the decoder
+at every timestamp; `iter_thumbnail_frames` pulls the whole strip, already scaled,
+from a single ffmpeg process, and `iter_keyframes` does so decoding only the
+keyframes listed by `keyframe_times`. That scan reads the whole file, so callers
+go through `cached_keyframe_times`, which runs it once per file version.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import subprocess
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, Tuple
+
+import numpy as np
+
+try:
+    import imageio_ffmpeg  # type: ignore
+except ImportError:  # pragma: no cover
+    imageio_ffmpeg = None  # type: ignore
+
+_DURATION_RE = re.compile(r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)")
+
+# Per-path lock and number of callers using it, so concurrent requests for one
+# file share a single scan; an entry is dropped once its last caller is done.
+_keyframe_locks: dict[str, tuple[threading.Lock, int]] = {}
+_keyframe_locks_guard = threading.Lock()
+
+
+def ffmpeg_executable() -> str:
+    """Path of the ffmpeg binary MoviePy uses (bundled by imageio-ffmpeg), else PATH."""
+    if imageio_ffmpeg is not None:
+        try:
+            return imageio_ffmpeg.get_ffmpeg_exe()
+        except Exception:
+            pass
+    exe = shutil.which("ffmpeg")
+    if exe is None:
+        raise RuntimeError("ffmpeg not found")
+    return exe
+
+
+def decode_audio_mono(path: str | Path, sample_rate: int) -> np.ndarray:
+    """Decode the audio of ``path`` as mono float32 samples at ``sample_rate`` Hz.
+
+    Returns an empty array when the file has no audio stream.
+    Raises RuntimeError if ffmpeg fails.
+    """
+    cmd = [
+        ffmpeg_executable(),
+        "-v",
+        "error",
+        "-i",
+        str(path),
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        str(int(sample_rate)),
+        "-f",
+        "f32le",
+        "-",
+    ]
+    result = subprocess.run(cmd, capture_output=True)
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors="replace").strip()
+        if "does not contain any stream" in stderr:
+            return np.empty(0, dtype=np.float32)
+        raise RuntimeError(f"ffmpeg audio decode failed: {stderr}")
+    return np.frombuffer(result.stdout, dtype=np.float32)
+
+
+def probe_duration(path: str | Path) -> float:
+    """Container duration of ``path`` in seconds, read from ffmpeg's header probe.
+
+    Nothing is decoded, so this is far cheaper than opening a clip just to learn
+    its length. Raises RuntimeError if ffmpeg reports no duration.
+    """
+    # Without an output ffmpeg exits non-zero after printing the input summary.
+    result = subprocess.run(
+        [ffmpeg_executable(), "-hide_banner", "-i", str(path)],
+        capture_output=True,
+    )
+    stderr = result.stderr.decode(errors="replace")
+    match = _DURATION_RE.search(stderr)
+    if match is None:
+        raise RuntimeError(f"ffmpeg probe failed: {stderr.strip()}")
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def keyframe_times(path: str | Path) -> np.ndarray:
+    """Sorted presentation times (s) of the keyframes in the first video stream.
+
+    Read from packet flags by stream-copying into ffmpeg's ``framecrc`` muxer, so
+    nothing is decoded. Raises RuntimeError if ffmpeg fails.
+    """
+    cmd = [
+        ffmpeg_executable(),
+        "-v",
+        "error",
+        "-i",
+        str(path),
+        "-map",
+        "0:v:0",
+        "-c",
+        "copy",
+        "-f",
+        "framecrc",
+        "-",
+    ]
+    result = subprocess.run(cmd, capture_output=True)
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors="replace").strip()
+        raise RuntimeError(f"ffmpeg keyframe scan failed: {stderr}")
+    time_base = 0.0
+    pts: list[int] = []
+    for line in result.stdout.decode(errors="replace").splitlines():
+        if line.startswith("#tb 0:"):
+            num, den = line.split(":", 1)[1].strip().split("/")
+            time_base = int(num) / int(den)
+            continue
+        if not line or line.startswith("#"):
+            continue
+        # stream, dts, pts, duration, size, crc[, F=0x..]; the flags column is only
+        # written when they differ from "keyframe".
+        fields = [f.strip() for f in line.split(",")]
+        if len(fields) > 6 and not int(fields[6][2:], 16) & 1:
+            continue
+        pts.append(int(fields[2]))
+    return np.unique(np.asarray(pts, dtype=np.float64) * time_base)
+
+
+def cached_keyframe_times(path: str | Path) -> np.ndarray:
+    """`keyframe_times`, remembered per (path, mtime); the array is read-only.
+
+    The thumbnail strip and the preview's drag snapping both ask for a clip's
+    keyframes, usually at the same moment; the second caller waits for and reuses
+    the first scan.
+    """
+    path = str(path)
+    mtime = os.path.getmtime(path)
+    with _keyframe_locks_guard:
+        lock, users = _keyframe_locks.get(path, (None, 0))
+        lock = lock or threading.Lock()
+        _keyframe_locks[path] = (lock, users + 1)
+    try:
+        with lock:
+            return _keyframe_times_at(path, mtime)
+    finally:
+        with _keyframe_locks_guard:
+            users = _keyframe_locks[path][1] - 1
+            if users:
+                _keyframe_locks[path] = (lock, users)
+            else:
+                del _keyframe_locks[path]
+
+
+@lru_cache(maxsize=16)
+def _keyframe_times_at(path: str, mtime: float) -> np.ndarray:
+    # Keyed on mtime so a file rewritten in place is scanned again.
+    times = keyframe_times(path)
+    times.flags.writeable = False
+    return times
+
+
+def iter_thumbnail_frames(
+    path: str | Path, step: float, count: int, size: Tuple[int, int]
+) -> Iterator[np.ndarray]:
+    """Yield up to ``count`` RGB frames of ``path`` at 0, ``step``, 2*``step``... s.
+
+    Frames are scaled to ``size`` (width, height) by ffmpeg and read from one pipe.
+    Fewer frames are yielded if the stream ends early. Closing the generator stops
+    ffmpeg. Raises RuntimeError if ffmpeg fails before producing a frame.
+    """
+    # round=up: output frame k is the first decoded frame at or after k * step,
+    # like get_frame(k * step).
+    filters = f"fps=fps={1.0 / step!r}:round=up"
+    return _iter_scaled_frames(path, [], filters, count, size)
+
+
+def iter_keyframes(
+    path: str | Path, times, size: Tuple[int, int]
+) -> Iterator[np.ndarray]:
+    """Yield the keyframes of ``path`` at ``times`` (from `keyframe_times`), in order.
+
+    Only keyframes are decoded at all, so this costs one decode per GOP rather than
+    per frame. Same scaling, closing and error behaviour as `iter_thumbnail_frames`.
+    """
+    # Match within half a millisecond (well under any frame interval).
+    picks = "+".join(f"lt(abs(t-{float(t)!r})\\,0.0005)" for t in times)
+    return _iter_scaled_frames(
+        path, ["-skip_frame", "nokey"], f"select={picks}", len(times), size
+    )
+
+
+def _iter_scaled_frames(
+    path: str | Path, input_args: list, filters: str, count: int, size
+) -> Iterator[np.ndarray]:
+    width, height = size
+    cmd = [ffmpeg_executable(), "-v", "error", *input_args]
+    cmd += [
+        "-i",
+        str(path),
+        "-an",
+        "-sn",
+        "-vf",
+        f"{filters},scale={width}:{height}",
+        "-fps_mode",
+        "passthrough",
+        "-frames:v",
+        str(int(count)),
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "rgb24",
+        "-",
+    ]
+    frame_bytes = width * height * 3
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, stdin=subprocess.DEVNULL
+    )
+    produced = 0
+    try:
+        while produced < count:
+            data = proc.stdout.read(frame_bytes)
+            if len(data) < frame_bytes:
+                break
+            produced += 1
+            yield np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+    finally:
+        proc.kill()
+        _, stderr = proc.communicate()
+    if produced == 0:
+        raise RuntimeError(
+            f"ffmpeg thumbnail decode failed: {stderr.decode(errors='replace').strip()}"
+        )
+
+
+__all__ = [
+    "ffmpeg_executable",
+    "decode_audio_mono",
+    "probe_duration",
+    "keyframe_times",
+    "cached_keyframe_times",
+    "iter_thumbnail_frames",
+    "iter_keyframes",
+]
@@ -0,0 +1,27 @@
+"""Lazy MoviePy class lookup.
+
+Importing MoviePy pulls in imageio, proglog and (on MoviePy 2) IPython display
+helpers, close to a second on a cold start. Modules that only need the clip
+class once media is actually opened resolve it through this helper, so the
+cost is paid on first import/load instead of at application startup.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def video_file_clip_class():
+    """Return MoviePy's ``VideoFileClip`` (RuntimeError if MoviePy is missing)."""
+    try:
+        from moviepy import VideoFileClip
+    except ImportError:
+        try:
+            from moviepy.editor import VideoFileClip  # type: ignore
+        except ImportError as e:
+            raise RuntimeError(f"moviepy import failed: {e}") from e
+    return VideoFileClip
+
+
+__all__ = ["video_file_clip_class"]
@@ -15,15 +15,46 @@ VideoPlaybackController wraps a ClipAdapter (or raw MoviePy clip) and exposes:
     position() -> float
 Signals:
     frameReady(np.ndarray, float)   # frame array + timestamp seconds
-    positionChanged(float)          # updated during playback or seek
+    positionChanged(float)          # on seek/pause; during playback at most ~30 Hz
     stateChanged(str)               # 'stopped'|'playing'|'paused'
     clipLoaded(float)               # duration
 
 The controller does NOT scale/convert to QPixmap to stay decoupled from Qt GUI specifics.
 An optional VideoPreviewWidget listens to frameReady and converts to QPixmap.
 
-Threading: We keep a precise QTimer loop (interval derived from fps) similar to previous logic; we
-monitor wall clock elapsed to reduce drift. Future improvement: move to a dedicated worker thread.
+Frame ownership: playback frames are leased from the adapter's frame pool. A frameReady
+array stays valid until the next frameReady (the preview widget re-renders its last frame
+on resize); consumers that keep frames longer must copy them. The controller returns each
+pooled frame with ``release_frame`` once it is neither shown nor cached.
+
+Threading: Decoding during playback runs on a dedicated QThread (`DecoderWorker`) that keeps a
+small bounded buffer filled ahead of the playhead. A precise QTimer on the GUI thread only pops
+the newest due frame and emits it; which frame is due comes from the clock (wall or `set_clock`), never from
+counting ticks.
+
+Presentation pacing: the timer polls at the display refresh rate reported by the preview
+(``set_presentation_rate``; ``VideoPreviewWidget`` passes its screen's rate) or at twice the
+clip fps when no display rate is known. A tick emits only when the wall clock has reached the
+next frame, so each frame is shown on the first refresh after it is due instead of drifting
+against the display with a ``1000 / fps`` ms timer. Seeks while paused still decode synchronously so the requested frame is emitted
+before ``seek`` returns.
+
+Signal connections: the controller lives on the GUI thread and emits every signal from it, so
+GUI-side consumers connect with ``Qt.DirectConnection`` (plain call, no event posted per frame).
+The only cross-thread signal is ``DecoderWorker.failed``, connected with ``Qt.QueuedConnection``.
+Consumers living on another thread must connect queued themselves.
+
+Read-ahead while paused: once a paused seek has settled (``_READAHEAD_DELAY_MS``), the
+decoder thread fills the frames around the playhead (up to ``_READAHEAD_FRAMES`` either
+side) in one session. The next paused seek first moves those frames into the frame cache,
+so stepping or nudging the scrubber nearby never waits on MoviePy; it then ends the session
+(the decoder's session counter discards a frame still in flight).
+
+External clock:
+``set_clock(fn)`` makes playback follow another clock, typically the audio device:
+each tick shows the frame due at ``fn()`` seconds into the clip. While ``fn`` returns
+None (audio paused, ended or absent) the wall clock takes over from the last
+reading, so playback neither jumps nor stalls at the hand-over.
 
 Frame Skipping:
 To maintain real-time playback under UI load, the controller can skip frames. When
@@ -38,23 +69,40 @@ or debugging).
 
 from __future__ import annotations
 
-from typing import Optional, Union
+import atexit
+import itertools
+import os
+import weakref
+from typing import Callable, Optional, Union
+from collections import OrderedDict
 from dataclasses import dataclass
+from time import perf_counter
 
-from PySide6.QtCore import QObject, Signal, QTimer, Qt
-from PySide6.QtGui import QPixmap
+import numpy as np
+
+from PySide6.QtCore import QObject, Signal, QTimer, Qt, QThread
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache
 from PySide6.QtWidgets import QLabel, QSizePolicy
 from PySide6.QtCore import QSize
 
-try:  # MoviePy import compat
-    from moviepy import VideoFileClip
-except ImportError:  # pragma: no cover
-    try:
-        from moviepy.editor import VideoFileClip  # type: ignore
-    except ImportError:  # pragma: no cover
-        VideoFileClip = None  # type: ignore
-
 from .clip_adapter import ClipAdapter
+from .decoder import DecoderWorker
+from .moviepy_loader import video_file_clip_class
+
+# Recently seeked frames kept decoded so scrubbing back and forth skips the decoder.
+# Bounded by count and by bytes (64 small frames, ~32 at 1080p, ~8 at 4K).
+_FRAME_CACHE_SIZE = 64
+_FRAME_CACHE_BYTES = 192 * 1024 * 1024
+# Minimum spacing of positionChanged during playback (~30 Hz; sliders/labels cannot
+# show more). Seeks and pauses always emit.
+_POSITION_EMIT_INTERVAL = 0.033
+# Frames decoded either side of a paused playhead, and how long a paused seek must
+# settle first. Read-ahead never takes more than half the frame cache's byte budget.
+_READAHEAD_FRAMES = 16
+_READAHEAD_DELAY_MS = 100
+# Preview widgets share QPixmapCache (budget set by the application); in-memory
+# clips, which have no file to name them, get a unique tag per load instead.
+_anonymous_sources = itertools.count(1)
 
 
 @dataclass
@@ -66,6 +114,26 @@ class PlaybackState:
     fps: float = 0.0
 
 
+# Decoder threads still running, keyed by id(thread). Controllers only join theirs
+# on ``destroyed``, which never fires for ones alive at interpreter shutdown.
+_live_decoders: dict[int, tuple[DecoderWorker, QThread]] = {}
+
+
+def _stop_decoder_thread(worker: DecoderWorker, thread: QThread) -> None:
+    if _live_decoders.pop(id(thread), None) is None:
+        return
+    worker.shutdown()
+    thread.quit()
+    thread.wait()
+
+
+@atexit.register
+def _join_decoder_threads() -> None:
+    # Registered after PySide's own exit hook, so it runs before wrappers are deleted.
+    for worker, thread in list(_live_decoders.values()):
+        _stop_decoder_thread(worker, thread)
+
+
 class VideoPlaybackController(QObject):
     frameReady = Signal(object, float)  # (numpy array, t seconds)
     positionChanged = Signal(float)
@@ -89,10 +157,37 @@ class VideoPlaybackController(QObject):
             pass
         self._timer.timeout.connect(self._tick)
         self._play_start_time: Optional[float] = None
+        # Master clock (seconds into the clip, or None to use the wall clock).
+        self._clock: Optional[Callable[[], Optional[float]]] = None
         # When enabled we may skip frames to keep real-time pace.
         self._frame_skip_enabled = frame_skip
         # Legacy threshold guard used for coarse drift correction if frame_skip disabled.
         self._sync_threshold_frames = sync_threshold_frames
+        # Background decoder; thread is created on first play() and lives until
+        # the controller is destroyed.
+        self._decoder: Optional[DecoderWorker] = None
+        self._decoder_thread: Optional[QThread] = None
+        # Timing derived from fps, refreshed by _applyTiming() on load()/play() so
+        # the per-tick path avoids repeated fallbacks and divisions.
+        self._fps = 24.0
+        self._fps_inv = 1.0 / 24.0
+        self._interval_ms = int(1000 / 24.0)
+        self._present_hz = 0.0  # display refresh rate, 0 when unknown
+        self._last_position_emit = 0.0  # perf_counter() of last throttled emit
+        self._last_index = 0  # clamp bound for seeks (total_frames - 1)
+        self._stride = 1  # decoder frame step, see _applyTiming
+        # frame index -> decoded array, most recently used last
+        self._frame_cache: OrderedDict[int, object] = OrderedDict()
+        self._frame_cache_bytes = 0
+        # Frame on screen from playback (index, array), None once a seek replaced it;
+        # cached on pause so stepping away from and back to it needs no decode.
+        self._shown: Optional[tuple[int, object]] = None
+        self._emitted_index: Optional[int] = None  # frame last sent via frameReady
+        self._readahead_timer = QTimer(self)
+        self._readahead_timer.setSingleShot(True)
+        self._readahead_timer.setInterval(_READAHEAD_DELAY_MS)
+        self._readahead_timer.timeout.connect(self._startReadAhead)
+        self._readahead_active = False  # decoder is running a read-ahead session
 
     # Configuration API
     def set_frame_skipping(self, enabled: bool):
@@ -104,21 +199,49 @@ class VideoPlaybackController(QObject):
         """
         self._frame_skip_enabled = enabled
 
+    def set_clock(self, clock: Optional[Callable[[], Optional[float]]]):
+        """Follow ``clock()`` (seconds into the clip) instead of the wall clock.
+
+        A bound method is held weakly: its owner usually owns this controller, and
+        a reference cycle would leave both to the garbage collector.
+        """
+        if hasattr(clock, "__self__"):
+            ref = weakref.WeakMethod(clock)
+
+            def weak_clock():
+                method = ref()
+                return method() if method is not None else None
+
+            clock = weak_clock
+        self._clock = clock
+
+    def set_presentation_rate(self, hz: float):
+        """Poll for due frames at the display refresh rate ``hz`` (0 = unknown)."""
+        self._present_hz = max(0.0, float(hz or 0.0))
+        self._applyTiming()
+        if self._timer.isActive():
+            self._timer.setInterval(self._interval_ms)
+
     # Public API
     def load(self, source: Union[str, ClipAdapter, "VideoFileClip"]):
         if isinstance(source, str):
-            if VideoFileClip is None:
-                raise RuntimeError("MoviePy not available for loading path")
-            clip = VideoFileClip(source)
+            clip = video_file_clip_class()(source)
             adapter = ClipAdapter.from_clip(clip)
         elif isinstance(source, ClipAdapter):
             adapter = source
         else:
             adapter = ClipAdapter.from_clip(source)
+        self._readahead_timer.stop()
+        self._readahead_active = False
+        if self._decoder is not None:
+            self._decoder.stop()
+        self._dropFrames()
         self._clip_adapter = adapter
         fps = adapter.fps or 24.0
         duration = adapter.duration
-        total_frames = int(round(fps * duration)) if duration > 0 else 0
+        total_frames = adapter.frame_count if adapter.fps else 0
+        if total_frames <= 0 and duration > 0:
+            total_frames = int(round(fps * duration))
         self._state = PlaybackState(
             playing=False,
             current_frame=0,
@@ -126,6 +249,7 @@ class VideoPlaybackController(QObject):
             duration=duration,
             fps=fps,
         )
+        self._applyTiming()
         self.clipLoaded.emit(duration)
         self.stateChanged.emit("stopped")
         # Emit first frame lazily on demand (seek(0))
@@ -136,21 +260,36 @@ class VideoPlaybackController(QObject):
             return
         if self._state.current_frame >= self._state.total_frames - 1:
             self._state.current_frame = 0
-        interval_ms = int(1000 / (self._state.fps or 24.0))
+        self._applyTiming()
+        self._readahead_timer.stop()
+        self._collectReadAhead()
         if not self._timer.isActive():
-            from time import perf_counter
-
-            self._play_start_time = perf_counter() - (
-                self._state.current_frame / (self._state.fps or 24.0)
+            self._restartClock()
+            self._ensureDecoder().start(
+                self._clip_adapter,
+                self._state.current_frame + 1,
+                self._state.total_frames,
+                capacity=self._prefetchFrames(),
+                stride=self._stride,
             )
-            self._timer.start(interval_ms)
+            self._timer.start(self._interval_ms)
         self._state.playing = True
         self.stateChanged.emit("playing")
 
     def pause(self):
         if self._timer.isActive():
             self._timer.stop()
+            # Ticks throttle positionChanged; report the exact frame we stopped on.
+            self.positionChanged.emit(self.position())
+        if self._decoder is not None:
+            self._decoder.stop()
+        if self._shown is not None:
+            # The frame on screen replaces any older cached copy of it.
+            self._uncacheFrame(self._shown[0])
+            self._cacheFrame(*self._shown)
+            self._shown = None
         self._state.playing = False
+        self._readahead_timer.start()
         self.stateChanged.emit("paused")
 
     def stop(self):
@@ -158,66 +297,300 @@ class VideoPlaybackController(QObject):
         self.seek(0.0)
         self.stateChanged.emit("stopped")
 
+    def unload(self):
+        """Stop playback, join the decoder thread and drop the clip and its frames.
+
+        Nothing reads the previously loaded clip afterwards, so its owner may
+        close it.
+        """
+        self._timer.stop()
+        self._readahead_timer.stop()
+        self._readahead_active = False
+        if self._decoder is not None:
+            _stop_decoder_thread(self._decoder, self._decoder_thread)
+            self._decoder = None
+            self._decoder_thread = None
+        self._dropFrames()
+        self._clip_adapter = None
+        self._state = PlaybackState()
+        self.stateChanged.emit("stopped")
+
     def seek(self, t: float, emit_frame: bool = True):
         if not self._clip_adapter:
             return
-        fps = self._state.fps or 24.0
-        frame_index = int(max(0, min(int(t * fps), self._state.total_frames - 1)))
+        self._seekIndex(int(t * self._fps), emit_frame)
+
+    def stepFrame(self, delta: int):
+        """Pause and move ``delta`` frames from the current one.
+
+        A +1 step reads the next frame from the adapter's open decoder pipe and
+        revisited frames come from the frame cache, so stepping never re-decodes
+        from a keyframe unless it moves backwards past cached frames.
+        """
+        if not self._clip_adapter:
+            return
+        if self._state.playing:
+            self.pause()
+        self._seekIndex(self._state.current_frame + delta, True)
+
+    def _seekIndex(self, frame_index: int, emit_frame: bool):
+        if frame_index < 0:
+            frame_index = 0
+        elif frame_index > self._last_index:
+            frame_index = self._last_index
+        playing = self._timer.isActive()
+        if not playing and emit_frame and frame_index == self._emitted_index:
+            # Scrub drags report many positions inside one frame; it is on screen.
+            self.positionChanged.emit(self.position())
+            return
+        if not playing:
+            self._collectReadAhead()
         self._state.current_frame = frame_index
         if emit_frame:
             self._emit_current_frame()
+        if not playing:
+            self._readahead_timer.start()
+        else:
+            # Playing: continue from the new position, reusing prefetched frames
+            # when the target is inside the lookahead window.
+            self._restartClock()
+            if not self._decoder.retain_from(frame_index + 1):
+                self._decoder.start(
+                    self._clip_adapter,
+                    frame_index + 1,
+                    self._state.total_frames,
+                    stride=self._stride,
+                )
         self.positionChanged.emit(self.position())
 
     def position(self) -> float:
         if not self._clip_adapter or self._state.total_frames <= 0:
             return 0.0
-        return self._state.current_frame / (self._state.fps or 24.0)
+        return self._state.current_frame * self._fps_inv
+
+    def clip(self):
+        """The loaded MoviePy clip, or None."""
+        adapter = self._clip_adapter
+        return adapter.clip if adapter is not None else None
+
+    def fps(self) -> float:
+        """Frame rate used for the loaded clip; 0 while nothing is loaded."""
+        return self._state.fps
 
     # Internal
+    def _applyTiming(self):
+        fps = self._state.fps or 24.0
+        self._fps = fps
+        self._fps_inv = 1.0 / fps
+        # Poll once per display refresh, or twice per frame when the display rate
+        # is unknown (or slower than the clip), so a due frame is never a full tick late.
+        poll_hz = self._present_hz if self._present_hz > fps else 2.0 * fps
+        self._interval_ms = max(1, int(1000 / poll_hz))
+        self._last_index = max(0, self._state.total_frames - 1)
+        # A display slower than the clip shows at most every stride-th frame; the
+        # decoder drains the others from the pipe without materializing them.
+        if self._frame_skip_enabled and 0 < self._present_hz < fps:
+            self._stride = max(1, int(fps // self._present_hz))
+        else:
+            self._stride = 1
+
+    def _restartClock(self):
+        self._play_start_time = perf_counter() - (
+            self._state.current_frame * self._fps_inv
+        )
+
+    def _prefetchFrames(self) -> int:
+        # ~250ms of lookahead (in decoded frames), never fewer than 4 frames.
+        return max(4, int(self._fps * 0.25 / self._stride))
+
+    def _ensureDecoder(self) -> DecoderWorker:
+        if self._decoder is None:
+            worker = DecoderWorker()
+            thread = QThread()
+            worker.moveToThread(thread)
+            thread.started.connect(worker.run)
+            worker.failed.connect(self._onDecodeFailed, Qt.QueuedConnection)
+            self._decoder = worker
+            self._decoder_thread = thread
+            thread.start()
+
+            # Join the decoder thread when the controller goes away; destroying a
+            # running QThread aborts the process.
+            def _shutdown(*_):
+                _stop_decoder_thread(worker, thread)
+
+            _live_decoders[id(thread)] = (worker, thread)
+            self.destroyed.connect(_shutdown)
+        return self._decoder
+
+    def _onDecodeFailed(self, reason: str):
+        if self._timer.isActive():
+            self.pause()
+
+    def _startReadAhead(self):
+        adapter = self._clip_adapter
+        if adapter is None or self._timer.isActive():
+            return
+        current = self._state.current_frame
+        radius = _READAHEAD_FRAMES
+        shown = self._frame_cache.get(current)
+        nbytes = getattr(shown, "nbytes", 0)
+        if nbytes:
+            radius = min(radius, _FRAME_CACHE_BYTES // (4 * nbytes))
+        lo = max(0, current - radius)
+        hi = min(self._state.total_frames, current + radius + 1)
+        cache = self._frame_cache
+        if all(i in cache for i in range(lo, current)):
+            # Only the forward side is missing: continue the adapter's open pipe
+            # instead of re-positioning the decoder behind the playhead.
+            lo = current + 1
+        if lo >= hi or all(i in cache for i in range(lo, hi)):
+            return
+        self._ensureDecoder().start(adapter, lo, hi, capacity=hi - lo)
+        self._readahead_active = True
+
+    def _collectReadAhead(self):
+        # Keep what the read-ahead session decoded so far, then end it.
+        if not self._readahead_active:
+            return
+        self._readahead_active = False
+        for index, array in self._decoder.drain():
+            self._cacheFrame(index, array)
+        self._decoder.stop()
+
     def _emit_current_frame(self):
-        if not self._clip_adapter:
+        adapter = self._clip_adapter
+        if not adapter:
             return
         t = self.position()
-        array = self._clip_adapter.get_frame(t)
+        index = self._state.current_frame
+        array = self._frame_cache.get(index)
+        if array is None:
+            if hasattr(adapter, "seek"):
+                array = adapter.seek(t)
+            else:
+                array = adapter.get_frame(t)
+            if array is not None:
+                self._cacheFrame(index, array)
+        else:
+            self._frame_cache.move_to_end(index)
+        self._emitted_index = index
         self.frameReady.emit(array, t)
+        if self._shown is not None:
+            # A seek during playback replaced the frame playback last showed.
+            self._releaseFrame(self._shown[1])
+            self._shown = None
+
+    def _cacheFrame(self, index: int, array):
+        """Cache ``array`` for ``index``; the cache takes over its pool lease."""
+        cached = self._frame_cache.get(index)
+        if cached is not None:
+            self._frame_cache.move_to_end(index)
+            if cached is not array:
+                self._releaseFrame(array)
+            return
+        self._frame_cache[index] = array
+        self._frame_cache_bytes += getattr(array, "nbytes", 0)
+        while len(self._frame_cache) > 1 and (
+            len(self._frame_cache) > _FRAME_CACHE_SIZE
+            or self._frame_cache_bytes > _FRAME_CACHE_BYTES
+        ):
+            oldest = next(iter(self._frame_cache))
+            if oldest == self._emitted_index:
+                # Still on screen: the preview may re-render it, keep it leased.
+                self._frame_cache.move_to_end(oldest)
+                continue
+            self._uncacheFrame(oldest)
+
+    def _uncacheFrame(self, index: int):
+        evicted = self._frame_cache.pop(index, None)
+        if evicted is not None:
+            self._frame_cache_bytes -= getattr(evicted, "nbytes", 0)
+            self._releaseFrame(evicted)
+
+    def _releaseFrame(self, array):
+        release = getattr(self._clip_adapter, "release_frame", None)
+        if release is not None:
+            release(array)
+
+    def _dropFrames(self):
+        # Hand every held frame back before the adapter changes or goes away.
+        for array in self._frame_cache.values():
+            self._releaseFrame(array)
+        if self._shown is not None:
+            self._releaseFrame(self._shown[1])
+        self._frame_cache.clear()
+        self._frame_cache_bytes = 0
+        self._shown = None
+        self._emitted_index = None
 
     def _tick(self):
-        if not self._clip_adapter:
+        if not self._clip_adapter or self._decoder is None:
             self._timer.stop()
             return
-        fps = self._state.fps or 24.0
+        state = self._state
         # Derive target frame using wall clock to keep pace; optionally skip frames.
-        try:
-            from time import perf_counter
-
-            target_index = self._state.current_frame + 1  # default linear advance
-            if self._play_start_time is not None:
-                elapsed = perf_counter() - self._play_start_time
-                desired = int(elapsed * fps)
-                if self._frame_skip_enabled:
-                    # Jump directly to desired frame if ahead of linear progression.
-                    if desired > self._state.current_frame:
-                        target_index = desired
-                else:
-                    # Only coarse resync if far behind.
-                    if (
-                        desired - self._state.current_frame
-                        > self._sync_threshold_frames
-                    ):
-                        target_index = desired
-            if target_index >= self._state.total_frames:
-                self.stop()
-                return
-            self._state.current_frame = target_index
-        except Exception:
-            # Fallback linear advance if timing fails.
-            next_index = self._state.current_frame + 1
-            if next_index >= self._state.total_frames:
-                self.stop()
+        current = state.current_frame
+        target_index = current + 1  # default linear advance
+        now = perf_counter()
+        if self._clock is not None:
+            master = self._clock()
+            if master is not None:
+                # Re-anchor the wall clock so it continues from here if the master lapses.
+                self._play_start_time = now - master
+        if self._play_start_time is not None:
+            desired = int((now - self._play_start_time) * self._fps)
+            if desired <= current:
+                # The timer polls faster than fps; the next frame is not due yet.
                 return
-            self._state.current_frame = next_index
-        self._emit_current_frame()
-        self.positionChanged.emit(self.position())
+            if self._frame_skip_enabled:
+                # Jump directly to the desired frame.
+                target_index = desired
+            else:
+                # Only coarse resync if far behind.
+                if desired - current > self._sync_threshold_frames:
+                    target_index = desired
+        if target_index >= state.total_frames:
+            self.stop()
+            return
+        ready = self._decoder.take(target_index)
+        if ready is None:
+            # Decoder has nothing due yet; keep showing the current frame.
+            return
+        state.current_frame, array = ready
+        previous = self._shown
+        self._shown = ready
+        self._emitted_index = state.current_frame
+        t = state.current_frame * self._fps_inv
+        self.frameReady.emit(array, t)
+        if previous is not None:
+            # Consumers were handed the new frame; the old one is off screen.
+            self._releaseFrame(previous[1])
+        if now - self._last_position_emit >= _POSITION_EMIT_INTERVAL:
+            self._last_position_emit = now
+            self.positionChanged.emit(t)
+
+
+def _scale_plan(
+    w: int, h: int, target_w: int, target_h: int, decimate: bool
+) -> tuple[int, int, int]:
+    """Aspect-fit ``w x h`` into the target; returns ``(new_w, new_h, step)``.
+
+    With ``decimate`` (fast mode), ``step`` is the integer stride that pre-shrinks
+    a frame at least 2x the output before Qt scales the small remainder (a numpy
+    view, copied at 1/step^2 size). Smooth mode keeps the full source (step 1).
+    """
+    if w <= 0 or h <= 0:
+        return target_w, target_h, 1
+    # Integer aspect fit: the smaller cross product picks the limiting side, which
+    # then divides back out exactly (no float division, no branch on the ratio).
+    fit = min(target_w * h, target_h * w)
+    new_w = max(1, fit // h)
+    new_h = max(1, fit // w)
+    step = 1
+    if decimate:
+        step = max(1, min(w // max(1, new_w), h // max(1, new_h)))
+    return new_w, new_h, step
 
 
 class VideoPreviewWidget(QLabel):
@@ -227,10 +600,24 @@ class VideoPreviewWidget(QLabel):
         super().__init__(parent)
         self.setAlignment(Qt.AlignCenter)
         self.setStyleSheet("background:#222;color:#fff;font-size:24px;")
-        controller.frameReady.connect(self._onFrame)
+        # Same-thread controller (see module notes): dispatch frames directly.
+        controller.frameReady.connect(self._onFrame, Qt.DirectConnection)
+        controller.clipLoaded.connect(self._onClipLoaded, Qt.DirectConnection)
+        self._controller = controller
         # Cache last raw frame so we can rescale on widget resize without waiting
         # for the next decoded frame.
         self._last_frame = None
+        # Scaled pixmaps for recently shown frames live in QPixmapCache under
+        # "<source>#<frame>@<size>:<mode>": scrubbing back to a frame, or re-selecting
+        # a clip, at the same widget size reuses the pixmap instead of rescaling.
+        self._source_tag: Optional[str] = None
+        self._last_index: Optional[int] = None
+        # Reused contiguous buffer for frames QImage cannot alias directly
+        # (decimated/alpha-stripped views, non-uint8). Reallocated on shape change.
+        self._staging = None
+        # (new_w, new_h, decimation step) for the geometry key next to it.
+        self._scale_geometry: Optional[tuple] = None
+        self._scale_plan = (0, 0, 1)
         # Scaling mode: 'smooth' uses Qt.SmoothTransformation, 'fast' uses Qt.FastTransformation.
         self._scaling_mode = "fast"
         # --- Scaling / size policy notes ---
@@ -257,51 +644,109 @@ class VideoPreviewWidget(QLabel):
         if mode in ("smooth", "fast"):
             self._scaling_mode = mode
 
+    def _onClipLoaded(self, *_):
+        clip = self._controller.clip()
+        path = getattr(clip, "filename", None)
+        try:
+            # The decoded size is part of the tag: the same file may be opened
+            # at a capped preview resolution or at full size.
+            w, h = clip.size
+            mtime = os.path.getmtime(path)
+            self._source_tag = f"{os.path.abspath(path)}@{mtime}:{w}x{h}"
+        except (TypeError, ValueError, AttributeError, OSError):
+            self._source_tag = f"clip{next(_anonymous_sources)}"
+        self._last_index = None
+
     # --- Rendering helpers ---
     def _renderFrame(self):
         """Scale and display the cached frame to current widget size preserving aspect."""
         frame = self._last_frame
         if frame is None:
             return
+        target_w = self.width()
+        target_h = self.height()
+        if target_w <= 0 or target_h <= 0:
+            return
+        key = None
+        if self._source_tag is not None and self._last_index is not None:
+            key = (
+                f"{self._source_tag}#{self._last_index}"
+                f"@{target_w}x{target_h}:{self._scaling_mode}"
+            )
+            cached = QPixmapCache.find(key)
+        else:
+            cached = None
+        if cached is not None:
+            self.setPixmap(cached)
+            self.setText("")
+            return
         try:
-            import numpy as np
-            from PySide6.QtGui import QImage
-
-            if frame.ndim == 2:  # grayscale -> expand to RGB for consistency
-                frame = np.stack([frame] * 3, axis=-1)
+            # Grayscale stays single channel (Format_Grayscale8), no RGB expansion.
+            gray = frame.ndim == 2
+            if not gray and frame.shape[2] == 4:  # drop alpha (view; staged below)
+                frame = frame[:, :, :3]
             h, w = frame.shape[0], frame.shape[1]
-            target_w = self.width()
-            target_h = self.height()
-            if target_w <= 0 or target_h <= 0:
-                return
-            aspect = w / h if h else 1.0
-            if target_w / target_h > aspect:
-                new_h = target_h
-                new_w = int(new_h * aspect)
-            else:
-                new_w = target_w
-                new_h = int(new_w / aspect) if aspect else target_h
-            # Construct QImage directly from numpy buffer (assumed uint8 RGB)
-            # Each row is w * 3 bytes.
-            bytes_per_line = w * 3
-            qimg = QImage(frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+            # Output geometry only changes with widget/frame size or mode, so it is
+            # computed once per change instead of per frame.
+            geometry = (w, h, target_w, target_h, self._scaling_mode)
+            if geometry != self._scale_geometry:
+                self._scale_geometry = geometry
+                self._scale_plan = _scale_plan(
+                    w, h, target_w, target_h, self._scaling_mode == "fast"
+                )
+            new_w, new_h, step = self._scale_plan
+            if step >= 2:
+                frame = frame[::step, ::step]
+                h, w = frame.shape[0], frame.shape[1]
+            # QImage aliases the buffer, so it must be one contiguous uint8 block
+            # (strided or alpha-stripped views are not). Otherwise copy into the
+            # staging buffer instead of allocating a new array per frame.
+            if frame.dtype != np.uint8 or not frame.flags["C_CONTIGUOUS"]:
+                frame = self._stage(frame)
+            # Construct QImage directly from the numpy buffer (no codec round-trip).
+            # `frame` stays referenced until the scaled copy below is made.
+            bytes_per_line = frame.strides[0]
+            fmt = (
+                QImage.Format.Format_Grayscale8
+                if gray
+                else QImage.Format.Format_RGB888
+            )
+            qimg = QImage(frame.data, w, h, bytes_per_line, fmt)
             transform_flag = (
                 Qt.SmoothTransformation
                 if self._scaling_mode == "smooth"
                 else Qt.FastTransformation
             )
             scaled = qimg.scaled(new_w, new_h, Qt.KeepAspectRatio, transform_flag)
-            pix = QPixmap.fromImage(scaled)
+            if scaled.size() == qimg.size():
+                # A no-op scale hands back qimg itself, still aliasing `frame`.
+                scaled = qimg.copy()
+            # Upload in the decoded format: converting to the pixmap-native RGB32
+            # here costs a full pass per frame, while the blit converts for free.
+            pix = QPixmap.fromImage(scaled, Qt.NoFormatConversion)
+            if key is not None:
+                QPixmapCache.insert(key, pix)
             self.setPixmap(pix)
             self.setText("")
         except Exception as e:  # pragma: no cover
             self.setText(f"Frame err: {e}")
 
+    def _stage(self, frame):
+        shape = frame.shape
+        if self._staging is None or self._staging.shape != shape:
+            self._staging = np.empty(shape, dtype=np.uint8)
+        # The QImage built on this buffer is consumed by scaled() before the next
+        # render, so a single buffer is never overwritten while still referenced.
+        np.copyto(self._staging, frame, casting="unsafe")
+        return self._staging
+
     def _onFrame(self, frame, t: float):  # frame is numpy array
         if frame is None:
             return
         # Cache and render
         self._last_frame = frame
+        fps = self._controller.fps()
+        self._last_index = int(round(t * fps)) if fps else None
         self._renderFrame()
 
     # --- Resize behavior ---
@@ -310,5 +755,12 @@ class VideoPreviewWidget(QLabel):
         self._renderFrame()
         super().resizeEvent(event)
 
+    def showEvent(self, event):  # noqa: D401 - Qt override
+        # Pace playback to the refresh rate of the screen we are shown on.
+        screen = self.screen()
+        if screen is not None:
+            self._controller.set_presentation_rate(screen.refreshRate())
+        super().showEvent(event)
+
 
 __all__ = ["VideoPlaybackController", "VideoPreviewWidget"]
@@ -1,18 +1,31 @@
-"""Caption generation service scaffold using Whisper (future implementation).
-
-This module defines a data structure for caption entries and a stub function for
-caption generation. Real implementation will:
- - Load Whisper model lazily (tiny/base by default configurable)
- - Chunk audio for long clips
- - Perform language detection / translation optionally
- - Return time-aligned caption segments
+"""Caption generation service using faster-whisper (optional dependency).
+
+faster-whisper (CTranslate2) runs Whisper with int8 weights, roughly halving
+memory traffic versus fp16 openai-whisper on the same hardware:
+ - CPU: ``compute_type="int8"``; CUDA: ``"int8_float16"``
+ - Models are loaded lazily and reused per size (the device is chosen on first load)
+ - Audio is decoded once by ffmpeg to 16 kHz mono float32 (Whisper's native
+   input), and silence is skipped by the built-in VAD filter before decoding
+
+Future work: language selection / translation, progress reporting.
 """
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional
 
+from ..media.ffmpeg import decode_audio_mono
+
+try:  # optional: captioning is unavailable without it
+    import faster_whisper
+except ImportError:  # pragma: no cover
+    faster_whisper = None  # type: ignore
+
+_WHISPER_SAMPLE_RATE = 16000
+
 
 @dataclass
 class CaptionSegment:
@@ -28,8 +41,28 @@ class CaptionResult:
     language: str | None = None
 
 
+def _cuda_available() -> bool:
+    try:
+        import ctranslate2
+
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=2)
+def _load_model(model_size: str):
+    if _cuda_available():
+        device, compute_type = "cuda", "int8_float16"
+    else:
+        device, compute_type = "cpu", "int8"
+    return faster_whisper.WhisperModel(
+        model_size, device=device, compute_type=compute_type
+    )
+
+
 def generate_captions(path: str, model_size: str = "base") -> CaptionResult:
-    """Stub caption generation.
+    """Transcribe the audio of ``path`` into time-aligned caption segments.
 
     Parameters
     ----------
@@ -38,10 +71,28 @@ def generate_captions(path: str, model_size: str = "base") -> CaptionResult:
 
     Returns
     -------
-    CaptionResult with empty segments (placeholder).
+    CaptionResult with one segment per recognized phrase. Raises RuntimeError
+    if faster-whisper is not installed.
     """
-    # Future: integrate openai/whisper or faster-whisper library.
-    return CaptionResult(segments=[], language=None)
+    if faster_whisper is None:
+        raise RuntimeError("faster-whisper not available")
+    audio = decode_audio_mono(path, _WHISPER_SAMPLE_RATE)
+    if audio.size == 0:
+        return CaptionResult(segments=[], language=None)
+    model = _load_model(model_size)
+    segments, info = model.transcribe(audio, beam_size=1, vad_filter=True)
+    return CaptionResult(
+        segments=[
+            CaptionSegment(
+                start=float(seg.start),
+                end=float(seg.end),
+                text=seg.text.strip(),
+                confidence=math.exp(seg.avg_logprob),
+            )
+            for seg in segments
+        ],
+        language=info.language,
+    )
 
 
 __all__ = ["CaptionSegment", "CaptionResult", "generate_captions"]
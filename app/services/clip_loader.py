@@ -0,0 +1,78 @@
+"""Background opening of MoviePy clips.
+
+Constructing a ``VideoFileClip`` probes the file with ffmpeg, spawns its reader and
+(on first use) imports MoviePy itself, which froze the window for hundreds of ms on
+large files. `ClipLoader` does that on Qt's global thread pool (`start_media_job`)
+and hands the clip back through a queued signal.
+
+Preview clips are decoded with a short side of at most `_PREVIEW_MAX_SIDE`
+pixels: for larger sources ffmpeg scales frames before they cross the pipe, so a
+4K file moves a quarter of the bytes per frame through the decoder, frame cache
+and preview. Capping the short side keeps 1080x1920 portrait sources (the usual
+input) at full size. The size comes from a header-only probe, so every clip is
+opened exactly once.
+
+Like the media generation workers, loads carry a generation id so the caller can
+tell which request a result answers; ``cancel()`` (used when draining the pool at
+exit) drops the result and closes the clip.
+"""
+
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, Signal
+
+from ..media.moviepy_loader import video_file_clip_class
+
+_PREVIEW_MAX_SIDE = 1080
+
+
+def _preview_resolution(path: str):
+    """``target_resolution`` capping the short side of ``path``, or None if small enough."""
+    from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+    infos = ffmpeg_parse_infos(path)
+    w, h = infos.get("video_size") or (0, 0)
+    if abs(infos.get("video_rotation", 0)) in (90, 270):
+        # ffmpeg applies the rotation while decoding.
+        w, h = h, w
+    if min(w, h) <= _PREVIEW_MAX_SIDE:
+        return None
+    return (_PREVIEW_MAX_SIDE, None) if w < h else (None, _PREVIEW_MAX_SIDE)
+
+
+class ClipLoader(QObject):
+    loaded = Signal(int, str, object)  # generation_id, path, clip
+    failed = Signal(int, str, str)  # generation_id, path, reason
+
+    def __init__(self, generation_id: int, path: str):
+        super().__init__()
+        self._gen = generation_id
+        self._path = path
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Ask the job to drop its result; a clip opened meanwhile is closed."""
+        self._cancelled = True
+
+    def run(self):  # executed on a pool thread
+        try:
+            # Video only: QMediaPlayer plays the soundtrack and the waveform decodes
+            # it with ffmpeg, so a MoviePy audio reader would be a second, unused
+            # ffmpeg process and sample buffer per clip.
+            cls = video_file_clip_class()
+            clip = cls(
+                self._path,
+                audio=False,
+                target_resolution=_preview_resolution(self._path),
+            )
+        except Exception as e:
+            if not self._cancelled:
+                self.failed.emit(self._gen, self._path, str(e))
+            return
+        if self._cancelled:
+            clip.close()
+            return
+        self.loaded.emit(self._gen, self._path, clip)
+
+
+__all__ = ["ClipLoader"]
@@ -0,0 +1,77 @@
+"""Background ffmpeg probes for clips.
+
+A multi-file import lists every file at once; `ClipProbe` then reads each
+file's duration with a header-only ffmpeg probe (`probe_duration`) so the bin can
+show it without opening a clip. `KeyframeProbe` lists a clip's keyframes
+(`cached_keyframe_times`, packet flags only, nothing decoded) so drag previews can
+land on frames that decode without walking a GOP; the scan is shared with the
+thumbnail strip, which needs the same list. Probes run on their own pool capped
+at `_PROBE_THREADS`, so a large import neither saturates every core nor queues
+ahead of thumbnail and waveform jobs on the global pool.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from PySide6.QtCore import QObject, QThreadPool, Signal
+
+from ..media.ffmpeg import cached_keyframe_times, probe_duration
+from .media_generation import start_media_job
+
+_PROBE_THREADS = 4
+
+
+@lru_cache(maxsize=1)
+def _probe_pool() -> QThreadPool:
+    pool = QThreadPool()
+    pool.setMaxThreadCount(_PROBE_THREADS)
+    return pool
+
+
+class ClipProbe(QObject):
+    probed = Signal(str, float)  # path, duration (s)
+
+    def __init__(self, path: str):
+        super().__init__()
+        self._path = path
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def run(self):  # executed on a probe pool thread
+        try:
+            duration = probe_duration(self._path)
+        except Exception:
+            return  # the bin entry simply keeps its plain name
+        if not self._cancelled:
+            self.probed.emit(self._path, duration)
+
+
+class KeyframeProbe(QObject):
+    probed = Signal(str, object)  # path, sorted keyframe times (s, ndarray)
+
+    def __init__(self, path: str):
+        super().__init__()
+        self._path = path
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def run(self):  # executed on a probe pool thread
+        try:
+            times = cached_keyframe_times(self._path)
+        except Exception:
+            return  # previews then always seek exactly
+        if not self._cancelled:
+            self.probed.emit(self._path, times)
+
+
+def start_probe(probe: ClipProbe | KeyframeProbe) -> None:
+    """Run ``probe`` on the bounded probe pool."""
+    start_media_job(probe, _probe_pool())
+
+
+__all__ = ["ClipProbe", "KeyframeProbe", "start_probe"]
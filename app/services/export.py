@@ -1,19 +1,35 @@
 """Export pipeline scaffold.
 
+Single-clip trims without effects are exported with ffmpeg stream copy
+(`fast_trim`): no decode or re-encode, so cost is I/O bound. Stream copy cuts on
+keyframes, so the start may land slightly before ``in_t``. Clips carrying effects
+(``ClipDescriptor.metadata["effects"]``) go through MoviePy and are re-encoded.
+
+Projects (`export_project`) are assembled with ffmpeg's concat demuxer in a single
+stream-copy pass. When no clip has effects, trims become ``inpoint``/``outpoint``
+entries on the source files, which must then share codec, frame size and frame rate
+(true for cuts from one camera/source). Once any clip has effects, every clip is
+first rendered by ffmpeg to a temporary segment in one common format: H.264 at one
+frame size (letterboxed) and frame rate, plus stereo 48 kHz AAC, silent for sources
+without audio. A re-encoded segment never matches a source's codec parameters, and
+copying mismatched streams into one file yields undecodable audio or video.
+
 Future responsibilities:
- - Assemble timeline (respect in/out points, ordering, transitions)
+ - Transitions
  - Apply caption overlays and simple effects
- - Invoke ffmpeg (via MoviePy or direct subprocess) to render final mp4
- - Provide progress callbacks/signals for UI
  - Support different presets (social media aspect ratios, bitrate targets)
 """
 
 from __future__ import annotations
 
+import subprocess
+import tempfile
 from typing import Callable, Optional
 from pathlib import Path
 
-from ..core.project import Project
+from ..core.project import Project, ClipDescriptor
+from ..media.ffmpeg import ffmpeg_executable
+from ..media.moviepy_loader import video_file_clip_class
 
 ProgressCallback = Callable[[float], None]  # 0.0 - 1.0
 
@@ -38,22 +54,186 @@ def export_project(
     settings: ExportSettings | None = None,
     progress: Optional[ProgressCallback] = None,
 ) -> None:
-    """Stub: export project to a video file.
+    """Export the project's clips, in order, to one video file.
 
     Parameters
     ----------
     project: Project to render.
     output_path: Destination file path.
-    settings: ExportSettings controlling fps and basic dimensions.
+    settings: ExportSettings; its fps and size (when both width and height are
+        set) apply to rendered segments, which otherwise follow the first clip.
     progress: Optional callback receiving progress fraction.
+
+    Raises ValueError for an empty project and RuntimeError if ffmpeg fails.
     """
-    # Future implementation will iterate clips, apply trims (in/out), concatenate.
-    # For now just signal immediate completion.
+    clips = list(project.clips)
+    if not clips:
+        raise ValueError("project has no clips")
+    render_all = any(clip.metadata.get("effects") for clip in clips)
+    if render_all:
+        size, fps = _segment_format(clips[0], settings)
+    with tempfile.TemporaryDirectory(prefix="clipdozer-export-") as tmp:
+        lines = ["ffconcat version 1.0"]
+        for i, clip in enumerate(clips):
+            if render_all:
+                segment = Path(tmp) / f"segment{i:04d}.mp4"
+                _render_segment(clip, segment, size, fps)
+                lines.append(f"file {_concat_quote(segment)}")
+            else:
+                lines.append(f"file {_concat_quote(Path(clip.path).resolve())}")
+                if clip.in_point:
+                    lines.append(f"inpoint {clip.in_point:.3f}")
+                if clip.out_point is not None:
+                    lines.append(f"outpoint {clip.out_point:.3f}")
+            if progress:
+                # Rendering dominates; the final copy pass is comparatively free.
+                progress(0.9 * (i + 1) / len(clips))
+        listing = Path(tmp) / "list.txt"
+        listing.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        cmd = [
+            ffmpeg_executable(),
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            str(listing),
+            "-c",
+            "copy",
+            str(output_path),
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg concat failed: {result.stderr.strip()}")
+    if progress:
+        progress(1.0)
+
+
+def _concat_quote(path: Path) -> str:
+    # Concat demuxer quoting: single quotes, with embedded quotes as '\''.
+    return "'" + str(path).replace("'", "'\\''") + "'"
+
+
+def _probe_stream(path: str | Path) -> dict:
+    from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+    return ffmpeg_parse_infos(str(path))
+
+
+def _segment_format(
+    first: ClipDescriptor, settings: ExportSettings | None
+) -> tuple[tuple[int, int], float]:
+    """Frame size and rate shared by every rendered segment."""
+    infos = _probe_stream(first.path)
+    w, h = infos.get("video_size") or (0, 0)
+    if abs(infos.get("video_rotation", 0)) in (90, 270):
+        w, h = h, w
+    fps = infos.get("video_fps") or 30.0
+    if settings is not None:
+        fps = settings.fps
+        if settings.width and settings.height:
+            w, h = settings.width, settings.height
+    # yuv420p needs even dimensions.
+    return (max(2, w - w % 2), max(2, h - h % 2)), fps
+
+
+def _render_segment(
+    clip: ClipDescriptor, dst: Path, size: tuple[int, int], fps: float
+) -> None:
+    # Every segment of a project is encoded to the same size, rate and codecs so
+    # the segments concatenate by stream copy.
+    w, h = size
+    cmd = [ffmpeg_executable(), "-y", "-loglevel", "error"]
+    if clip.in_point:
+        cmd += ["-ss", f"{clip.in_point:.3f}"]
+    if clip.out_point is not None:
+        cmd += ["-to", f"{clip.out_point:.3f}"]
+    cmd += ["-i", str(clip.path)]
+    if _probe_stream(clip.path).get("audio_found"):
+        audio_map = ["-map", "0:a:0"]
+    else:
+        # Silent track so every segment carries the same streams.
+        cmd += ["-f", "lavfi", "-i", "anullsrc=channel_layout=stereo:sample_rate=48000"]
+        audio_map = ["-map", "1:a:0", "-shortest"]
+    cmd += [
+        "-map",
+        "0:v:0",
+        *audio_map,
+        "-vf",
+        f"scale={w}:{h}:force_original_aspect_ratio=decrease,"
+        f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={fps}",
+        "-c:v",
+        "libx264",
+        "-preset",
+        "veryfast",
+        "-pix_fmt",
+        "yuv420p",
+        "-c:a",
+        "aac",
+        "-ar",
+        "48000",
+        "-ac",
+        "2",
+        str(dst),
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg segment render failed: {result.stderr.strip()}")
+
+
+def fast_trim(
+    path: str | Path, in_t: float, out_t: float | None, dst: str | Path
+) -> None:
+    """Copy ``[in_t, out_t]`` of ``path`` to ``dst`` without re-encoding.
+
+    ``out_t`` None copies through to the end of the file. Raises RuntimeError if
+    ffmpeg fails.
+    """
+    if out_t is not None and out_t <= in_t:
+        raise ValueError("out_t must be greater than in_t")
+    cmd = [ffmpeg_executable(), "-y", "-loglevel", "error", "-ss", f"{in_t:.3f}"]
+    if out_t is not None:
+        cmd += ["-to", f"{out_t:.3f}"]
+    cmd += [
+        "-i",
+        str(path),
+        "-c",
+        "copy",
+        "-avoid_negative_ts",
+        "make_zero",
+        str(dst),
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg trim failed: {result.stderr.strip()}")
+
+
+def export_clip(
+    clip: ClipDescriptor,
+    output_path: str | Path,
+    progress: Optional[ProgressCallback] = None,
+) -> None:
+    """Export one clip's in/out range, stream-copying when it has no effects."""
+    in_t = clip.in_point or 0.0
+    if not clip.metadata.get("effects"):
+        fast_trim(clip.path, in_t, clip.out_point, output_path)
+    else:
+        with video_file_clip_class()(clip.path) as source:
+            out_t = source.duration if clip.out_point is None else clip.out_point
+            # AAC is explicit: MoviePy would otherwise pick MP3 for .mp4.
+            source.subclipped(in_t, out_t).write_videofile(
+                str(output_path), codec="libx264", audio_codec="aac", logger=None
+            )
     if progress:
         progress(1.0)
-    # Placeholder: write a tiny marker file to show invocation occurred (not a real video)
-    p = Path(output_path)
-    p.write_text("EXPORT PLACEHOLDER")
 
 
-__all__ = ["ExportSettings", "export_project"]
+__all__ = [
+    "ExportSettings",
+    "export_project",
+    "export_clip",
+    "fast_trim",
+]
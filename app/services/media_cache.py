@@ -0,0 +1,157 @@
+"""On-disk cache for generated timeline media (thumbnails, waveform envelopes).
+
+Re-opening a clip used to decode thumbnails and the soundtrack from scratch. Results
+are stored under ``$XDG_CACHE_HOME/clipdozer`` (``~/.cache/clipdozer`` by default),
+keyed by a blake2b digest of the source path, its size and mtime, and whatever
+parameters shaped the result (thumbnail count/height, envelope resolution). A file
+that is rewritten in place therefore misses instead of serving stale data.
+
+Thumbnails are stored as one horizontal PNG atlas plus a JSON sidecar (times,
+duration, per-image widths); envelopes as ``.npz``. Each kind keeps at most
+`_MAX_ENTRIES` entries, evicting the least recently used (hits refresh mtime).
+
+The cache is best effort: any I/O or decode error behaves like a miss. Functions
+only touch files and QImage, so they are safe to call from worker threads.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PySide6.QtGui import QImage, QPainter
+
+_MAX_ENTRIES = 256
+
+
+def _cache_root() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "clipdozer"
+
+
+def media_key(path: str | os.PathLike, *params) -> Optional[str]:
+    """Cache key for ``path`` plus result-shaping ``params`` (None if unreadable)."""
+    try:
+        resolved = Path(path).resolve()
+        st = resolved.stat()
+    except OSError:
+        return None
+    ident = [str(resolved), st.st_size, st.st_mtime_ns, *params]
+    return hashlib.blake2b(repr(ident).encode(), digest_size=16).hexdigest()
+
+
+def load_thumbnails(key: str) -> Optional[Tuple[List[QImage], List[float], float]]:
+    """Return ``(images, times, duration)`` stored under ``key``, or None."""
+    folder = _cache_root() / "thumbs"
+    try:
+        meta = json.loads((folder / f"{key}.json").read_text(encoding="utf-8"))
+        atlas = QImage(str(folder / f"{key}.png"))
+        if atlas.isNull():
+            return None
+        images: List[QImage] = []
+        x = 0
+        for width in meta["widths"]:
+            images.append(
+                atlas.copy(x, 0, width, atlas.height()).convertToFormat(
+                    QImage.Format.Format_RGB32
+                )
+            )
+            x += width
+        _touch(folder / f"{key}.json", folder / f"{key}.png")
+        return images, [float(t) for t in meta["times"]], float(meta["duration"])
+    except Exception:
+        return None
+
+
+def store_thumbnails(
+    key: str, images: List[QImage], times: List[float], duration: float
+) -> None:
+    if not images:
+        return
+    folder = _cache_root() / "thumbs"
+    try:
+        folder.mkdir(parents=True, exist_ok=True)
+        widths = [img.width() for img in images]
+        atlas = QImage(
+            sum(widths),
+            max(img.height() for img in images),
+            QImage.Format.Format_RGB32,
+        )
+        atlas.fill(0)
+        p = QPainter(atlas)
+        x = 0
+        for img in images:
+            p.drawImage(x, 0, img)
+            x += img.width()
+        p.end()
+        # Write then rename (atlas first, sidecar last) so a reader in another
+        # window or process never sees a partial entry.
+        tmp = folder / f"{key}.tmp.png"
+        if not atlas.save(str(tmp), "PNG"):
+            return
+        os.replace(tmp, folder / f"{key}.png")
+        meta = {"widths": widths, "times": list(times), "duration": duration}
+        tmp = folder / f"{key}.tmp.json"
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp, folder / f"{key}.json")
+        _prune(folder, ".json")
+    except OSError:
+        pass
+
+
+def load_waveform(key: str) -> Optional[Tuple[np.ndarray, float]]:
+    """Return ``(envelope, duration)`` stored under ``key``, or None."""
+    path = _cache_root() / "waves" / f"{key}.npz"
+    try:
+        with np.load(path) as data:
+            amps = data["amps"]
+            duration = float(data["duration"])
+        _touch(path)
+        return amps, duration
+    except Exception:
+        return None
+
+
+def store_waveform(key: str, amps: np.ndarray, duration: float) -> None:
+    folder = _cache_root() / "waves"
+    try:
+        folder.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a concurrent reader never sees a partial file.
+        tmp = folder / f"{key}.tmp.npz"
+        np.savez(tmp, amps=amps, duration=duration)
+        os.replace(tmp, folder / f"{key}.npz")
+        _prune(folder, ".npz")
+    except OSError:
+        pass
+
+
+def _touch(*paths: Path) -> None:
+    for path in paths:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+
+def _prune(folder: Path, suffix: str) -> None:
+    # Evict least recently used entries (by mtime) beyond _MAX_ENTRIES.
+    entries = sorted(folder.glob(f"*{suffix}"), key=lambda p: p.stat().st_mtime)
+    for stale in entries[: max(0, len(entries) - _MAX_ENTRIES)]:
+        for path in folder.glob(f"{stale.name[: -len(suffix)]}.*"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+__all__ = [
+    "media_key",
+    "load_thumbnails",
+    "store_thumbnails",
+    "load_waveform",
+    "store_waveform",
+]
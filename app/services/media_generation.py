@@ -3,21 +3,102 @@
 These classes were previously defined inside the timeline widget module. Moving them
 here reduces UI coupling and prepares for future non-Qt usage by wrapping logic only.
 
+Workers never contend with playback for the shared ffmpeg reader: thumbnails of a
+file are decoded and scaled by one ffmpeg process of their own
+(`iter_thumbnail_frames`), falling back to a private clip (`open_private_clip`, or a
+`SharedPrivateClip` kept open across generations) if that fails, and the waveform
+decodes its own mono float32 stream (`decode_audio_mono`, cached per file so resizes
+only re-bin).
+Clips that are not file backed fall back to the shared clip guarded by its
+`_external_mutex`. Finished results for file-backed clips are also kept on disk
+(`media_cache`), so re-opening a clip skips decoding entirely.
+
+Workers are plain QObjects whose ``run()`` executes on Qt's global thread pool
+(`start_media_job`); results reach the GUI thread through queued signals. There is
+no per-job QThread to tear down: a superseded job is told to ``cancel()`` and exits
+at its next check without emitting, while receivers still drop stale generation ids.
+
 Future improvements:
- - Abstract clip access behind a MediaClipAdapter (thread-safe get_frame, get_audio_samples)
  - Allow configurable thumbnail sizing / strategies
- - Provide cancellation tokens rather than relying on QThread interruption state
 """
 
 from __future__ import annotations
 
-from typing import List
+import atexit
+import os
+import weakref
+from functools import lru_cache
+from typing import List, Optional
 
-from PySide6.QtCore import QObject, Signal, QThread
+import numpy as np
+from PySide6.QtCore import QObject, QThreadPool, Signal, Qt
 from PySide6.QtGui import QImage
 
+from ..media.clip_adapter import SharedPrivateClip
+from ..media.ffmpeg import (
+    cached_keyframe_times,
+    decode_audio_mono,
+    iter_keyframes,
+    iter_thumbnail_frames,
+)
+from . import media_cache
+
 DEBUG_TIMELINE = False
 
+# Envelope analysis rate. ffmpeg low-pass filters when resampling, so this must stay
+# high enough to keep the bulk of speech/music energy (content below 4 kHz).
+_WAVEFORM_SAMPLE_RATE = 8000
+
+
+_live_jobs: "weakref.WeakSet" = weakref.WeakSet()
+
+
+_job_pools: "set[QThreadPool]" = set()
+
+
+def start_media_job(worker, pool: Optional[QThreadPool] = None) -> None:
+    """Run ``worker.run()`` on ``pool`` (Qt's global thread pool by default)."""
+    pool = pool or QThreadPool.globalInstance()
+    _live_jobs.add(worker)
+    _job_pools.add(pool)
+    pool.start(worker.run)
+
+
+@atexit.register
+def _drain_media_jobs() -> None:
+    # Interpreter shutdown deletes Qt wrappers, including workers still running on
+    # the pool; stop them and wait so none emits from a deleted QObject. Registered
+    # after PySide's own exit hook, so it runs first.
+    for worker in list(_live_jobs):
+        worker.cancel()
+    for pool in list(_job_pools):
+        pool.waitForDone()
+
+
+@lru_cache(maxsize=2)
+def _waveform_samples(path: str, mtime: float) -> np.ndarray:
+    # Keyed on mtime so a file rewritten in place is decoded again.
+    samples = decode_audio_mono(path, _WAVEFORM_SAMPLE_RATE)
+    samples.flags.writeable = False
+    return samples
+
+
+def _nearest_keyframes(
+    keys: np.ndarray, times: List[float], step: float
+) -> Optional[List[float]]:
+    # Nearest keyframe to each grid time; None if any is more than half a slot off
+    # (keyframes too sparse to stand in for the grid).
+    if keys.size == 0:
+        return None
+    grid = np.asarray(times)
+    idx = np.searchsorted(keys, grid)
+    before = keys[np.clip(idx - 1, 0, keys.size - 1)]
+    after = keys[np.clip(idx, 0, keys.size - 1)]
+    nearest = np.where(grid - before <= after - grid, before, after)
+    if np.abs(nearest - grid).max() > step / 2:
+        return None
+    return nearest.tolist()
+
 
 class ThumbnailWorker(QObject):
     finished = Signal(
@@ -32,6 +113,7 @@ class ThumbnailWorker(QObject):
         max_thumbs: int,
         target_height: int,
         width_hint: int,
+        private: Optional[SharedPrivateClip] = None,
     ):
         super().__init__()
         self._clip = clip
@@ -39,8 +121,14 @@ class ThumbnailWorker(QObject):
         self._max = max_thumbs
         self._height = target_height
         self._width_hint = width_hint
+        self._private = private
+        self._cancelled = False
 
-    def run(self):  # executed in thread
+    def cancel(self) -> None:
+        """Ask a running job to stop; it then exits without emitting."""
+        self._cancelled = True
+
+    def run(self):  # executed on a pool thread
         if DEBUG_TIMELINE:
             print(f"[ThumbnailWorker] start gen={self._gen}")
         try:
@@ -61,42 +149,126 @@ class ThumbnailWorker(QObject):
         while t < duration and len(times) < max_thumbs:
             times.append(t)
             t += step
-        from PIL import Image as _Image
-        from io import BytesIO as _BytesIO
+        path = getattr(self._clip, "filename", None)
+        key = (
+            media_cache.media_key(path, "thumbs", max_thumbs, self._height)
+            if path
+            else None
+        )
+        cached = media_cache.load_thumbnails(key) if key else None
+        if cached is not None and not self._cancelled:
+            self.finished.emit(self._gen, *cached)
+            return
+        images = None
+        try:
+            if path:
+                sampled = self._sampleFile(path, times, step)
+                if sampled is not None:
+                    images, times = sampled
+        except Exception as e:
+            if DEBUG_TIMELINE:
+                print(f"[ThumbnailWorker] ffmpeg strip failed, sampling clip: {e}")
+            path = None
+        if not path:
+            images = self._sampleClip(times)
+        if images is None:
+            if DEBUG_TIMELINE:
+                print(f"[ThumbnailWorker] cancelled gen={self._gen}")
+            return
+        if key and len(images) == len(times):
+            media_cache.store_thumbnails(key, images, times, duration)
+        if DEBUG_TIMELINE:
+            print(f"[ThumbnailWorker] finished gen={self._gen} images={len(images)}")
+        self.finished.emit(self._gen, images, times, duration)
+
+    def _sampleFile(
+        self, path: str, times: List[float], step: float
+    ) -> Optional[tuple[List[QImage], List[float]]]:
+        # One ffmpeg pass yields the whole strip pre-scaled to the target height.
+        # When every grid time has a keyframe within half a slot, thumbnails move to
+        # those keyframes and nothing between them is decoded; otherwise the whole
+        # stream is decoded once. Returns (images, their times), or None when
+        # cancelled part way through.
+        w, h = self._clip.size
+        size = (max(1, round(w * self._height / h)), self._height)
+        picks = _nearest_keyframes(cached_keyframe_times(path), times, step)
+        if picks is not None:
+            wanted = sorted(set(picks))
+            frames = iter_keyframes(path, wanted, size)
+        else:
+            frames = iter_thumbnail_frames(path, step, len(times), size)
+        images: List[QImage] = []
+        try:
+            for frame in frames:
+                if self._cancelled:
+                    return None
+                images.append(self._toThumbnail(frame))
+        finally:
+            frames.close()
+        if picks is None:
+            return images, times[: len(images)]
+        if len(images) != len(wanted):
+            raise RuntimeError(f"got {len(images)} of {len(wanted)} keyframes")
+        # Neighbouring slots may share a keyframe.
+        by_time = dict(zip(wanted, images))
+        return [by_time[t] for t in picks], picks
+
+    def _sampleClip(self, times: List[float]) -> Optional[List[QImage]]:
+        handle = self._private
+        if handle is None:  # one-off job: the private clip lives for this run only
+            handle = SharedPrivateClip(self._clip)
+        try:
+            with handle as private:
+                return self._sample(private, times)
+        finally:
+            if handle is not self._private:
+                handle.close()
 
+    def _sample(self, private, times: List[float]) -> Optional[List[QImage]]:
+        # Returns None when cancelled part way through.
+        clip = private if private is not None else self._clip
+        mutex = (
+            None if private is not None else getattr(clip, "_external_mutex", None)
+        )
         images: List[QImage] = []
         for ts in times:
-            if QThread.currentThread().isInterruptionRequested():
-                if DEBUG_TIMELINE:
-                    print(f"[ThumbnailWorker] interrupted gen={self._gen}")
-                return
+            if self._cancelled:
+                return None
             try:
-                mutex = getattr(self._clip, "_external_mutex", None)
                 if mutex is not None:
                     mutex.lock()
                 try:
-                    frame = self._clip.get_frame(ts)
+                    frame = clip.get_frame(ts)
                 finally:
                     if mutex is not None:
                         mutex.unlock()
             except Exception:
                 continue
-            image = _Image.fromarray(frame).convert("RGB")
-            aspect = image.width / image.height
-            new_w = int(self._height * aspect)
-            image = image.resize((new_w, self._height))
-            buf = _BytesIO()
-            image.save(buf, format="PNG")
-            buf.seek(0)
-            qimg = QImage.fromData(buf.read(), format="PNG")
-            images.append(qimg)
-        if DEBUG_TIMELINE:
-            print(f"[ThumbnailWorker] finished gen={self._gen} images={len(images)}")
-        self.finished.emit(self._gen, images, times, duration)
+            images.append(self._toThumbnail(frame))
+        return images
+
+    def _toThumbnail(self, frame) -> QImage:
+        # Wrap the frame buffer directly and let Qt scale it (no PIL/PNG round-trip).
+        if frame.ndim == 2:
+            frame = np.stack([frame] * 3, axis=-1)
+        frame = np.ascontiguousarray(frame[:, :, :3], dtype=np.uint8)
+        h, w = frame.shape[0], frame.shape[1]
+        image = QImage(frame.data, w, h, frame.strides[0], QImage.Format.Format_RGB888)
+        if h > 4 * self._height:
+            # Two-step downscale: a cheap nearest-neighbour pass to 2x the target,
+            # then the smooth filter only runs over that small intermediate.
+            image = image.scaledToHeight(2 * self._height, Qt.FastTransformation)
+        if h != self._height:
+            image = image.scaledToHeight(self._height, Qt.SmoothTransformation)
+        # Hand over the pixmap-native format so QPixmap.fromImage on the GUI thread
+        # is a plain copy rather than a per-pixel RGB888 conversion. The conversion
+        # also detaches the result from `frame` before it crosses threads.
+        return image.convertToFormat(QImage.Format.Format_RGB32)
 
 
 class WaveformWorker(QObject):
-    finished = Signal(int, list, float)
+    # generation_id, envelope (read-only float32 ndarray, one point per bin), duration
+    finished = Signal(int, object, float)
     failed = Signal(int, str)
 
     def __init__(self, clip, gen_id: int, width_hint: int):
@@ -104,6 +276,11 @@ class WaveformWorker(QObject):
         self._clip = clip
         self._gen = gen_id
         self._width = width_hint
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Ask a running job to stop; it then exits without emitting."""
+        self._cancelled = True
 
     def run(self):
         try:
@@ -111,52 +288,72 @@ class WaveformWorker(QObject):
         except Exception as e:
             self.failed.emit(self._gen, f"duration err: {e}")
             return
-        if duration <= 0 or getattr(self._clip, "audio", None) is None:
+        # File-backed clips are decoded by ffmpeg directly (an audio-less file
+        # yields no samples), so they need no MoviePy audio reader of their own.
+        path = getattr(self._clip, "filename", None)
+        if duration <= 0 or (
+            not path and getattr(self._clip, "audio", None) is None
+        ):
             self.failed.emit(self._gen, "no audio")
             return
         try:
-            import numpy as np
-
-            mutex = getattr(self._clip, "_external_mutex", None)
-            if mutex is not None:
-                mutex.lock()
-            try:
-                raw = self._clip.audio.to_soundarray(fps=200)
-            finally:
+            target_points = min(
+                max(80, int(self._width / 2) if self._width > 0 else 400), 1600
+            )
+            key = media_cache.media_key(path, "wave", target_points) if path else None
+            cached = media_cache.load_waveform(key) if key else None
+            if cached is not None and not self._cancelled:
+                amps, cached_duration = cached
+                amps = amps.astype(np.float32, copy=False)
+                amps.flags.writeable = False
+                self.finished.emit(self._gen, amps, cached_duration)
+                return
+            if path:
+                # ffmpeg downmixes and resamples; samples arrive as mono float32.
+                raw = _waveform_samples(path, os.path.getmtime(path))
+            else:
+                mutex = getattr(self._clip, "_external_mutex", None)
                 if mutex is not None:
-                    mutex.unlock()
+                    mutex.lock()
+                try:
+                    raw = self._clip.audio.to_soundarray(fps=200)
+                finally:
+                    if mutex is not None:
+                        mutex.unlock()
+            if self._cancelled:
+                return
             if raw is None or raw.size == 0:
                 self.failed.emit(self._gen, "empty audio")
                 return
+            raw = raw.astype(np.float32, copy=False)
             if raw.ndim == 2:
                 raw = raw.mean(axis=1)
-            target_points = min(
-                max(80, int(self._width / 2) if self._width > 0 else 400), 1600
-            )
             n = raw.shape[0]
             if target_points > n:
                 target_points = n
             idx_edges = np.linspace(0, n, target_points + 1).astype(int)
-            rms_vals = []
-            for i in range(target_points):
-                s = idx_edges[i]
-                e = idx_edges[i + 1]
-                if e <= s:
-                    rms_vals.append(0.0)
-                    continue
-                seg = raw[s:e]
-                rms = float(np.sqrt(np.mean(seg * seg)))
-                rms_vals.append(rms)
-            rms_arr = np.array(rms_vals, dtype=float)
+            # Per-bin RMS in one pass: sum squared samples per bin with reduceat
+            # (bins start at idx_edges[:-1], all < n and non-empty since
+            # target_points <= n), then mean and sqrt in place.
+            rms_arr = np.add.reduceat(np.square(raw), idx_edges[:-1])
+            rms_arr /= np.maximum(np.diff(idx_edges), 1)
+            np.sqrt(rms_arr, out=rms_arr)
             peak = float(rms_arr.max()) if rms_arr.size else 1.0
             if peak <= 0:
                 peak = 1.0
-            env = (rms_arr / peak) ** 0.85
-            self.finished.emit(self._gen, env.tolist(), duration)
+            # Normalize and apply the perceptual curve without temporaries.
+            rms_arr /= peak
+            np.power(rms_arr, 0.85, out=rms_arr)
+            if key and not self._cancelled:
+                media_cache.store_waveform(key, rms_arr, duration)
+            # Handed over as the array itself: no per-point Python floats to build
+            # here and convert back on the GUI thread.
+            rms_arr.flags.writeable = False
+            self.finished.emit(self._gen, rms_arr, duration)
         except Exception as e:
             if DEBUG_TIMELINE:
                 print(f"[WaveformWorker] generation failed gen={self._gen}: {e}")
             self.failed.emit(self._gen, f"audio err: {e}")
 
 
-__all__ = ["ThumbnailWorker", "WaveformWorker"]
+__all__ = ["ThumbnailWorker", "WaveformWorker", "start_media_job"]
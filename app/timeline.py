@@ -1,6 +1,16 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, Signal, QSize, QRectF, QThread, QTimer, QMutex
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    QSize,
+    QPointF,
+    QRect,
+    QRectF,
+    QThreadPool,
+    QTimer,
+    QMutex,
+)
 from PySide6.QtWidgets import (
     QWidget,
     QHBoxLayout,
@@ -9,16 +19,29 @@ from PySide6.QtWidgets import (
     QSlider,
     QMenu,
 )
-from PySide6.QtGui import QPainter, QColor, QPen, QPixmap, QImage
+from PySide6.QtGui import QPainter, QPolygonF, QColor, QPen, QPixmap, QImage
 
+from time import perf_counter
 from typing import List, Optional
 
+import numpy as np
+
 # Import formatting utility and media generation workers
 from .utils.timefmt import format_time
-from .services.media_generation import ThumbnailWorker, WaveformWorker
+from .media.clip_adapter import SharedPrivateClip
+from .services.media_generation import (
+    ThumbnailWorker,
+    WaveformWorker,
+    start_media_job,
+)
 
 DEBUG_TIMELINE = False  # set True for verbose thumbnail generation logging
 
+# Minimum spacing of drag-time positionChanged emissions (~12 Hz). Every preview
+# seek decodes on the GUI thread, and backward seeks respawn ffmpeg; 80ms keeps
+# scrubbing responsive while skipping intermediate frames nobody gets to see.
+_DRAG_EMIT_INTERVAL = 0.080
+
 
 class _TimelineSlider(QSlider):
     """Custom horizontal slider that can render in/out regions.
@@ -38,37 +61,61 @@ class _TimelineSlider(QSlider):
         sz = super().sizeHint()
         return QSize(sz.width(), max(24, sz.height()))
 
+    def setMarkers(self, in_point: float | None, out_point: float | None):
+        """Set in/out markers, repainting only the groove span they cover(ed)."""
+        if (in_point, out_point) == (self.in_point, self.out_point):
+            return
+        old = self._markerSpan()
+        self.in_point = in_point
+        self.out_point = out_point
+        damage = old.united(self._markerSpan())
+        if not damage.isEmpty():
+            self.update(damage)
+
+    def _markerSpan(self) -> QRect:
+        # Groove band between the outermost marker x positions (highlight + lines).
+        if self.duration <= 0 or (self.in_point is None and self.out_point is None):
+            return QRect()
+        groove = self._grooveRect()
+        ip = 0.0 if self.in_point is None else self.in_point
+        op = self.duration if self.out_point is None else self.out_point
+        fracs = [max(0.0, min(1.0, v / self.duration)) for v in (ip, op)]
+        x1, x2 = (groove.x() + groove.width() * f for f in sorted(fracs))
+        # Pad for the 2px marker pens (half a pen each side, plus square caps past
+        # the groove ends) and for paintEvent snapping line x positions to whole pixels.
+        span = QRectF(x1 - 2, groove.y() - 1, x2 - x1 + 4, groove.height() + 2)
+        return span.toAlignedRect()
+
     def paintEvent(self, event):  # type: ignore[override]
         super().paintEvent(event)  # base draws groove + handle
         if self.duration <= 0:
             return
+        # Only axis-aligned fills and vertical lines on whole pixels: no antialiasing.
         p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing, True)
+        inv_duration = 1.0 / self.duration
 
-        groove_rect = self._grooveRect()
+        groove_rect = self._grooveRect().toAlignedRect()
         # Draw in/out highlight beneath handle
         if self.in_point is not None or self.out_point is not None:
             ip = 0.0 if self.in_point is None else self.in_point
             op = self.duration if self.out_point is None else self.out_point
             if op < ip:
                 ip, op = op, ip
-            span_frac_start = max(0.0, min(1.0, ip / self.duration))
-            span_frac_end = max(0.0, min(1.0, op / self.duration))
-            x1 = groove_rect.x() + groove_rect.width() * span_frac_start
-            x2 = groove_rect.x() + groove_rect.width() * span_frac_end
-            highlight = QRectF(x1, groove_rect.y(), x2 - x1, groove_rect.height())
+            span_frac_start = max(0.0, min(1.0, ip * inv_duration))
+            span_frac_end = max(0.0, min(1.0, op * inv_duration))
+            x1 = int(groove_rect.x() + groove_rect.width() * span_frac_start)
+            x2 = int(groove_rect.x() + groove_rect.width() * span_frac_end)
+            highlight = QRect(x1, groove_rect.y(), x2 - x1, groove_rect.height())
             p.fillRect(highlight, QColor(80, 160, 255, 90))
 
         # Draw marker lines
-        pen = QPen(QColor(80, 160, 255), 2)
-        p.setPen(pen)
         for point, color in (
             (self.in_point, QColor(0, 200, 120)),
             (self.out_point, QColor(220, 80, 120)),
         ):
             if point is None:
                 continue
-            frac = max(0.0, min(1.0, point / self.duration))
+            frac = max(0.0, min(1.0, point * inv_duration))
             x = groove_rect.x() + groove_rect.width() * frac
             p.setPen(QPen(color, 2))
             p.drawLine(
@@ -82,53 +129,131 @@ class _TimelineSlider(QSlider):
         return QRectF(margin, self.height() / 2 - 4, self.width() - margin * 2, 8)
 
 
+class _PlayheadOverlay(QWidget):
+    """Transparent child that draws only the playhead line over its parent.
+
+    Moving the playhead invalidates two narrow columns (old and new position)
+    instead of the parent's full thumbnail/waveform contents.
+    """
+
+    def __init__(self, parent: QWidget, pen_width: int):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self._pen_width = pen_width
+        self._frac = 0.0
+
+    def setFraction(self, frac: float):
+        frac = max(0.0, min(1.0, frac))
+        old_x, self._frac = self._lineX(), frac
+        new_x = self._lineX()
+        if new_x == old_x:
+            return
+        pad = self._pen_width
+        self.update(self._column(old_x, pad))
+        self.update(self._column(new_x, pad))
+
+    def _lineX(self) -> int:
+        return int(self._frac * self.width())
+
+    def _column(self, x: int, pad: int) -> QRect:
+        return QRect(x - pad, 0, 2 * pad + 1, self.height())
+
+    def paintEvent(self, event):  # type: ignore[override]
+        p = QPainter(self)
+        p.setPen(QPen(QColor(255, 255, 255), self._pen_width))
+        x = self._lineX()
+        p.drawLine(x, 0, x, self.height())
+        p.end()
+
+
 class _ThumbnailStrip(QWidget):
     """Displays evenly spaced frame thumbnails and current position indicator."""
 
     def __init__(self):
         super().__init__()
-        self._pixmaps: List[QPixmap] = []
-        self._positions: List[float] = []  # seconds corresponding to each pixmap
+        # All thumbnails packed side by side in one pixmap (a single upload);
+        # _tiles holds each thumbnail's source rect within it.
+        self._sheet: QPixmap | None = None
+        self._tiles: List[QRect] = []
+        self._positions: List[float] = []  # seconds corresponding to each tile
         self._duration: float = 0.0
         self._current_time: float = 0.0
+        # Whole strip pre-rendered for the widget size it was built at; repaints
+        # are a single blit instead of a smooth scale + draw per thumbnail.
+        self._atlas: QPixmap | None = None
+        self._atlas_for: tuple[int, int] | None = None
+        self._playhead = _PlayheadOverlay(self, 2)
+        self._playhead.setVisible(False)
         self.setMinimumHeight(52)
 
-    def setData(self, pixmaps: List[QPixmap], positions: List[float], duration: float):
-        self._pixmaps = pixmaps
+    def setData(self, images: List[QImage], positions: List[float], duration: float):
+        self._sheet, self._tiles = self._packSheet(images)
         self._positions = positions
         self._duration = duration
+        self._atlas = None
+        self._playhead.setVisible(bool(self._tiles) and duration > 0)
+        self.setCurrentTime(self._current_time)
         self.update()
 
+    def hasData(self) -> bool:
+        return bool(self._tiles)
+
+    @staticmethod
+    def _packSheet(images: List[QImage]) -> tuple[QPixmap | None, List[QRect]]:
+        if not images:
+            return None, []
+        sheet = QImage(
+            sum(img.width() for img in images),
+            max(img.height() for img in images),
+            QImage.Format.Format_RGB32,
+        )
+        sheet.fill(0)
+        tiles: List[QRect] = []
+        p = QPainter(sheet)
+        x = 0
+        for img in images:
+            p.drawImage(x, 0, img)
+            tiles.append(QRect(x, 0, img.width(), img.height()))
+            x += img.width()
+        p.end()
+        return QPixmap.fromImage(sheet), tiles
+
     def setCurrentTime(self, t: float):
         self._current_time = t
-        self.update()
+        if self._duration > 0:
+            self._playhead.setFraction(t / self._duration)
+
+    def resizeEvent(self, event):  # type: ignore[override]
+        super().resizeEvent(event)
+        self._playhead.setGeometry(self.rect())
 
     def paintEvent(self, event):  # type: ignore[override]
         p = QPainter(self)
-        p.fillRect(self.rect(), QColor(30, 30, 30))
-        if not self._pixmaps or self._duration <= 0:
+        if not self._tiles or self._duration <= 0:
+            p.fillRect(self.rect(), QColor(30, 30, 30))
             p.end()
             return
-        w = self.width()
-        h = self.height()
-        for pix, pos in zip(self._pixmaps, self._positions):
-            frac = pos / self._duration
-            x = int(frac * w)
-            target_w = max(1, int(w / len(self._pixmaps)))
-            target_h = h
-            scaled = pix.scaled(
-                target_w,
-                target_h,
-                Qt.KeepAspectRatioByExpanding,
-                Qt.SmoothTransformation,
-            )
-            p.drawPixmap(x, 0, scaled)
-        # current position line
-        frac_cur = max(0.0, min(1.0, self._current_time / self._duration))
-        x_line = int(frac_cur * w)
-        p.setPen(QPen(QColor(255, 255, 255), 2))
-        p.drawLine(x_line, 0, x_line, h)
+        size = (self.width(), self.height())
+        if self._atlas is None or self._atlas_for != size:
+            self._atlas = self._renderAtlas(*size)
+            self._atlas_for = size
+        p.drawPixmap(0, 0, self._atlas)
+        p.end()
+
+    def _renderAtlas(self, w: int, h: int) -> QPixmap:
+        atlas = QPixmap(max(1, w), max(1, h))
+        atlas.fill(QColor(30, 30, 30))
+        p = QPainter(atlas)
+        p.setRenderHint(QPainter.SmoothPixmapTransform)
+        target_w = max(1, int(w / len(self._tiles)))
+        for tile, pos in zip(self._tiles, self._positions):
+            x = int(pos / self._duration * w)
+            # Fill target_w x h keeping aspect (overflow is covered by the next tile).
+            scale = max(target_w / tile.width(), h / tile.height())
+            dest = QRectF(x, 0, tile.width() * scale, tile.height() * scale)
+            p.drawPixmap(dest, self._sheet, QRectF(tile))
         p.end()
+        return atlas
 
 
 # --- Waveform support ---
@@ -137,56 +262,74 @@ class _ThumbnailStrip(QWidget):
 class _WaveformWidget(QWidget):
     def __init__(self):
         super().__init__()
-        self._amps: List[float] = []
+        self._amps = np.empty(0, dtype=np.float32)
         self._duration: float = 0.0
         self._current_time: float = 0.0
+        # Envelope polygon for the size it was built at (rebuilt on data/resize).
+        self._poly: QPolygonF | None = None
+        self._poly_for: tuple[int, int] | None = None
+        self._playhead = _PlayheadOverlay(self, 1)
         self.setMinimumHeight(40)
         self.setVisible(False)
 
-    def setData(self, amps: List[float], duration: float):
-        self._amps = amps
+    def setData(self, amps: "np.ndarray | List[float]", duration: float):
+        # One compact float32 point per envelope bin (WaveformWorker emits the array
+        # itself, so this is not a copy); polygon rebuilds on resize work on it.
+        self._amps = np.asarray(amps, dtype=np.float32)
         self._duration = duration
+        self._poly = None
         self.setVisible(True)
+        self.setCurrentTime(self._current_time)
         self.update()
 
+    def hasData(self) -> bool:
+        return self._amps.size > 0
+
     def setCurrentTime(self, t: float):
         self._current_time = t
-        self.update()
+        if self._duration > 0:
+            self._playhead.setFraction(t / self._duration)
+
+    def resizeEvent(self, event):  # type: ignore[override]
+        super().resizeEvent(event)
+        self._playhead.setGeometry(self.rect())
 
     def paintEvent(self, e):  # type: ignore[override]
         p = QPainter(self)
         r = self.rect()
         p.fillRect(r, QColor(18, 18, 24))
-        if not self._amps or self._duration <= 0:
+        if self._amps.size == 0 or self._duration <= 0:
             p.end()
             return
         w = r.width()
         h = r.height()
-        mid = h / 2.0
-        n = len(self._amps)
-        from PySide6.QtGui import QPainterPath
-
-        path = QPainterPath()
-        path.moveTo(0, mid)
-        for i, a in enumerate(self._amps):
-            x = (i / (n - 1)) * w if n > 1 else 0
-            amp_h = a * (h * 0.9 / 2.0)
-            path.lineTo(x, mid - amp_h)
-        for i, a in reversed(list(enumerate(self._amps))):
-            x = (i / (n - 1)) * w if n > 1 else 0
-            amp_h = a * (h * 0.9 / 2.0)
-            path.lineTo(x, mid + amp_h)
-        path.closeSubpath()
+        if self._poly is None or self._poly_for != (w, h):
+            self._poly = self._buildPolygon(w, h)
+            self._poly_for = (w, h)
         p.setPen(Qt.NoPen)
         p.setBrush(QColor(70, 130, 200))
-        p.drawPath(path)
-        # Playhead
-        frac = max(0.0, min(1.0, self._current_time / self._duration))
-        x_line = int(frac * w)
-        p.setPen(QPen(QColor(255, 255, 255), 1))
-        p.drawLine(x_line, 0, x_line, h)
+        p.drawPolygon(self._poly)
         p.end()
 
+    def _buildPolygon(self, w: int, h: int) -> QPolygonF:
+        # Upper lobe left to right, then the mirrored lower lobe back to the start.
+        amps = self._amps
+        if amps.shape[0] > w > 0:
+            # More envelope points than pixel columns (e.g. shrunk before the
+            # debounced regeneration): keep each column's peak.
+            starts = np.linspace(0, amps.shape[0], w + 1)[:-1].astype(int)
+            amps = np.maximum.reduceat(amps, starts)
+        n = amps.shape[0]
+        mid = h / 2.0
+        xs = np.arange(n) * (w / (n - 1)) if n > 1 else np.zeros(1)
+        offsets = amps * (h * 0.9 / 2.0)
+        pts = np.empty((2 * n, 2))
+        pts[:n, 0] = xs
+        pts[:n, 1] = mid - offsets
+        pts[n:, 0] = xs[::-1]
+        pts[n:, 1] = mid + offsets[::-1]
+        return QPolygonF([QPointF(x, y) for x, y in pts.tolist()])
+
 
 def _initialize_waveform(tw: "TimelineWidget"):
     if getattr(tw, "waveform", None) is not None:
@@ -196,38 +339,27 @@ def _initialize_waveform(tw: "TimelineWidget"):
     if layout is not None:
         layout.insertWidget(2, tw.waveform)  # after thumbnails
     tw._wave_gen_id = 0
-    tw._wave_thread: Optional[QThread] = None
+    tw._last_wave_width = 0
     tw._wave_worker: Optional[WaveformWorker] = None
 
     def _startWaveformGeneration(self: "TimelineWidget"):
         if self._clip is None:
             return
-        if (
-            getattr(self, "_wave_thread", None) is not None
-            and self._wave_thread.isRunning()
-        ):
-            self._wave_thread.requestInterruption()
-            self._wave_thread.quit()
-            self._wave_thread.wait(50)
+        if self._wave_worker is not None:
+            self._wave_worker.cancel()
         self._wave_gen_id += 1
+        self._last_wave_width = self.width()
         gen = self._wave_gen_id
         worker = WaveformWorker(self._clip, gen, self.width())
-        thread = QThread()
-        self._wave_thread = thread
         self._wave_worker = worker
-        worker.moveToThread(thread)
-        thread.started.connect(worker.run)
         worker.finished.connect(self._waveformReady)
         worker.failed.connect(self._waveformFailed)
-        worker.finished.connect(lambda *_: thread.quit())
-        worker.failed.connect(lambda *_: thread.quit())
-        thread.finished.connect(worker.deleteLater)
-        thread.start()
+        start_media_job(worker)
 
-    def _waveformReady(self: "TimelineWidget", gen: int, amps: list, duration: float):
+    def _waveformReady(self: "TimelineWidget", gen: int, amps, duration: float):
         if gen != self._wave_gen_id:
             return
-        if amps:
+        if len(amps):
             self.waveform.setData(amps, duration)
             self.waveform.setCurrentTime(0.0)
         else:
@@ -243,6 +375,11 @@ def _initialize_waveform(tw: "TimelineWidget"):
     tw._waveformFailed = _waveformFailed.__get__(tw, tw.__class__)  # type: ignore
 
 
+def _widthChanged(last: int, current: int) -> bool:
+    # Ignore small drags: under 16px / 5% no thumbnail slot or envelope bin moves visibly.
+    return abs(current - last) >= max(16, last * 0.05)
+
+
 class TimelineWidget(QWidget):
     """Simple scrub bar with future in/out marker support.
 
@@ -262,16 +399,26 @@ class TimelineWidget(QWidget):
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
         self._duration = 0.0
+        self._seconds_per_step = 0.0
         self._in_point: float | None = None
         self._out_point: float | None = None
         self._suppress_signal = False
         self._clip = None
         self._thumb_gen_id = 0
-        self._pending_thread: Optional[QThread] = None
+        self._last_thumb_width = 0  # widget width the current thumbnails were made for
         self._thumb_worker: Optional[ThumbnailWorker] = None
+        # Private decoder reused by every thumbnail generation of the current clip.
+        self._thumb_source: Optional[SharedPrivateClip] = None
         self._resize_timer = QTimer(self)
         self._resize_timer.setSingleShot(True)
         self._resize_timer.timeout.connect(self._regenerateThumbnails)
+        # Drag emission throttle: the latest throttled position goes out when the
+        # timer fires. Release drops it: seekRequested carries the final position.
+        self._last_drag_emit = 0.0
+        self._pending_drag_t: float | None = None
+        self._drag_emit_timer = QTimer(self)
+        self._drag_emit_timer.setSingleShot(True)
+        self._drag_emit_timer.timeout.connect(self._flushDragPosition)
         # Mutex exposed for worker threads to coordinate clip decoding
         self._clip_mutex = QMutex()
         # Bind mutex onto clip later in setMedia so workers can access via _external_mutex
@@ -282,6 +429,7 @@ class TimelineWidget(QWidget):
         # Time label row
         label_row = QHBoxLayout()
         self.label_current = QLabel("00:00.000")
+        self._last_cur_text = "00:00.000"
         self.label_spacer = QLabel("/")
         self.label_duration = QLabel("00:00.000")
         self.label_range = QLabel("")  # shows [IN-OUT]
@@ -314,14 +462,15 @@ class TimelineWidget(QWidget):
         self._duration = max(0.0, float(duration))
         self.label_duration.setText(format_time(self._duration))
         self.slider.duration = self._duration
+        # Seconds per slider step (the slider range is fixed at construction).
+        self._seconds_per_step = self._duration / self.slider.maximum()
         # Clamp markers if necessary
         if self._in_point is not None and self._in_point > self._duration:
             self._in_point = None
         if self._out_point is not None and self._out_point > self._duration:
             self._out_point = None
         self._updateRangeLabel()
-        self.slider.in_point = self._in_point
-        self.slider.out_point = self._out_point
+        # Marker positions scale with the duration: repaint the whole slider.
         self.slider.update()
 
     def setPosition(self, t: float):
@@ -335,7 +484,7 @@ class TimelineWidget(QWidget):
                 self.slider.setValue(int(frac * self.slider.maximum()))
             finally:
                 self._suppress_signal = False
-        self.label_current.setText(format_time(t))
+        self._setCurrentLabel(t)
         if self.thumbnail_strip.isVisible():
             self.thumbnail_strip.setCurrentTime(t)
         if hasattr(self, "waveform") and self.waveform.isVisible():
@@ -350,16 +499,11 @@ class TimelineWidget(QWidget):
             self._out_point = None  # reset inconsistent
         self._updateRangeLabel()
         self.inOutChanged.emit(self._in_point, self._out_point)
-        self.slider.in_point = self._in_point
-        self.slider.out_point = self._out_point
-        self.slider.update()
 
     def clearInPoint(self):
         self._in_point = None
         self._updateRangeLabel()
         self.inOutChanged.emit(self._in_point, self._out_point)
-        self.slider.in_point = self._in_point
-        self.slider.update()
 
     def setOutPoint(self):
         if self._duration <= 0:
@@ -370,26 +514,30 @@ class TimelineWidget(QWidget):
             self._in_point = None
         self._updateRangeLabel()
         self.inOutChanged.emit(self._in_point, self._out_point)
-        self.slider.out_point = self._out_point
-        self.slider.in_point = self._in_point
-        self.slider.update()
 
     def clearOutPoint(self):
         self._out_point = None
         self._updateRangeLabel()
         self.inOutChanged.emit(self._in_point, self._out_point)
-        self.slider.out_point = self._out_point
-        self.slider.update()
 
     def currentPosition(self) -> float:
         if self._duration <= 0:
             return 0.0
-        return (self.slider.value() / self.slider.maximum()) * self._duration
+        return self.slider.value() * self._seconds_per_step
 
     def inOut(self) -> tuple[float | None, float | None]:
         return self._in_point, self._out_point
 
     # --- Internal helpers ---
+    def _setCurrentLabel(self, t: float):
+        # Hot path (every slider move and playback position update). Position
+        # echoes (a drag's release, then the controller's confirmation) repeat the
+        # same text, so skip the Qt call when nothing changes.
+        text = format_time(t)
+        if text != self._last_cur_text:
+            self._last_cur_text = text
+            self.label_current.setText(text)
+
     def _updateRangeLabel(self):
         if self._in_point is None and self._out_point is None:
             self.label_range.setText("")
@@ -401,9 +549,7 @@ class TimelineWidget(QWidget):
                 format_time(self._out_point) if self._out_point is not None else "--"
             )
             self.label_range.setText(f"[{part_in} - {part_out}]")
-        self.slider.in_point = self._in_point
-        self.slider.out_point = self._out_point
-        self.slider.update()
+        self.slider.setMarkers(self._in_point, self._out_point)
 
     # --- Slider callbacks ---
     def _onSliderPressed(self):
@@ -415,20 +561,35 @@ class TimelineWidget(QWidget):
             return
         if self._duration <= 0:
             return
-        t = (value / self.slider.maximum()) * self._duration
-        self.label_current.setText(format_time(t))
-        self.positionChanged.emit(t)
+        t = value * self._seconds_per_step
+        self._setCurrentLabel(t)
+        self._pending_drag_t = t
+        wait = self._last_drag_emit + _DRAG_EMIT_INTERVAL - perf_counter()
+        if wait <= 0:
+            self._flushDragPosition()
+        elif not self._drag_emit_timer.isActive():
+            self._drag_emit_timer.start(max(1, int(wait * 1000)))
         if self.thumbnail_strip.isVisible():
             self.thumbnail_strip.setCurrentTime(t)
         if hasattr(self, "waveform") and self.waveform.isVisible():
             self.waveform.setCurrentTime(t)
 
+    def _flushDragPosition(self):
+        self._drag_emit_timer.stop()
+        t, self._pending_drag_t = self._pending_drag_t, None
+        if t is not None:
+            self._last_drag_emit = perf_counter()
+            self.positionChanged.emit(t)
+
     def _onSliderReleased(self):
         if self._duration <= 0:
             return
         value = self.slider.value()
-        t = (value / self.slider.maximum()) * self._duration
-        self.label_current.setText(format_time(t))
+        t = value * self._seconds_per_step
+        self._setCurrentLabel(t)
+        # The exact seek below supersedes a throttled drag position still pending.
+        self._drag_emit_timer.stop()
+        self._pending_drag_t = None
         self.seekRequested.emit(t)
         self.dragEnded.emit()
         if self.thumbnail_strip.isVisible():
@@ -454,10 +615,15 @@ class TimelineWidget(QWidget):
     # --- New API: media + thumbnails ---
     def setMedia(self, clip, max_thumbs: int = 12):
         """Provide a MoviePy VideoFileClip for generating thumbnails and duration asynchronously."""
+        if clip is not self._clip:
+            self._releaseThumbSource()
+            self._thumb_source = SharedPrivateClip(clip)
         self._clip = clip
-        # Attach mutex for external workers
+        # Attach mutex for workers that fall back to the shared clip (clips that
+        # are not file backed); file-backed clips are decoded from private copies.
         try:
-            setattr(self._clip, "_external_mutex", self._clip_mutex)
+            if getattr(self._clip, "_external_mutex", None) is None:
+                setattr(self._clip, "_external_mutex", self._clip_mutex)
         except Exception:
             pass
         # Set duration immediately so scrubbing works before thumbs
@@ -475,64 +641,54 @@ class TimelineWidget(QWidget):
         if self._clip is None:
             return
         self.thumbnailsBusy.emit(True)
-        # Cancel previous thread if running
-        if self._pending_thread is not None:
-            # Request interruption and allow previous to wind down; do not block long.
-            if self._pending_thread.isRunning():
-                self._pending_thread.requestInterruption()
-                self._pending_thread.quit()
-                self._pending_thread.wait(50)
+        # A superseded job stops at its next frame; it holds the shared private
+        # clip until then, so the new job simply queues behind it.
+        if self._thumb_worker is not None:
+            self._thumb_worker.cancel()
         self._thumb_gen_id += 1
+        self._last_thumb_width = self.width()
         gen_id = self._thumb_gen_id
-        worker = ThumbnailWorker(self._clip, gen_id, max_thumbs, 50, self.width())
-        thread = QThread()
-        self._pending_thread = thread
+        worker = ThumbnailWorker(
+            self._clip, gen_id, max_thumbs, 50, self.width(), self._thumb_source
+        )
         self._thumb_worker = worker
-        worker.moveToThread(thread)
-        thread.started.connect(worker.run)
         worker.finished.connect(self._onThumbsReady)
         worker.failed.connect(self._onThumbsFailed)
-        # Ensure cleanup
-        worker.finished.connect(lambda *_: thread.quit())
-        worker.failed.connect(lambda *_: thread.quit())
-        thread.finished.connect(worker.deleteLater)
-        thread.finished.connect(lambda: self._clearThread(thread))
-        thread.start()
+        start_media_job(worker)
         if DEBUG_TIMELINE:
-            print(
-                f"[TimelineWidget] spawned gen={gen_id} thread id={int(thread.currentThreadId())}"
-            )
+            print(f"[TimelineWidget] queued thumbnail gen={gen_id}")
 
-    def _clearThread(self, thread):
-        if self._pending_thread is thread:
-            self._pending_thread = None
-            self._thumb_worker = None
-            self.thumbnailsBusy.emit(False)
-            if DEBUG_TIMELINE:
-                print("[TimelineWidget] thread cleared")
+    def _finishThumbJob(self):
+        self._thumb_worker = None
+        self.thumbnailsBusy.emit(False)
+
+    def _releaseThumbSource(self):
+        # Closing waits for a job still decoding; do it on the pool, not the GUI thread.
+        if self._thumb_source is not None:
+            QThreadPool.globalInstance().start(self._thumb_source.close)
+            self._thumb_source = None
 
     def _onThumbsReady(self, gen_id: int, images: list, times: list, duration: float):
         if gen_id != self._thumb_gen_id:
             return  # stale
+        self._finishThumbJob()
         self.setDuration(duration)
-        pixmaps: List[QPixmap] = []
-        for img in images:
-            if isinstance(img, QImage):
-                pixmaps.append(QPixmap.fromImage(img))
-        if pixmaps:
-            self.thumbnail_strip.setData(pixmaps, times, duration)
+        images = [img for img in images if isinstance(img, QImage)]
+        if images:
+            self.thumbnail_strip.setData(images, times, duration)
             self.thumbnail_strip.setVisible(True)
             self.thumbnail_strip.setCurrentTime(0.0)
         else:
             self.thumbnail_strip.setVisible(False)
         if DEBUG_TIMELINE:
             print(
-                f"[TimelineWidget] thumbnails applied gen={gen_id} count={len(pixmaps)}"
+                f"[TimelineWidget] thumbnails applied gen={gen_id} count={len(images)}"
             )
 
     def _onThumbsFailed(self, gen_id: int, reason: str):
         if gen_id != self._thumb_gen_id:
             return
+        self._finishThumbJob()
         self.thumbnail_strip.setVisible(False)
         if DEBUG_TIMELINE:
             print(
@@ -547,25 +703,24 @@ class TimelineWidget(QWidget):
         self._resize_timer.start(300)
 
     def _regenerateThumbnails(self):
-        # Only regenerate if width meaningfully changed (could track previous width; simple approach now)
+        # Only regenerate if width meaningfully changed; until then the strip keeps
+        # rescaling the existing thumbnails/envelope to the new size.
         if self._clip is None:
             return
-        self._startThumbnailGeneration()
-        if hasattr(self, "_startWaveformGeneration"):
+        if _widthChanged(self._last_thumb_width, self.width()):
+            self._startThumbnailGeneration()
+        if hasattr(self, "_startWaveformGeneration") and _widthChanged(
+            self._last_wave_width, self.width()
+        ):
             self._startWaveformGeneration()
 
     def closeEvent(self, event):  # type: ignore[override]
-        # Cleanly stop any running worker thread on widget close to avoid warnings.
-        if self._pending_thread is not None and self._pending_thread.isRunning():
-            self._pending_thread.requestInterruption()
-            self._pending_thread.quit()
-            self._pending_thread.wait(200)
+        # Stop pending generation jobs; pool threads are owned by Qt, nothing to join.
+        if self._thumb_worker is not None:
+            self._thumb_worker.cancel()
+            self._thumb_worker = None
+        if self._wave_worker is not None:
+            self._wave_worker.cancel()
+            self._wave_worker = None
+        self._releaseThumbSource()
         super().closeEvent(event)
-        if (
-            hasattr(self, "_wave_thread")
-            and self._wave_thread is not None
-            and self._wave_thread.isRunning()
-        ):
-            self._wave_thread.requestInterruption()
-            self._wave_thread.quit()
-            self._wave_thread.wait(200)
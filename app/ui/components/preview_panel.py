@@ -16,34 +16,43 @@ For now we adapt existing `VideoPlaybackController`, `VideoPreviewWidget`, and
 
 Public API (initial):
     load(path_or_clip) -> load source media into playback controller & scrubber
+        (paths open on the thread pool; sourceLoaded / loadFailed report the result)
+    prefetch(path) -> open a path in the background ahead of a likely load()
+    releaseClips() -> unload and close the clips opened from paths
     controller (VideoPlaybackController)
     preview (VideoPreviewWidget)
     scrubber (ScrubberWidget)
 
-Signals reused from controller & scrubber.
+Signals reused from controller & scrubber. While the scrubber is dragged, previews of
+a clip opened from a path snap to nearby keyframes; releasing seeks exactly.
 """
 
 from __future__ import annotations
 
+import os
+from collections import OrderedDict
 from typing import Union
 
+import numpy as np
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
 
 from ...media.playback import VideoPlaybackController, VideoPreviewWidget
+from ...services.clip_loader import ClipLoader
+from ...services.clip_probe import KeyframeProbe, start_probe
+from ...services.media_generation import start_media_job
 from .scrubber import ScrubberWidget
 
-try:  # MoviePy import for path loading convenience
-    from moviepy import VideoFileClip
-except ImportError:  # pragma: no cover
-    try:
-        from moviepy.editor import VideoFileClip  # type: ignore
-    except ImportError:  # pragma: no cover
-        VideoFileClip = None  # type: ignore
+# Clips opened from paths kept open for cheap re-selection; the oldest is closed.
+_CLIP_CACHE_SIZE = 8
 
 
 class BasePreviewPanel(QWidget):
     """Common panel assembly for a preview + scrubber."""
 
+    sourceLoaded = Signal(str, object)  # path, clip now shown by the panel
+    loadFailed = Signal(str, str)  # path, reason
+
     def __init__(
         self,
         parent=None,
@@ -52,6 +61,17 @@ class BasePreviewPanel(QWidget):
         label: str | None = None,
     ):
         super().__init__(parent)
+        # Clips opened from paths, keyed by (path, mtime), least recent first.
+        self._clip_cache: OrderedDict[tuple[str, float], object] = OrderedDict()
+        self._shown_key: tuple[str, float] | None = None
+        # Opens in flight (key -> job id) and the job whose clip load() awaits.
+        self._opening: dict[tuple[str, float], int] = {}
+        self._load_gen = 0
+        self._pending_gen: int | None = None
+        # Keyframe times per cached clip (None while the probe runs or if it failed).
+        self._keyframes: dict[tuple[str, float], np.ndarray | None] = {}
+        self._dragging = False
+        self._drag_target: float | None = None  # exact time behind a snapped preview
         self.controller = VideoPlaybackController(self)
         self.preview = VideoPreviewWidget(self.controller)
         # Transport visibility decided by subclass; default hide (project panel) unless overridden
@@ -65,28 +85,163 @@ class BasePreviewPanel(QWidget):
         layout.addWidget(self.preview, stretch=1)
         layout.addWidget(self.scrubber)
         self.setLayout(layout)
-        # Wire interactions: scrubber drives controller seek; controller updates scrubber position
-        self.scrubber.positionChanged.connect(
-            lambda t: self.controller.seek(t, emit_frame=True)
-        )
-        self.controller.positionChanged.connect(self.scrubber.setPosition)
+        self._connectScrubber()
         # Configure optional elements
         if not show_thumbnails:
             self.scrubber.enableThumbnails(False)
         if not show_waveform:
             self.scrubber.enableWaveform(False)
 
-    def load(self, source: Union[str, VideoFileClip]):
-        """Load a clip path or existing VideoFileClip into the controller + scrubber."""
-        if isinstance(source, str):
-            if VideoFileClip is None:
-                raise RuntimeError("MoviePy not available for path load")
-            clip = VideoFileClip(source)
+    def _connectScrubber(self):
+        # Wire interactions: scrubber drives controller seek; controller updates scrubber position
+        self.scrubber.positionChanged.connect(self._onScrubPosition)
+        self.scrubber.seekRequested.connect(self._onScrubRelease)
+        self.scrubber.dragStarted.connect(self._onDragStarted)
+        self.scrubber.dragEnded.connect(self._onDragEnded)
+        self.controller.positionChanged.connect(
+            self.scrubber.setPosition, Qt.DirectConnection
+        )
+
+    def _onScrubPosition(self, t: float):
+        # While dragging, show the keyframe at or before ``t``: it decodes alone,
+        # where an exact frame decodes its GOP up to the target. Releasing the
+        # drag seeks exactly.
+        self._drag_target = None
+        keyframes = self._keyframes.get(self._shown_key) if self._dragging else None
+        if keyframes is not None and len(keyframes):
+            i = int(np.searchsorted(keyframes, t, side="right"))
+            self._drag_target = t
+            t = float(keyframes[max(i - 1, 0)])
+        self.controller.seek(t, emit_frame=True)
+
+    def _onScrubRelease(self, t: float):
+        # Pending throttled drag positions are dropped on release; seek to this one.
+        if self._dragging:
+            self._drag_target = t
+
+    def _onDragStarted(self):
+        self._dragging = True
+
+    def _onDragEnded(self):
+        self._dragging = False
+        target, self._drag_target = self._drag_target, None
+        if target is not None:
+            self.controller.seek(target, emit_frame=True)
+
+    def load(self, source: Union[str, "VideoFileClip"]):
+        """Load a clip path or existing VideoFileClip into the controller + scrubber.
+
+        A path is opened on the thread pool (`ClipLoader`) so the window stays
+        responsive; the panel switches over once the clip is open. A newer load
+        supersedes one still in flight (whose clip still lands in the cache).
+        """
+        self._pending_gen = None
+        if not isinstance(source, str):
+            self._shown_key = None
+            self._showClip("", source)
+            return
+        # Re-loading a file this panel opened recently (unchanged on disk) reuses
+        # its clip instead of probing it and spawning another ffmpeg reader. Clips
+        # are never shared across panels: each controller's decoder owns its pipe.
+        key = self._sourceKey(source)
+        if key is not None and key in self._clip_cache:
+            self._clip_cache.move_to_end(key)
+            self._shown_key = key
+            self._showClip(source, self._clip_cache[key])
+            return
+        # Immediate feedback while the file is probed; the first frame replaces it.
+        self.preview.clear()
+        self.preview.setText("Loading…")
+        if key is not None and key in self._opening:
+            self._pending_gen = self._opening[key]  # already prefetching
         else:
-            clip = source
+            self._pending_gen = self._open(source, key)
+
+    def prefetch(self, path: str) -> None:
+        """Start opening ``path`` in the background so a later load() is instant."""
+        key = self._sourceKey(path)
+        if key is None or key in self._clip_cache or key in self._opening:
+            return
+        self._open(path, key)
+
+    def _open(self, path: str, key: tuple[str, float] | None) -> int:
+        self._load_gen += 1
+        if key is not None:
+            self._opening[key] = self._load_gen
+        loader = ClipLoader(self._load_gen, path)
+        loader.loaded.connect(self._onClipLoaded)
+        loader.failed.connect(self._onClipFailed)
+        start_media_job(loader)
+        return self._load_gen
+
+    def releaseClips(self) -> None:
+        """Unload the controller and close every clip this panel opened."""
+        self.controller.unload()
+        self._pending_gen = None
+        self._shown_key = None
+        self._keyframes.clear()
+        while self._clip_cache:
+            _, clip = self._clip_cache.popitem()
+            clip.close()
+
+    @staticmethod
+    def _sourceKey(path: str) -> tuple[str, float] | None:
+        try:
+            return (os.path.abspath(path), os.path.getmtime(path))
+        except OSError:
+            return None
+
+    def _onClipLoaded(self, gen: int, path: str, clip):
+        key = self._sourceKey(path)
+        if key is not None and self._opening.get(key) == gen:
+            del self._opening[key]
+        if key is not None:
+            self._cacheClip(key, clip)
+        elif gen != self._pending_gen:
+            clip.close()  # file vanished while opening; nothing can reuse it
+            return
+        if gen == self._pending_gen:
+            self._pending_gen = None
+            self._shown_key = key
+            self._showClip(path, clip)
+
+    def _onClipFailed(self, gen: int, path: str, reason: str):
+        key = self._sourceKey(path)
+        if key is not None and self._opening.get(key) == gen:
+            del self._opening[key]
+        if gen != self._pending_gen:
+            return  # failed prefetch or superseded load; a load() reports it
+        self._pending_gen = None
+        self.preview.setText("")
+        self.loadFailed.emit(path, reason)
+
+    def _cacheClip(self, key: tuple[str, float], clip) -> None:
+        cache = self._clip_cache
+        cache[key] = clip
+        # Evict least recently used clips, never the one the controller is reading.
+        for stale_key in list(cache):
+            if len(cache) <= _CLIP_CACHE_SIZE:
+                break
+            if stale_key != self._shown_key:
+                cache.pop(stale_key).close()
+                self._keyframes.pop(stale_key, None)
+
+    def _onKeyframes(self, path: str, times):
+        key = self._sourceKey(path)
+        if key in self._keyframes:  # still cached
+            self._keyframes[key] = times
+
+    def _showClip(self, path: str, clip):
+        key = self._shown_key
+        if key is not None and key not in self._keyframes:
+            self._keyframes[key] = None
+            probe = KeyframeProbe(path)
+            probe.probed.connect(self._onKeyframes)
+            start_probe(probe)
         self.controller.load(clip)
         self.scrubber.setClip(clip)
         self.scrubber.setPosition(0.0)
+        self.sourceLoaded.emit(path, clip)
 
 
 class ClipPreviewPanel(BasePreviewPanel):
@@ -104,15 +259,14 @@ class ClipPreviewPanel(BasePreviewPanel):
             self.scrubber = ScrubberWidget(show_transport=True)
             layout.addWidget(self.scrubber)
         # Re-wire required signals after replacement
-        self.scrubber.positionChanged.connect(
-            lambda t: self.controller.seek(t, emit_frame=True)
-        )
-        self.controller.positionChanged.connect(self.scrubber.setPosition)
+        self._connectScrubber()
         # Wire transport actions to playback controller
         self.scrubber.playToggled.connect(self._onPlayToggle)
         self.scrubber.frameStep.connect(self._onFrameStep)
         # Update play button when controller state changes
-        self.controller.stateChanged.connect(self._updatePlayButton)
+        self.controller.stateChanged.connect(
+            self._updatePlayButton, Qt.DirectConnection
+        )
 
     def _onPlayToggle(self):
         playing = getattr(getattr(self.controller, "_state", None), "playing", False)
@@ -122,17 +276,8 @@ class ClipPreviewPanel(BasePreviewPanel):
             self.controller.play()
 
     def _onFrameStep(self, delta: int):
-        # Pause if currently playing
-        if getattr(getattr(self.controller, "_state", None), "playing", False):
-            self.controller.pause()
-        fps = getattr(getattr(self.controller, "_state", None), "fps", 24.0) or 24.0
-        cur_t = self.controller.position()
-        new_t = max(0.0, cur_t + (delta / fps))
-        duration = getattr(getattr(self.controller, "_state", None), "duration", None)
-        if duration is not None:
-            new_t = min(new_t, duration)
-        self.controller.seek(new_t)
-        self.scrubber.setPosition(new_t)
+        # Controller pauses if needed; its positionChanged updates the scrubber.
+        self.controller.stepFrame(delta)
 
     def _updatePlayButton(self, state: str):
         self.scrubber.updatePlayButton(state == "playing")
@@ -105,10 +105,8 @@ class ScrubberWidget(QWidget):
             self._timeline.seekRequested.connect(self.seekRequested.emit)
             self._timeline.inOutChanged.connect(self.inOutChanged.emit)
             # Proxy drag start/end signals for tests relying on them
-            if hasattr(self._timeline, "dragStarted"):
-                self._timeline.dragStarted.connect(self.dragStarted.emit)
-            if hasattr(self._timeline, "dragEnded"):
-                self._timeline.dragEnded.connect(self.dragEnded.emit)
+            self._timeline.dragStarted.connect(self.dragStarted.emit)
+            self._timeline.dragEnded.connect(self.dragEnded.emit)
         except Exception:
             pass
         # Button actions -> emit our own signals (controller/parent decides behavior)
@@ -119,10 +117,10 @@ class ScrubberWidget(QWidget):
         self._btn_out.clicked.connect(self._onMarkOut)
 
     # --- Public passthrough API ---
+    # The hosted TimelineWidget always provides these, so calls go straight through
+    # (setPosition runs per playback tick).
     def setClip(self, clip):  # attach MoviePy clip
-        # Legacy tests expect setMedia; provide compatibility
-        if hasattr(self._timeline, "setMedia"):
-            self._timeline.setMedia(clip)
+        self._timeline.setMedia(clip)
 
     def setPosition(self, t: float):
         return self._timeline.setPosition(t)
@@ -132,47 +130,34 @@ class ScrubberWidget(QWidget):
         return self.setClip(clip)
 
     def setDuration(self, duration: float):
-        if hasattr(self._timeline, "setDuration"):
-            return self._timeline.setDuration(duration)
+        return self._timeline.setDuration(duration)
 
     def currentPosition(self) -> float:
-        if hasattr(self._timeline, "currentPosition"):
-            return self._timeline.currentPosition()
-        return 0.0
+        return self._timeline.currentPosition()
 
     def enableThumbnails(self, enabled: bool):
-        if hasattr(self._timeline, "thumbnail_strip"):
-            self._timeline.thumbnail_strip.setVisible(
-                enabled and bool(self._timeline.thumbnail_strip._pixmaps)
-            )
+        strip = self._timeline.thumbnail_strip
+        strip.setVisible(enabled and strip.hasData())
 
     def enableWaveform(self, enabled: bool):
-        if hasattr(self._timeline, "waveform"):
-            self._timeline.waveform.setVisible(
-                enabled and bool(getattr(self._timeline.waveform, "_amps", []))
-            )
+        waveform = self._timeline.waveform
+        waveform.setVisible(enabled and waveform.hasData())
 
     # Marker helpers delegate
     def setInPoint(self):
-        if hasattr(self._timeline, "setInPoint"):
-            self._timeline.setInPoint()
+        self._timeline.setInPoint()
 
     def setOutPoint(self):
-        if hasattr(self._timeline, "setOutPoint"):
-            self._timeline.setOutPoint()
+        self._timeline.setOutPoint()
 
     def clearInPoint(self):
-        if hasattr(self._timeline, "clearInPoint"):
-            self._timeline.clearInPoint()
+        self._timeline.clearInPoint()
 
     def clearOutPoint(self):
-        if hasattr(self._timeline, "clearOutPoint"):
-            self._timeline.clearOutPoint()
+        self._timeline.clearOutPoint()
 
     def inOut(self):
-        if hasattr(self._timeline, "inOut"):
-            return self._timeline.inOut()
-        return (None, None)
+        return self._timeline.inOut()
 
     # --- Internal button handlers ---
     def _onMarkIn(self):
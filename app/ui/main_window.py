@@ -5,7 +5,13 @@ Moved from app.main to app.ui.main_window for clearer layering.
 
 from __future__ import annotations
 
+import atexit
+import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import PurePath
+from time import perf_counter
 
 from PySide6.QtWidgets import (
     QApplication,
@@ -19,25 +25,26 @@ from PySide6.QtWidgets import (
     QSplitter,
     QLabel,
 )
-from PySide6.QtGui import QAction
-from PySide6.QtCore import QUrl, Qt
-from PySide6.QtGui import QGuiApplication
+from PySide6.QtGui import QAction, QKeySequence
+from PySide6.QtCore import QTimer, QUrl, Qt
+from PySide6.QtGui import QGuiApplication, QPixmapCache
 import os
-from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
-
-try:
-    from moviepy import VideoFileClip
-except ImportError:  # pragma: no cover
-    try:
-        from moviepy.editor import VideoFileClip  # type: ignore
-    except ImportError as _e:  # pragma: no cover
-        VideoFileClip = None  # type: ignore
-        _moviepy_import_error = _e
-
 
 from ..media.playback import VideoPreviewWidget
+from ..services.clip_probe import ClipProbe, start_probe
+from ..utils.timefmt import format_time
 from .components.preview_panel import ClipPreviewPanel, ProjectPreviewPanel
 
+_log = logging.getLogger(__name__)
+
+# Quiet period (ms) after the last scrub commit before it is applied.
+_SEEK_COALESCE_MS = 30
+# Committed seeks closer than this (ms) to the audio position leave the player
+# alone: setPosition() flushes the audio pipeline and glitches audibly.
+_AUDIO_SEEK_SLACK_MS = 40
+# QPixmapCache budget (KB) shared by the preview widgets' scaled frames.
+_PIXMAP_CACHE_KB = 64 * 1024
+
 
 class ProjectPreviewWidget(VideoPreviewWidget):
     """Preview representing future composed project output.
@@ -54,9 +61,33 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("Clipdozer")
         self.setGeometry(100, 100, 800, 600)
+        QPixmapCache.setCacheLimit(_PIXMAP_CACHE_KB)
+        # Last audio position reported by QMediaPlayer.positionChanged (ms) and the
+        # perf_counter() it arrived at; the playback clock extrapolates from it
+        # instead of querying the player backend every tick.
+        self._audio_pos_ms = 0
+        self._audio_pos_at = 0.0
+        # Kept current from player signals so per-tick and per-seek paths read a
+        # flag instead of querying the player: a local file is loaded, and audio
+        # is actually playing (the playback clock follows it only then).
+        self._audio_ready = False
+        self._audio_live = False
+        # Scrub commits are coalesced: only the last one after a quiet period (or
+        # at drag end) seeks, so bursts do not flush audio and decoder repeatedly.
+        self._pending_seek: float | None = None
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(_SEEK_COALESCE_MS)
+        self._seek_timer.timeout.connect(self._flushSeek)
+        self._preferred_screen_geo = None  # see _preferredScreenGeometry
+        gui_app = QGuiApplication.instance()
+        gui_app.screenAdded.connect(self._invalidateScreenGeometry)
+        gui_app.screenRemoved.connect(self._invalidateScreenGeometry)
+        gui_app.primaryScreenChanged.connect(self._invalidateScreenGeometry)
         self._createMenuBar()
         self._createEditorLayout()
-        self._initAudio()
+        # Audio (QMediaPlayer + QAudioOutput) is created on the first media load:
+        # constructing them loads the multimedia backend and probes audio devices.
         # Defer centering until window has geometry (will also be called in run())
 
     def centerOnPreferredScreen(self):
@@ -67,38 +98,53 @@ class MainWindow(QMainWindow):
         2. Primary screen.
         """
         try:
-            screens = QGuiApplication.screens()
-            if not screens:
+            geo = self._preferredScreenGeometry()
+            if geo is None:
                 return
-            idx_env = os.getenv("CLIPDOZER_SCREEN_INDEX")
-            screen = None
-            if idx_env is not None:
-                try:
-                    idx = int(idx_env)
-                    if 0 <= idx < len(screens):
-                        screen = screens[idx]
-                except Exception:
-                    screen = None
-            if screen is None:
-                screen = QGuiApplication.primaryScreen() or screens[0]
-            if screen is None:
-                return
-            geo = screen.availableGeometry()
             win_geo = self.frameGeometry()
             win_geo.moveCenter(geo.center())
             self.move(win_geo.topLeft())
         except Exception:
             pass
 
+    def _preferredScreenGeometry(self):
+        # Resolved once; screen hotplug or a primary change invalidates it.
+        if self._preferred_screen_geo is not None:
+            return self._preferred_screen_geo
+        screens = QGuiApplication.screens()
+        if not screens:
+            return None
+        idx_env = os.getenv("CLIPDOZER_SCREEN_INDEX")
+        screen = None
+        if idx_env is not None:
+            try:
+                idx = int(idx_env)
+                if 0 <= idx < len(screens):
+                    screen = screens[idx]
+            except Exception:
+                screen = None
+        if screen is None:
+            screen = QGuiApplication.primaryScreen() or screens[0]
+        if screen is None:
+            return None
+        self._preferred_screen_geo = screen.availableGeometry()
+        return self._preferred_screen_geo
+
+    def _invalidateScreenGeometry(self, *_):
+        self._preferred_screen_geo = None
+
     def _createMenuBar(self):
         menu_bar = self.menuBar()
         file_menu = menu_bar.addMenu("File")
         import_action = QAction("Import Media", self)
         import_action.triggered.connect(self._importMedia)
         file_menu.addAction(import_action)
+        self._import_action = import_action
         exit_action = QAction("Exit", self)
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
+        # Filled with in/out point actions once the clip scrubber exists.
+        self._mark_menu = menu_bar.addMenu("Mark")
         about_menu = menu_bar.addMenu("About")
         about_action = QAction("About Clipdozer", self)
         about_action.triggered.connect(self._showAboutDialog)
@@ -111,48 +157,92 @@ class MainWindow(QMainWindow):
             "Clipdozer\nLightweight video editor for social media clips.",
         )
 
+    def closeEvent(self, event):  # type: ignore[override]
+        # The clip panel keeps recently opened clips (and their ffmpeg readers)
+        # alive for reselection; release them with the window, not at GC time.
+        self.clip_panel.releaseClips()
+        self.clip = None
+        super().closeEvent(event)
+
     def _importMedia(self):
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Import Media", "", "Video Files (*.mp4 *.mov *.avi)"
+        # No custom directory icons and no symlink resolution: both make Qt's
+        # dialog stat every entry, which stalls for seconds on network mounts.
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self,
+            "Import Media",
+            "",
+            "Video Files (*.mp4 *.mov *.avi)",
+            options=QFileDialog.Option.DontUseCustomDirectoryIcons
+            | QFileDialog.Option.DontResolveSymlinks,
         )
-        if not file_path:
+        if not file_paths:
             return
-        self.loadMediaPath(file_path)
-        # Add to clip bin mapping
-        base = os.path.basename(file_path)
-        display = f"{base}"
-        self._imported_clips[display] = file_path
-        # Avoid duplicate entries
-        if not any(
-            self.clip_bin.item(i).text() == display
-            for i in range(self.clip_bin.count())
-        ):
-            self.clip_bin.addItem(display)
+        self.loadMediaPath(file_paths[0])
+        self._addBinEntries([(PurePath(path).name, path) for path in file_paths])
+        # Durations are filled in as the (bounded) background probes finish.
+        for path in file_paths:
+            probe = ClipProbe(path)
+            probe.probed.connect(self._onClipProbed)
+            start_probe(probe)
+
+    def _onClipProbed(self, path: str, duration: float):
+        for row, row_path in enumerate(self._bin_paths):
+            if row_path == path:
+                item = self.clip_bin.item(row)
+                item.setText(f"{PurePath(path).name}  [{format_time(duration)}]")
+                item.setToolTip(path)
+
+    def _addBinEntries(self, entries: list[tuple[str, str | None]]):
+        # A name already listed keeps its row and points at the new path; the rest
+        # are added in one batch with repaints held off, so a multi-file import
+        # lays the list out once.
+        new = []
+        for name, path in entries:
+            row = self._bin_rows.get(name)
+            if row is not None:
+                self._bin_paths[row] = path
+                continue
+            self._bin_rows[name] = len(self._bin_paths)
+            self._bin_paths.append(path)
+            new.append(name)
+        if not new:
+            return
+        self.clip_bin.setUpdatesEnabled(False)
+        self.clip_bin.addItems(new)
+        self.clip_bin.setUpdatesEnabled(True)
 
     def loadMediaPath(self, file_path: str):
-        """Programmatic media load (used by _importMedia and potential future drag-drop)."""
-        try:
-            if VideoFileClip is None:
-                raise RuntimeError(f"moviepy import failed: {_moviepy_import_error}")
-            # Load clip and register in clip bin
-            self.clip = VideoFileClip(file_path)
-            self.clip_controller.load(self.clip)
-            self.clip_bin.addItem(f"Imported: {file_path.split('/')[-1]}")
-            if getattr(self, "clip_scrub", None) is not None:
-                try:
-                    self.clip_scrub.setMedia(self.clip)
-                    self.clip_scrub.setPosition(0.0)
-                except Exception as e:
-                    print(f"Failed to set media on clip scrub: {e}")
-            if hasattr(self, "media_player"):
-                self._loadAudio(file_path)
-                try:
-                    self.media_player.setPosition(0)
-                except Exception:
-                    pass
-            # Project controller stays blank until composition implemented.
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load video: {e}")
+        """Programmatic media load (used by _importMedia and potential future drag-drop).
+
+        The clip opens in the background (first load also imports MoviePy); the clip
+        panel's ``sourceLoaded`` fires once it is shown.
+        """
+        self._import_action.setEnabled(False)
+        self.clip_panel.load(file_path)
+        if not hasattr(self, "media_player"):
+            # First load: bring up the audio stack while the clip opens on the pool
+            # instead of after it, once the "Loading…" placeholder has painted.
+            QTimer.singleShot(0, self._ensureAudio)
+
+    def _onClipLoaded(self, file_path: str, clip):
+        self._import_action.setEnabled(True)
+        # The panel already fed controller and scrubber; _importMedia owns the bin.
+        self.clip = clip
+        # The first frame is already set on the preview; let it paint before the
+        # multimedia backend opens the file.
+        QTimer.singleShot(0, self, lambda: self._attachAudio(file_path, clip))
+        # Project controller stays blank until composition implemented.
+
+    def _attachAudio(self, file_path: str, clip):
+        if clip is not self.clip:
+            return  # another clip was shown meanwhile
+        self._ensureAudio()
+        if hasattr(self, "media_player"):
+            self._loadAudio(file_path)
+
+    def _onClipLoadFailed(self, file_path: str, reason: str):
+        self._import_action.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Failed to load video: {reason}")
 
     def _createEditorLayout(self):
         """Create new multi-pane editor layout.
@@ -174,9 +264,10 @@ class MainWindow(QMainWindow):
         # --- Clip Bin (left) ---
         self.clip_bin = QListWidget()
         self.clip_bin.setSelectionMode(QListWidget.SingleSelection)
-        self.clip_bin.addItem("Clip 1 (placeholder)")
-        self.clip_bin.addItem("Clip 2 (placeholder)")
-        self.clip_bin.addItem("Clip 3 (placeholder)")
+        # Source path per row (None for placeholders) and row per display name.
+        self._bin_paths: list[str | None] = []
+        self._bin_rows: dict[str, int] = {}
+        self._addBinEntries([(f"Clip {i} (placeholder)", None) for i in (1, 2, 3)])
         # Clip bin holds imported source clips.
         top_splitter.addWidget(self.clip_bin)
 
@@ -186,6 +277,7 @@ class MainWindow(QMainWindow):
 
         # Direct references for convenience (avoid legacy alias names)
         self.clip_controller = self.clip_panel.controller
+        self.clip_controller.set_clock(self._audioClock)
         self.video_preview = self.clip_panel.preview
         self.clip_scrub = self.clip_panel.scrubber
 
@@ -246,10 +338,15 @@ class MainWindow(QMainWindow):
 
         # Connections
         self.clip = None
-        self._imported_clips: dict[str, str] = {}
+
+        self.clip_panel.sourceLoaded.connect(self._onClipLoaded)
+        self.clip_panel.loadFailed.connect(self._onClipLoadFailed)
 
         # Clip bin selection -> load into clip preview controller
-        self.clip_bin.currentTextChanged.connect(self._onClipBinSelectionChanged)
+        self.clip_bin.currentRowChanged.connect(self._onClipBinRowChanged)
+        # Hovering an entry starts opening it, so the click usually hits the cache.
+        self.clip_bin.setMouseTracking(True)
+        self.clip_bin.itemEntered.connect(self._prefetchClip)
 
         # Scrubber wiring & shortcuts (terminology updated)
         if self.clip_scrub is not None:
@@ -260,46 +357,74 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             self.clip_scrub.inOutChanged.connect(self._inOutChanged)
-            try:
-                self.clip_scrub.thumbnailsBusy.connect(self._onThumbsBusy)
-            except Exception:
-                pass
-            from PySide6.QtGui import QShortcut, QKeySequence
-
-            QShortcut(QKeySequence("I"), self, activated=self.clip_scrub.setInPoint)
-            QShortcut(QKeySequence("O"), self, activated=self.clip_scrub.setOutPoint)
-            QShortcut(
-                QKeySequence("Shift+I"), self, activated=self.clip_scrub.clearInPoint
-            )
-            QShortcut(
-                QKeySequence("Shift+O"), self, activated=self.clip_scrub.clearOutPoint
-            )
+            # Menu actions rather than standalone QShortcuts: the keys resolve
+            # through the window's action shortcut map and stay discoverable.
+            for text, keys, slot in (
+                ("Set In Point", "I", self.clip_scrub.setInPoint),
+                ("Set Out Point", "O", self.clip_scrub.setOutPoint),
+                ("Clear In Point", "Shift+I", self.clip_scrub.clearInPoint),
+                ("Clear Out Point", "Shift+O", self.clip_scrub.clearOutPoint),
+            ):
+                action = QAction(text, self)
+                action.setShortcut(QKeySequence(keys))
+                action.triggered.connect(slot)
+                self._mark_menu.addAction(action)
 
         # Synchronize audio (clip only for now)
-        self.clip_controller.stateChanged.connect(self._onPlaybackState)
-        self.clip_controller.positionChanged.connect(self._maybeResyncAudio)
+        self.clip_controller.stateChanged.connect(
+            self._onPlaybackState, Qt.DirectConnection
+        )
 
-    def _onClipBinSelectionChanged(self, text: str):
+    def _onClipBinRowChanged(self, row: int):
         # Load selected clip into preview if we have a file path stored.
-        path = self._imported_clips.get(text)
+        if 0 <= row < len(self._bin_paths):
+            path = self._bin_paths[row]
+            if path:
+                self.loadMediaPath(path)
+
+    def _prefetchClip(self, item):
+        path = self._bin_paths[self.clip_bin.row(item)]
         if path:
-            self.loadMediaPath(path)
+            self.clip_panel.prefetch(path)
+
+    def _ensureAudio(self):
+        if not hasattr(self, "media_player"):
+            self._initAudio()
 
     def _initAudio(self):
+        # QtMultimedia is imported here rather than at module level: the window
+        # can be shown before any media is loaded, and the import costs ~30 ms.
+        from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
+
         try:
             self.audio_output = QAudioOutput(self)
             self.media_player = QMediaPlayer(self)
             self.media_player.setAudioOutput(self.audio_output)
             self.audio_output.setVolume(0.8)
-        except Exception as e:
-            print(f"Audio init failed: {e}")
+            self.media_player.positionChanged.connect(self._onAudioPosition)
+            self.media_player.playbackStateChanged.connect(self._onAudioStatus)
+            self.media_player.hasAudioChanged.connect(self._onAudioStatus)
+        except Exception:
+            _log.warning("Audio init failed", exc_info=True)
+
+    def _onAudioStatus(self, *_):
+        mp = self.media_player
+        self._audio_live = (
+            mp.hasAudio() and mp.playbackState() == mp.PlaybackState.PlayingState
+        )
+
+    def _onAudioPosition(self, ms: int):
+        self._audio_pos_ms = ms
+        self._audio_pos_at = perf_counter()
 
     def _loadAudio(self, file_path: str):
+        self._audio_ready = False
         try:
             self.media_player.setSource(QUrl.fromLocalFile(file_path))
             self.media_player.setPosition(0)
-        except Exception as e:
-            print(f"Audio load failed: {e}")
+            self._audio_ready = True
+        except Exception:
+            _log.warning("Audio load failed for %s", file_path, exc_info=True)
 
     def _ensureFFmpeg(self):
         import shutil
@@ -313,43 +438,42 @@ class MainWindow(QMainWindow):
 
     def _showFrame(self, t_or_index):
         # Legacy call path kept for potential external uses; now proxies to controller.seek
-        if self.clip is None:
-            return
         if isinstance(t_or_index, int) and self.clip is not None:
             t = t_or_index / self.clip.fps
         else:
             t = float(t_or_index)
-        self.clip_controller.seek(t)
-
-    def _onThumbsBusy(self, busy: bool):
-        if busy:
-            # Pause controller during heavy thumbnail generation to free decoding resources
-            if (
-                getattr(self.clip_controller, "_state", None)
-                and self.clip_controller._state.playing
-            ):  # type: ignore[attr-defined]
-                self._was_playing_before_thumbs = True
-                self.clip_controller.pause()
-            else:
-                self._was_playing_before_thumbs = False
-        else:
-            if getattr(self, "_was_playing_before_thumbs", False):
-                self.clip_controller.play()
+        self._seekClip(t)
 
-    def _previewSeek(self, t: float):  # kept for potential legacy slots
+    def _seekClip(self, t: float) -> bool:
+        # Shared by preview/commit seeks; the controller clamps to the clip range.
         if self.clip is None:
-            return
+            return False
         self.clip_controller.seek(t)
+        return True
+
+    def _previewSeek(self, t: float):  # kept for potential legacy slots
+        self._seekClip(t)
 
     def _commitSeek(self, t: float):  # kept for potential legacy slots
-        if self.clip is None:
+        if not self._seekClip(t):
             return
-        self.clip_controller.seek(t)
-        if hasattr(self, "media_player") and self.media_player.source().isLocalFile():
-            self.media_player.setPosition(int(t * 1000))
+        if self._audio_ready:
+            new_ms = int(t * 1000)
+            if abs(self.media_player.position() - new_ms) > _AUDIO_SEEK_SLACK_MS:
+                self.media_player.setPosition(new_ms)
+                # The player reports the new position later; until then the audio
+                # clock would pull video back to the pre-seek time.
+                self._onAudioPosition(new_ms)
 
     def _commitScrubSeek(self, t: float):
-        self._commitSeek(t)
+        self._pending_seek = t
+        self._seek_timer.start()
+
+    def _flushSeek(self):
+        self._seek_timer.stop()
+        t, self._pending_seek = self._pending_seek, None
+        if t is not None:
+            self._commitSeek(t)
 
     def _onScrubDragStarted(self):
         # Record if we should resume after drag
@@ -361,14 +485,12 @@ class MainWindow(QMainWindow):
             self._resume_after_drag = True
             self.clip_controller.pause()
         # Also pause audio explicitly if playing
-        if (
-            hasattr(self, "media_player")
-            and self.media_player.playbackState()
-            == QMediaPlayer.PlaybackState.PlayingState
-        ):
+        if self._audio_live:
             self.media_player.pause()
 
     def _onScrubDragEnded(self):
+        # Apply the release seek before resuming so playback starts from it.
+        self._flushSeek()
         # Resume playback if it was playing before drag; audio seek handled in commit seek
         if getattr(self, "_resume_after_drag", False):
             self.clip_controller.play()
@@ -380,14 +502,14 @@ class MainWindow(QMainWindow):
             self.clip_scrub.updatePlayButton(state == "playing")
         except Exception:
             pass
-        if not hasattr(self, "media_player"):
+        if not self._audio_ready:
             return
         mp = self.media_player
-        if not mp.source().isLocalFile():
-            return
         if state == "playing":
             try:
-                mp.setPosition(int(self.clip_controller.position() * 1000))
+                start_ms = int(self.clip_controller.position() * 1000)
+                mp.setPosition(start_ms)
+                self._onAudioPosition(start_ms)
             except Exception:
                 pass
             mp.play()
@@ -399,23 +521,13 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
 
-    def _maybeResyncAudio(self, t: float):
-        if not hasattr(self, "media_player"):
-            return
-        mp = self.media_player
-        if mp.playbackState() != QMediaPlayer.PlaybackState.PlayingState:
-            return
-        try:
-            audio_ms = mp.position()
-            video_ms = int(t * 1000)
-            # Only correct when audio is BEHIND video significantly (fast-forward audio).
-            # Avoid rewinding audio when video decode lags; rewinds cause audible chunk repeats.
-            drift = video_ms - audio_ms
-            if drift > 160:  # video ahead -> push audio forward
-                mp.setPosition(video_ms)
-            # If audio ahead, let video catch up naturally; frame skipping now reduces drift.
-        except Exception:
-            pass
+    def _audioClock(self) -> float | None:
+        # Audio is the master clock while it plays: the clip controller shows the
+        # frame due at the audio position rather than reconciling two clocks.
+        if not self._audio_live:
+            return None
+        # Reports arrive in backend-sized steps; advance the last one by the time since.
+        return self._audio_pos_ms / 1000.0 + (perf_counter() - self._audio_pos_at)
 
     def _inOutChanged(self, in_t, out_t):
         if not self.statusBar():
@@ -424,8 +536,6 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage("")
         else:
             try:
-                from ..timeline import format_time
-
                 in_s = format_time(in_t) if in_t is not None else "--"
                 out_s = format_time(out_t) if out_t is not None else "--"
                 self.statusBar().showMessage(f"Selection: {in_s} to {out_s}")
@@ -433,7 +543,18 @@ class MainWindow(QMainWindow):
                 pass
 
 
+def _configureLogging():
+    # Records are formatted and written on the listener's thread, so a slow or
+    # blocked console never stalls the GUI thread that logged them.
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    logging.getLogger().addHandler(QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
+
+
 def run():  # convenience launcher
+    _configureLogging()
     app = QApplication(sys.argv)
     window = MainWindow()
     window._ensureFFmpeg()
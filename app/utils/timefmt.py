@@ -6,24 +6,32 @@ Future additions might include SMPTE formatting, frame<->time conversions, etc.
 
 from __future__ import annotations
 
+from decimal import Decimal, ROUND_HALF_UP
+
 __all__ = ["format_time"]
 
+# Products within this distance (ms) of a .5 tie are rounded from the decimal
+# literal instead: 1.2345 * 1000 is 1234.4999... in binary but must round up.
+_TIE_SLACK = 1e-6
+
 
 def format_time(seconds: float) -> str:
     """Return a human-friendly timestamp mm:ss.mmm for UI labels.
 
     Uses ROUND_HALF_UP semantics for milliseconds to avoid Python's bankers rounding
     edge cases (e.g., 1.2345 -> 1.235). Accepts negative (clamps display to 0).
+    Called on every position update, so only near-ties take the Decimal path.
     """
     if seconds < 0:
         seconds = 0.0
-    from decimal import Decimal, ROUND_HALF_UP
-
-    ms_total = int(
-        (Decimal(str(seconds)) * Decimal(1000)).to_integral_value(
-            rounding=ROUND_HALF_UP
+    scaled = seconds * 1000.0
+    ms_total = int(scaled + 0.5)
+    if abs(scaled - int(scaled) - 0.5) < _TIE_SLACK:
+        ms_total = int(
+            (Decimal(str(seconds)) * Decimal(1000)).to_integral_value(
+                rounding=ROUND_HALF_UP
+            )
         )
-    )
     m, rem = divmod(ms_total, 60000)
     s, ms = divmod(rem, 1000)
     return f"{m:02d}:{s:02d}.{ms:03d}"  # mm:ss.mmm
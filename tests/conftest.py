@@ -0,0 +1,45 @@
+import pytest
+from PySide6.QtCore import QEventLoop, QTimer
+
+
+@pytest.fixture(autouse=True)
+def _isolated_media_cache(tmp_path, monkeypatch):
+    # Keep the on-disk thumbnail/waveform cache out of the user's ~/.cache.
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def load_media():
+    """``load(win, path)``: open ``path`` in a MainWindow and wait until it is shown.
+
+    loadMediaPath opens clips in the background, but a cache hit is shown at once;
+    either way the panel must report ``sourceLoaded`` within 5 s.
+    """
+
+    def load(win, path):
+        panel = win.clip_panel
+        loaded, failed = [], []
+        loop = QEventLoop()
+
+        def on_loaded(*args):
+            loaded.append(args)
+            loop.quit()
+
+        def on_failed(*args):
+            failed.append(args)
+            loop.quit()
+
+        panel.sourceLoaded.connect(on_loaded)
+        panel.loadFailed.connect(on_failed)
+        try:
+            win.loadMediaPath(str(path))
+            if not loaded and not failed:
+                QTimer.singleShot(5000, loop, loop.quit)
+                loop.exec()
+        finally:
+            panel.sourceLoaded.disconnect(on_loaded)
+            panel.loadFailed.disconnect(on_failed)
+        assert not failed, f"loading {path} failed: {failed[0][1]}"
+        assert loaded, f"{path} was not shown within 5 s"
+
+    return load
@@ -12,14 +12,14 @@ def _ensure():
         _app = QApplication.instance() or QApplication([])
 
 
-def test_scrub_pause_resume(tmp_path):
+def test_scrub_pause_resume(tmp_path, load_media):
     _ensure()
     path = tmp_path / "scrub.mp4"
     clip = ColorClip(size=(32, 32), color=(0, 0, 0), duration=0.6)
     clip.write_videofile(str(path), fps=24)
     clip.close()
     win = MainWindow()
-    win.loadMediaPath(str(path))
+    load_media(win, path)
     win.clip_controller.play()
     # Let a few frames play
     loop = QEventLoop()
@@ -41,3 +41,50 @@ def test_scrub_pause_resume(tmp_path):
     QTimer.singleShot(140, loop2.quit)
     loop2.exec()
     assert win.clip_controller.position() > new_t
+
+
+def test_scrub_commits_coalesce(tmp_path, load_media):
+    _ensure()
+    path = tmp_path / "burst.mp4"
+    clip = ColorClip(size=(32, 32), color=(0, 0, 0), duration=0.6)
+    clip.write_videofile(str(path), fps=24, logger=None)
+    clip.close()
+    win = MainWindow()
+    load_media(win, path)
+    commits = []
+    win._commitSeek = commits.append
+    for t in (0.1, 0.2, 0.3):
+        win.clip_scrub.seekRequested.emit(t)
+    loop = QEventLoop()
+    QTimer.singleShot(100, loop.quit)
+    loop.exec()
+    assert commits == [0.3]
+    # Drag end applies a pending commit immediately.
+    win.clip_scrub.seekRequested.emit(0.4)
+    win.clip_scrub.dragEnded.emit()
+    assert commits == [0.3, 0.4]
+
+
+def test_commit_seek_moves_audio_clock_at_once(tmp_path, load_media):
+    _ensure()
+    path = tmp_path / "clock.mp4"
+    clip = ColorClip(size=(32, 32), color=(0, 0, 0), duration=2.0)
+    clip.write_videofile(str(path), fps=24)
+    clip.close()
+    win = MainWindow()
+    load_media(win, path)
+
+    class _Player:  # reports positions only when polled, like the real backend
+        def position(self):
+            return 0
+
+        def setPosition(self, ms):
+            pass
+
+    win.media_player = _Player()
+    win._audio_ready = True
+    win._audio_live = True
+    win._onAudioPosition(0)
+    win._commitSeek(1.5)
+    assert abs(win._audioClock() - 1.5) < 0.1
+    win._audio_live = False
@@ -0,0 +1,53 @@
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from moviepy.audio.AudioClip import AudioArrayClip
+
+from app.services import captions
+
+
+class _StubWhisperModel:
+    def __init__(self, model_size, device, compute_type):
+        self.model_size = model_size
+
+    def transcribe(self, audio, beam_size, vad_filter):
+        assert audio.dtype == np.float32 and audio.ndim == 1
+        segments = [
+            SimpleNamespace(start=0.0, end=0.5, text=" hello ", avg_logprob=-0.1),
+            SimpleNamespace(start=0.5, end=1.0, text="world\n", avg_logprob=-0.7),
+        ]
+        return iter(segments), SimpleNamespace(language="en")
+
+
+def _write_tone(path):
+    t = np.arange(0, 1.0, 1 / 16000)
+    tone = np.sin(2 * np.pi * 440 * t)
+    AudioArrayClip(np.stack([tone, tone], axis=1), fps=16000).write_audiofile(
+        str(path), logger=None
+    )
+
+
+def test_generate_captions_maps_whisper_segments(tmp_path, monkeypatch):
+    audio_path = tmp_path / "tone.wav"
+    _write_tone(audio_path)
+    monkeypatch.setattr(
+        captions, "faster_whisper", SimpleNamespace(WhisperModel=_StubWhisperModel)
+    )
+    captions._load_model.cache_clear()
+    try:
+        result = captions.generate_captions(str(audio_path), model_size="tiny")
+    finally:
+        captions._load_model.cache_clear()
+    assert result.language == "en"
+    assert [s.text for s in result.segments] == ["hello", "world"]
+    assert [(s.start, s.end) for s in result.segments] == [(0.0, 0.5), (0.5, 1.0)]
+    assert result.segments[0].confidence == pytest.approx(math.exp(-0.1))
+    assert result.segments[1].confidence == pytest.approx(math.exp(-0.7))
+
+
+def test_generate_captions_requires_faster_whisper(tmp_path, monkeypatch):
+    monkeypatch.setattr(captions, "faster_whisper", None)
+    with pytest.raises(RuntimeError, match="faster-whisper"):
+        captions.generate_captions(str(tmp_path / "missing.wav"))
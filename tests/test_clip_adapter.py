@@ -1,3 +1,5 @@
+import numpy as np
+import pytest
 from app.media.clip_adapter import ClipAdapter
 from moviepy import ColorClip
 
@@ -15,3 +17,47 @@ def test_clip_adapter_basic(tmp_path):
     # ColorClip has no audio; expect None
     assert audio is None
     adapter.clip.close()
+
+
+def test_clip_adapter_sequential_read(tmp_path):
+    video_path = tmp_path / "seq.mp4"
+    clip = ColorClip(size=(32, 16), color=(255, 0, 0), duration=0.5)
+    clip.write_videofile(str(video_path), fps=24)
+    clip.close()
+    adapter = ClipAdapter.from_path(str(video_path))
+    first = adapter.seek(0.25)
+    following = adapter.next_frame()
+    assert first.shape == following.shape == (16, 32, 3)
+    assert adapter.clip.reader.pos == 8  # frame 6 seeked, frame 7 read
+    adapter.clip.close()
+
+
+def test_clip_adapter_seek_to_last_read_does_not_alias_pool(tmp_path):
+    video_path = tmp_path / "pool.mp4"
+    clip = ColorClip(size=(32, 16), color=(0, 0, 255), duration=0.5)
+    clip.write_videofile(str(video_path), fps=24)
+    clip.close()
+    adapter = ClipAdapter.from_path(str(video_path))
+    played = adapter.grab_to(3)
+    again = adapter.seek(3 / 24)  # the frame the pipe just produced
+    assert not np.shares_memory(again, played)
+    adapter.release_frame(played)
+    assert adapter.grab_to(4) is played  # released buffer is reused
+    assert not np.shares_memory(again, played)
+    adapter.clip.close()
+
+
+def test_clip_adapter_reads_past_the_end_do_not_alias_pool(tmp_path):
+    video_path = tmp_path / "eof.mp4"
+    clip = ColorClip(size=(32, 16), color=(0, 255, 255), duration=0.5)
+    clip.write_videofile(str(video_path), fps=24)
+    clip.close()
+    adapter = ClipAdapter.from_path(str(video_path))
+    last = adapter.grab_to(11)  # final frame, read into a pooled buffer
+    # Container metadata overstating the length leads seeks past the stream end,
+    # where MoviePy repeats its last_read.
+    with pytest.warns(UserWarning):
+        past_end = adapter.seek(12 / 24)
+    assert not np.shares_memory(past_end, last)
+    adapter.release_frame(last)
+    adapter.clip.close()
@@ -0,0 +1,66 @@
+from moviepy import ColorClip
+from app.services import clip_loader
+from app.services.clip_loader import ClipLoader
+
+
+def _load(path):
+    results = []
+    loader = ClipLoader(1, str(path))
+    loader.loaded.connect(lambda gen, p, c: results.append(c))
+    loader.run()
+    return results[0]
+
+
+def _write(path, size):
+    clip = ColorClip(size=size, color=(0, 255, 0), duration=0.2)
+    clip.write_videofile(str(path), fps=10, logger=None)
+    clip.close()
+
+
+def test_large_sources_are_decoded_at_preview_height(tmp_path, monkeypatch):
+    video_path = tmp_path / "tall.mp4"
+    _write(video_path, (64, 48))
+    monkeypatch.setattr(clip_loader, "_PREVIEW_MAX_SIDE", 24)
+    opened = _load(video_path)
+    assert tuple(opened.size) == (32, 24)
+    assert opened.get_frame(0).shape == (24, 32, 3)
+    opened.close()
+
+
+def test_portrait_sources_are_capped_on_the_short_side_and_opened_once(
+    tmp_path, monkeypatch
+):
+    video_path = tmp_path / "portrait.mp4"
+    _write(video_path, (48, 64))
+    real_class = clip_loader.video_file_clip_class()
+    opens = []
+
+    def counting_class(*args, **kwargs):
+        opens.append(kwargs.get("target_resolution"))
+        return real_class(*args, **kwargs)
+
+    monkeypatch.setattr(clip_loader, "video_file_clip_class", lambda: counting_class)
+    monkeypatch.setattr(clip_loader, "_PREVIEW_MAX_SIDE", 48)
+    opened = _load(video_path)  # short side already at the cap: full size
+    assert tuple(opened.size) == (48, 64)
+    opened.close()
+    monkeypatch.setattr(clip_loader, "_PREVIEW_MAX_SIDE", 24)
+    opened = _load(video_path)
+    assert tuple(opened.size) == (24, 32)
+    assert opened.get_frame(0).shape == (32, 24, 3)
+    opened.close()
+    assert opens == [None, (24, None)]
+
+
+def test_probe_reports_duration_without_opening_clip(tmp_path):
+    from app.services.clip_probe import ClipProbe
+
+    video_path = tmp_path / "probe.mp4"
+    clip = ColorClip(size=(16, 16), color=(0, 0, 0), duration=1.5)
+    clip.write_videofile(str(video_path), fps=10, logger=None)
+    clip.close()
+    results = []
+    probe = ClipProbe(str(video_path))
+    probe.probed.connect(lambda path, duration: results.append(duration))
+    probe.run()
+    assert abs(results[0] - 1.5) < 0.05
@@ -0,0 +1,61 @@
+import time
+
+from PySide6.QtCore import QCoreApplication, QThread
+from app.media.decoder import DecoderWorker
+
+
+class IndexAdapter:
+    fps = 10.0
+
+    def grab_to(self, index):
+        return index  # frame payload is its own index
+
+
+def _wait_for(worker, index, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        ready = worker.take(index)
+        if ready is not None:
+            return ready
+        time.sleep(0.005)
+    return None
+
+
+def test_decoder_worker_buffers_and_skips_ahead():
+    QCoreApplication.instance() or QCoreApplication([])
+    worker = DecoderWorker(capacity=2)
+    thread = QThread()
+    worker.moveToThread(thread)
+    thread.started.connect(worker.run)
+    thread.start()
+    try:
+        worker.start(IndexAdapter(), 1, 50)
+        assert _wait_for(worker, 1) == (1, 1)
+        assert _wait_for(worker, 2) == (2, 2)
+        # Consumer falls behind: worker skips straight to the requested frame.
+        ready = _wait_for(worker, 20)
+        assert ready is not None and ready[0] <= 20
+        assert _wait_for(worker, 21)[0] in (20, 21)
+        worker.stop()
+        assert worker.take(100) is None
+    finally:
+        worker.shutdown()
+        thread.quit()
+        thread.wait()
+
+
+def test_decoder_worker_stride_skips_frames():
+    QCoreApplication.instance() or QCoreApplication([])
+    worker = DecoderWorker(capacity=4)
+    thread = QThread()
+    worker.moveToThread(thread)
+    thread.started.connect(worker.run)
+    thread.start()
+    try:
+        worker.start(IndexAdapter(), 1, 50, stride=2)
+        assert _wait_for(worker, 1) == (1, 1)
+        assert _wait_for(worker, 4) == (3, 3)  # frame 2 is never decoded
+    finally:
+        worker.shutdown()
+        thread.quit()
+        thread.wait()
@@ -0,0 +1,157 @@
+from moviepy import ColorClip, VideoFileClip
+
+from app.core.project import ClipDescriptor, Project
+from app.services.export import export_clip, export_project
+
+
+def test_fast_trim_stream_copies_range(tmp_path):
+    src = tmp_path / "src.mp4"
+    clip = ColorClip(size=(32, 32), color=(0, 0, 255), duration=3.0)
+    clip.write_videofile(str(src), fps=24, logger=None)
+    clip.close()
+    dst = tmp_path / "trim.mp4"
+    export_clip(ClipDescriptor(path=str(src), in_point=1.0, out_point=2.0), dst)
+    with VideoFileClip(str(dst)) as trimmed:
+        assert 0.5 < trimmed.duration < 2.5
+
+
+def test_export_project_concatenates_trims(tmp_path):
+    src = tmp_path / "it's.mp4"  # quote must survive the concat list
+    clip = ColorClip(size=(32, 32), color=(255, 0, 0), duration=4.0)
+    clip.write_videofile(str(src), fps=24, logger=None)
+    clip.close()
+    project = Project(
+        clips=[
+            ClipDescriptor(path=str(src), in_point=0.0, out_point=1.0),
+            ClipDescriptor(path=str(src), in_point=2.0, out_point=3.0),
+        ]
+    )
+    dst = tmp_path / "project.mp4"
+    fractions = []
+    export_project(project, dst, progress=fractions.append)
+    assert fractions[-1] == 1.0
+    with VideoFileClip(str(dst)) as out:
+        assert 1.5 < out.duration < 3.5
+
+
+def test_export_project_mixing_effect_and_plain_clips_decodes(tmp_path):
+    import subprocess
+
+    import numpy as np
+    from moviepy.audio.AudioClip import AudioArrayClip
+
+    from app.media.ffmpeg import ffmpeg_executable
+
+    src = tmp_path / "tone.mp4"
+    t = np.arange(0, 4.0, 1 / 44100)
+    tone = np.sin(2 * np.pi * 440 * t)
+    audio = AudioArrayClip(np.stack([tone, tone], axis=1), fps=44100)
+    clip = ColorClip(size=(32, 32), color=(0, 255, 0), duration=4.0).with_audio(audio)
+    clip.write_videofile(str(src), fps=24, audio_codec="aac", logger=None)
+    clip.close()
+    project = Project(
+        clips=[
+            ClipDescriptor(path=str(src), in_point=0.0, out_point=1.0),
+            ClipDescriptor(
+                path=str(src),
+                in_point=2.0,
+                out_point=3.0,
+                metadata={"effects": ["placeholder"]},
+            ),
+        ]
+    )
+    dst = tmp_path / "mixed.mp4"
+    export_project(project, dst)
+    decode = subprocess.run(
+        [ffmpeg_executable(), "-v", "error", "-i", str(dst), "-f", "null", "-"],
+        capture_output=True,
+        text=True,
+    )
+    assert decode.returncode == 0 and decode.stderr.strip() == ""
+    with VideoFileClip(str(dst)) as out:
+        assert out.audio is not None
+        assert 1.5 < out.duration < 3.5
+
+
+def test_export_project_renders_segments_to_one_format(tmp_path):
+    import subprocess
+
+    import numpy as np
+    from moviepy.audio.AudioClip import AudioArrayClip
+
+    from app.media.ffmpeg import ffmpeg_executable
+
+    voiced = tmp_path / "voiced.mp4"
+    t = np.arange(0, 2.0, 1 / 44100)
+    tone = np.sin(2 * np.pi * 440 * t)
+    audio = AudioArrayClip(np.stack([tone, tone], axis=1), fps=44100)
+    clip = ColorClip(size=(32, 48), color=(0, 255, 0), duration=2.0).with_audio(audio)
+    clip.write_videofile(str(voiced), fps=24, audio_codec="aac", logger=None)
+    clip.close()
+    silent = tmp_path / "silent.mp4"
+    clip = ColorClip(size=(64, 32), color=(255, 0, 0), duration=2.0)
+    clip.write_videofile(str(silent), fps=30, logger=None)
+    clip.close()
+    project = Project(
+        clips=[
+            ClipDescriptor(path=str(voiced), out_point=1.0),
+            ClipDescriptor(
+                path=str(silent), out_point=1.0, metadata={"effects": ["placeholder"]}
+            ),
+        ]
+    )
+    dst = tmp_path / "mixed_sizes.mp4"
+    export_project(project, dst)
+    decode = subprocess.run(
+        [ffmpeg_executable(), "-v", "error", "-i", str(dst), "-f", "null", "-"],
+        capture_output=True,
+        text=True,
+    )
+    assert decode.returncode == 0 and decode.stderr.strip() == ""
+    with VideoFileClip(str(dst)) as out:
+        assert tuple(out.size) == (32, 48)  # the first clip's format
+        assert out.fps == 24
+        assert out.audio is not None
+        assert 1.5 < out.duration < 2.5
+
+
+def test_export_clip_without_out_point_stream_copies_to_the_end(
+    tmp_path, monkeypatch
+):
+    from app.services import export
+
+    src = tmp_path / "src.mp4"
+    clip = ColorClip(size=(32, 32), color=(0, 0, 255), duration=3.0)
+    clip.write_videofile(str(src), fps=24, logger=None)
+    clip.close()
+    monkeypatch.setattr(export, "video_file_clip_class", lambda: 1 / 0)  # no re-encode
+    dst = tmp_path / "tail.mp4"
+    export_clip(ClipDescriptor(path=str(src), in_point=1.0), dst)
+    with VideoFileClip(str(dst)) as trimmed:
+        # Stream copy may start at the keyframe before in_point.
+        assert 1.5 < trimmed.duration <= 3.05
+
+
+def test_export_clip_with_effects_encodes_aac_audio(tmp_path):
+    import subprocess
+
+    import numpy as np
+    from moviepy.audio.AudioClip import AudioArrayClip
+
+    from app.media.ffmpeg import ffmpeg_executable
+
+    src = tmp_path / "tone.mp4"
+    t = np.arange(0, 2.0, 1 / 44100)
+    tone = np.sin(2 * np.pi * 440 * t)
+    audio = AudioArrayClip(np.stack([tone, tone], axis=1), fps=44100)
+    clip = ColorClip(size=(32, 32), color=(0, 255, 0), duration=2.0).with_audio(audio)
+    clip.write_videofile(str(src), fps=24, audio_codec="aac", logger=None)
+    clip.close()
+    dst = tmp_path / "effects.mp4"
+    export_clip(
+        ClipDescriptor(path=str(src), metadata={"effects": ["placeholder"]}), dst
+    )
+    probe = subprocess.run(
+        [ffmpeg_executable(), "-i", str(dst)], capture_output=True, text=True
+    )
+    assert "Audio: aac" in probe.stderr and "Video: h264" in probe.stderr
@@ -0,0 +1,20 @@
+from app.media.frame_pool import FramePool
+
+
+def test_frame_pool_reuses_only_released_buffers():
+    pool = FramePool(capacity=2)
+    a = pool.acquire((4, 4, 3))
+    b = pool.acquire((4, 4, 3))
+    assert a is not b  # both leased
+    extra = pool.acquire((4, 4, 3))  # pool exhausted: untracked allocation
+    assert extra is not a and extra is not b
+    pool.release(extra)  # untracked: ignored
+    pool.release(b[:, :, :2])  # releasing a view ends its base's lease
+    assert pool.acquire((4, 4, 3)) is b
+    pool.release(a)
+    pool.release(a)  # a second release is a no-op
+    assert pool.acquire((4, 4, 3)) is a
+    assert pool.acquire((4, 4, 3)) is not a
+    assert pool.acquire((2, 2, 3)).shape == (2, 2, 3)  # shape change purges
+    pool.release(a)  # lease from the old shape: ignored
+    assert pool.acquire((2, 2, 3)) is not a
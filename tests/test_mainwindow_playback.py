@@ -12,7 +12,7 @@ def _ensure_app():
         _app = QApplication.instance() or QApplication([])
 
 
-def test_mainwindow_load_and_preview(tmp_path):
+def test_mainwindow_load_and_preview(tmp_path, load_media):
     _ensure_app()
     video_path = tmp_path / "preview.mp4"
     clip = ColorClip(size=(48, 24), color=(0, 0, 255), duration=0.3)
@@ -20,10 +20,97 @@ def test_mainwindow_load_and_preview(tmp_path):
     clip.close()
 
     win = MainWindow()
-    win.loadMediaPath(str(video_path))
+    load_media(win, video_path)
     # Process events to allow controller to emit initial frame
     loop = QEventLoop()
     QTimer.singleShot(50, loop.quit)
     loop.exec()
     pix = win.video_preview.pixmap()
     assert pix is not None and not pix.isNull()
+
+
+def test_reselecting_imported_clip_reuses_open_clip(tmp_path, load_media):
+    _ensure_app()
+    paths = []
+    for name, color in (("a.mp4", (255, 0, 0)), ("b.mp4", (0, 255, 0))):
+        paths.append(tmp_path / name)
+        clip = ColorClip(size=(32, 16), color=color, duration=0.3)
+        clip.write_videofile(str(paths[-1]), fps=24, logger=None)
+        clip.close()
+
+    win = MainWindow()
+    load_media(win, paths[0])
+    first = win.clip
+    load_media(win, paths[1])
+    assert win.clip is not first
+    # A cache hit is shown synchronously, without another background open.
+    win.loadMediaPath(str(paths[0]))
+    assert win.clip is first
+
+
+def test_prefetched_clip_is_shown_without_second_open(tmp_path, load_media):
+    _ensure_app()
+    video_path = tmp_path / "hover.mp4"
+    clip = ColorClip(size=(32, 16), color=(0, 0, 255), duration=0.3)
+    clip.write_videofile(str(video_path), fps=24, logger=None)
+    clip.close()
+
+    win = MainWindow()
+    panel = win.clip_panel
+    panel.prefetch(str(video_path))
+    panel.prefetch(str(video_path))  # already opening: no second job
+    assert len(panel._opening) == 1
+    load_media(win, video_path)  # adopts the prefetch instead of opening again
+    assert win.clip is not None and panel._opening == {}
+    assert len(panel._clip_cache) == 1
+
+
+def test_closing_window_closes_opened_clips(tmp_path, load_media):
+    _ensure_app()
+    video_path = tmp_path / "close.mp4"
+    clip = ColorClip(size=(32, 16), color=(255, 255, 0), duration=0.3)
+    clip.write_videofile(str(video_path), fps=24, logger=None)
+    clip.close()
+
+    win = MainWindow()
+    load_media(win, video_path)
+    opened = win.clip
+    win.clip_controller.play()
+    win.close()
+    assert opened.reader is None
+    assert win.clip_controller.position() == 0.0
+
+
+def test_drag_preview_snaps_to_keyframe_then_release_seeks_exactly(
+    tmp_path, load_media
+):
+    _ensure_app()
+    video_path = tmp_path / "gop.mp4"
+    clip = ColorClip(size=(32, 16), color=(0, 255, 255), duration=3.0)
+    # One keyframe per second (0, 1, 2 s).
+    clip.write_videofile(
+        str(video_path), fps=10, logger=None, ffmpeg_params=["-g", "10"]
+    )
+    clip.close()
+
+    win = MainWindow()
+    panel = win.clip_panel
+    load_media(win, video_path)
+    # The keyframe index arrives from a background probe.
+    for _ in range(250):
+        if panel._keyframes.get(panel._shown_key) is not None:
+            break
+        loop = QEventLoop()
+        QTimer.singleShot(20, loop.quit)
+        loop.exec()
+    assert list(panel._keyframes[panel._shown_key]) == [0.0, 1.0, 2.0]
+    panel.scrubber.dragStarted.emit()
+    panel.scrubber.positionChanged.emit(1.3)
+    assert abs(panel.controller.position() - 1.0) < 1e-6
+    # The preceding keyframe, however far the nearest one is.
+    panel.scrubber.positionChanged.emit(1.9)
+    assert abs(panel.controller.position() - 1.0) < 1e-6
+    # Release: only seekRequested carries the final position.
+    panel.scrubber.seekRequested.emit(2.7)
+    panel.scrubber.dragEnded.emit()
+    assert abs(panel.controller.position() - 2.7) < 1e-6
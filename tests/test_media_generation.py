@@ -0,0 +1,162 @@
+import os
+import numpy as np
+from moviepy import ColorClip, VideoFileClip
+from moviepy.audio.AudioClip import AudioArrayClip
+from app.media.clip_adapter import SharedPrivateClip
+from app.services.media_generation import ThumbnailWorker, WaveformWorker
+
+
+def test_waveform_envelope_follows_loudness(tmp_path):
+    video_path = tmp_path / "ramp.mp4"
+    t = np.arange(0, 4.0, 1 / 22050)
+    tone = np.sin(2 * np.pi * 440 * t) * (t / 4.0)  # fades in over the clip
+    audio = AudioArrayClip(np.stack([tone, tone], axis=1), fps=22050)
+    clip = ColorClip(size=(16, 16), color=(0, 0, 0), duration=4.0).with_audio(audio)
+    clip.write_videofile(str(video_path), fps=10, logger=None)
+    clip.close()
+    src = VideoFileClip(str(video_path))
+    results = []
+    worker = WaveformWorker(src, 1, 200)
+    worker.finished.connect(lambda gen, env, dur: results.append(env))
+    worker.run()
+    src.close()
+    env = results[0]
+    assert len(env) == 100
+    assert env[10] < env[50] < env[90]
+    assert max(env) == 1.0
+
+
+def test_thumbnail_worker_reuses_private_clip_and_honours_cancel(tmp_path):
+    video_path = tmp_path / "thumbs.mp4"
+    clip = ColorClip(size=(32, 24), color=(0, 0, 255), duration=1.0)
+    clip.write_videofile(str(video_path), fps=10, logger=None)
+    clip.close()
+    src = VideoFileClip(str(video_path))
+    handle = SharedPrivateClip(src)
+    results = []
+    for gen in (1, 2):
+        worker = ThumbnailWorker(src, gen, 4, 12, 0, handle)
+        worker.finished.connect(lambda g, imgs, times, dur: results.append((g, imgs)))
+        worker.run()
+    with handle as private:
+        assert private is not None and private is not src
+    assert [g for g, _ in results] == [1, 2]
+    assert all(img.height() == 12 for _, imgs in results for img in imgs)
+    cancelled = ThumbnailWorker(src, 3, 4, 12, 0, handle)
+    cancelled.finished.connect(lambda *a: results.append(a))
+    cancelled.cancel()
+    cancelled.run()
+    assert len(results) == 2
+    handle.close()
+    src.close()
+
+
+def test_waveform_served_from_disk_cache(tmp_path, monkeypatch):
+    from app.services import media_generation
+
+    video_path = tmp_path / "tone.mp4"
+    t = np.arange(0, 2.0, 1 / 22050)
+    tone = np.sin(2 * np.pi * 440 * t)
+    audio = AudioArrayClip(np.stack([tone, tone], axis=1), fps=22050)
+    clip = ColorClip(size=(16, 16), color=(0, 0, 0), duration=2.0).with_audio(audio)
+    clip.write_videofile(str(video_path), fps=10, logger=None)
+    clip.close()
+    src = VideoFileClip(str(video_path))
+    results = []
+    first = WaveformWorker(src, 1, 200)
+    first.finished.connect(lambda gen, env, dur: results.append(env))
+    first.run()
+
+    def no_decode(*args):
+        raise AssertionError("decoded despite cache hit")
+
+    monkeypatch.setattr(media_generation, "_waveform_samples", no_decode)
+    second = WaveformWorker(src, 2, 200)
+    second.finished.connect(lambda gen, env, dur: results.append(env))
+    second.run()
+    src.close()
+    assert len(results) == 2
+    assert np.allclose(results[0], results[1])
+
+
+def test_thumbnails_come_from_requested_times(tmp_path):
+    from moviepy import VideoClip
+
+    video_path = tmp_path / "steps.mp4"
+    levels = [0, 80, 160, 240]
+
+    def make_frame(t):
+        return np.full((24, 32, 3), levels[min(int(t), 3)], dtype=np.uint8)
+
+    clip = VideoClip(make_frame, duration=4.0)
+    clip.write_videofile(str(video_path), fps=10, logger=None)
+    clip.close()
+    src = VideoFileClip(str(video_path))
+    results = []
+    worker = ThumbnailWorker(src, 1, 4, 12, 0)
+    worker.finished.connect(lambda g, imgs, times, dur: results.append((imgs, times)))
+    worker.run()
+    src.close()
+    images, times = results[0]
+    assert times == [0.0, 1.0, 2.0, 3.0]
+    assert [img.size().toTuple() for img in images] == [(16, 12)] * 4
+    grays = [img.pixelColor(8, 6).red() for img in images]
+    assert all(abs(g - level) < 12 for g, level in zip(grays, levels))
+
+
+def test_waveform_of_video_only_clip_reads_file_audio(tmp_path):
+    video_path = tmp_path / "tone.mp4"
+    t = np.arange(0, 1.0, 1 / 22050)
+    tone = np.sin(2 * np.pi * 440 * t)
+    audio = AudioArrayClip(np.stack([tone, tone], axis=1), fps=22050)
+    clip = ColorClip(size=(16, 16), color=(0, 0, 0), duration=1.0).with_audio(audio)
+    clip.write_videofile(str(video_path), fps=10, logger=None)
+    clip.close()
+    src = VideoFileClip(str(video_path), audio=False)
+    results = []
+    worker = WaveformWorker(src, 1, 200)
+    worker.finished.connect(lambda gen, env, dur: results.append(env))
+    worker.run()
+    src.close()
+    assert len(results) == 1 and max(results[0]) == 1.0
+
+
+def test_keyframe_scan_runs_once_per_file_version(tmp_path, monkeypatch):
+    from app.media import ffmpeg
+
+    video_path = tmp_path / "keys.mp4"
+    clip = ColorClip(size=(16, 16), color=(0, 0, 0), duration=1.0)
+    clip.write_videofile(str(video_path), fps=10, logger=None)
+    clip.close()
+    scans = []
+    real_scan = ffmpeg.keyframe_times
+    monkeypatch.setattr(
+        ffmpeg, "keyframe_times", lambda path: scans.append(path) or real_scan(path)
+    )
+    ffmpeg._keyframe_times_at.cache_clear()
+    first = ffmpeg.cached_keyframe_times(video_path)
+    assert ffmpeg.cached_keyframe_times(str(video_path)) is first
+    assert len(scans) == 1
+    stat = video_path.stat()
+    os.utime(video_path, (stat.st_atime, stat.st_mtime + 5))  # rewritten in place
+    ffmpeg.cached_keyframe_times(video_path)
+    assert len(scans) == 2
+    assert str(video_path) not in ffmpeg._keyframe_locks  # dropped after the scan
+
+
+def test_keyframe_probe_reuses_thumbnail_scan(tmp_path, monkeypatch):
+    from app.media import ffmpeg
+    from app.services.clip_probe import KeyframeProbe
+
+    video_path = tmp_path / "probe.mp4"
+    clip = ColorClip(size=(16, 16), color=(0, 0, 0), duration=1.0)
+    clip.write_videofile(str(video_path), fps=10, logger=None)
+    clip.close()
+    ffmpeg._keyframe_times_at.cache_clear()
+    strip_keys = ffmpeg.cached_keyframe_times(str(video_path))  # as _sampleFile does
+    monkeypatch.setattr(ffmpeg, "keyframe_times", lambda path: 1 / 0)  # no rescans
+    results = []
+    probe = KeyframeProbe(str(video_path))
+    probe.probed.connect(lambda path, times: results.append(times))
+    probe.run()
+    assert len(results) == 1 and results[0] is strip_keys
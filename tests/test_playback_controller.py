@@ -45,3 +45,123 @@ def test_playback_controller_basic(tmp_path):
     loop.exec()
     controller.pause()
     assert controller.position() > 0.0
+
+
+class CountingClip:
+    duration = 1.0
+    fps = 10.0
+
+    def __init__(self):
+        self.decodes = 0
+
+    def get_frame(self, t):
+        import numpy as np
+
+        self.decodes += 1
+        return np.zeros((4, 4, 3), dtype="uint8")
+
+
+def test_repeated_seek_reuses_decoded_frame():
+    _ensure_app()
+    controller = VideoPlaybackController()
+    clip = CountingClip()
+    controller.load(clip)  # decodes frame 0
+    controller.seek(0.5)
+    controller.seek(0.0)
+    controller.seek(0.5)
+    assert clip.decodes == 2
+
+
+def test_step_frame_clamps_and_reuses_cached_frames():
+    _ensure_app()
+    controller = VideoPlaybackController()
+    clip = CountingClip()
+    controller.load(clip)  # decodes frame 0
+    positions = []
+    controller.positionChanged.connect(positions.append)
+    controller.stepFrame(-1)  # clamped to frame 0, cached
+    controller.stepFrame(1)
+    controller.stepFrame(-1)
+    controller.stepFrame(1)
+    assert clip.decodes == 2
+    assert positions[0] == 0.0 and positions[1] > 0.0
+
+
+def test_preview_pixmap_does_not_alias_frame_buffer():
+    import numpy as np
+    from app.media.playback import VideoPreviewWidget
+
+    _ensure_app()
+    preview = VideoPreviewWidget(VideoPlaybackController())
+    preview.resize(16, 10)
+    frame = np.zeros((10, 16, 3), dtype=np.uint8)
+    preview._onFrame(frame, 0.0)
+    frame[:] = 200  # e.g. a recycled decode buffer
+    assert preview.pixmap().toImage().pixelColor(4, 4).red() == 0
+
+
+def test_preview_uploads_scaled_frame_without_conversion():
+    import numpy as np
+    from PySide6.QtGui import QImage
+    from app.media.playback import VideoPreviewWidget
+
+    _ensure_app()
+    preview = VideoPreviewWidget(VideoPlaybackController())
+    preview.resize(32, 20)
+    preview._onFrame(np.zeros((10, 16, 3), dtype=np.uint8), 0.0)
+    # The pixmap keeps the decoded RGB888 layout: the scale is the only full-frame
+    # pass, with no RGB32 conversion or second copy on upload.
+    assert preview.pixmap().toImage().format() == QImage.Format.Format_RGB888
+
+
+def test_paused_read_ahead_serves_nearby_frames():
+    _ensure_app()
+    controller = VideoPlaybackController()
+    clip = CountingClip()
+    controller.load(clip)
+    controller.seek(0.5)
+    loop = QEventLoop()
+    QTimer.singleShot(400, loop.quit)  # settle delay + background decode
+    loop.exec()
+    decoded = clip.decodes
+    controller.stepFrame(1)
+    controller.stepFrame(-3)
+    controller.seek(0.9)
+    assert clip.decodes == decoded
+
+
+def test_preview_pixmaps_shared_across_reopened_file(tmp_path):
+    from moviepy import VideoFileClip
+    from app.media.playback import VideoPreviewWidget
+
+    _ensure_app()
+    video_path = tmp_path / "poster.mp4"
+    clip = ColorClip(size=(32, 24), color=(0, 200, 0), duration=0.5)
+    clip.write_videofile(str(video_path), fps=10, logger=None)
+    clip.close()
+    shown = []
+    for _ in range(2):
+        src = VideoFileClip(str(video_path), audio=False)
+        controller = VideoPlaybackController()
+        preview = VideoPreviewWidget(controller)
+        preview.resize(64, 48)
+        controller.load(src)
+        shown.append(preview.pixmap().cacheKey())
+        controller.unload()
+        src.close()
+    # The second open of the same file reuses the first one's scaled poster.
+    assert shown[0] == shown[1] != 0
+
+
+def test_seek_within_shown_frame_emits_nothing():
+    _ensure_app()
+    controller = VideoPlaybackController()
+    controller.load(CountingClip())
+    controller.seek(0.5)
+    frames = []
+    controller.frameReady.connect(lambda frame, t: frames.append(t))
+    controller.seek(0.51)  # same frame at 10 fps
+    controller.seek(0.52)
+    assert frames == []
+    controller.seek(0.6)
+    assert len(frames) == 1 and abs(frames[0] - 0.6) < 1e-9
@@ -53,3 +53,27 @@ def test_playback_monotonic_qtimer():
     )
     # Ensure we progressed more than a few frames
     assert len(positions) > 5
+
+
+def test_playback_follows_external_clock_then_wall_clock():
+    QCoreApplication.instance() or QCoreApplication([])
+    controller = VideoPlaybackController()
+    controller._clip_adapter = DummyClipAdapter(duration=2.0, fps=20)
+    controller._state.fps = 20
+    controller._state.total_frames = 40
+    controller._applyTiming()
+    controller._decoder = _ReadyDecoder()
+    master = {"t": 1.0}
+    controller.set_clock(lambda: master["t"])
+    controller._restartClock()
+    controller._tick()
+    assert controller._state.current_frame == 20  # audio position, not wall clock
+    master["t"] = None  # audio stopped: continue from its last reading
+    controller._tick()
+    assert 20 <= controller._state.current_frame <= 21
+
+
+class _ReadyDecoder:
+    # Hands out every requested frame at once.
+    def take(self, index):
+        return index, None
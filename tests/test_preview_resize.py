@@ -13,7 +13,7 @@ def _ensure_app():
         _app = QApplication.instance() or QApplication([])
 
 
-def test_preview_shrinks_on_window_resize(tmp_path):
+def test_preview_shrinks_on_window_resize(tmp_path, load_media):
     """Regression test: preview should be able to shrink after being large.
 
     Steps:
@@ -30,7 +30,7 @@ def test_preview_shrinks_on_window_resize(tmp_path):
     win = MainWindow()
     win.resize(1000, 800)
     win.show()
-    win.loadMediaPath(str(video_path))
+    load_media(win, video_path)
 
     # Allow initial frame render
     loop = QEventLoop()
@@ -27,3 +27,21 @@ def test_project_serialization(tmp_path):
     # structure stability
     d = loaded.to_dict()
     assert "clips" in d and isinstance(d["clips"], list)
+
+
+def test_clip_table_columns():
+    p = Project(
+        clips=[
+            ClipDescriptor(path="/a.mp4", in_point=1.0, out_point=3.0),
+            ClipDescriptor(path="/b.mp4"),
+            ClipDescriptor(path="/c.mp4", in_point=2.0, out_point=1.0, mute=True),
+        ]
+    )
+    durations = p.clips.durations()
+    assert durations[0] == 2.0 and durations[2] == 0.0
+    assert p.total_duration() == 2.0
+    assert p.clips[1].in_point is None
+    assert p.clips.mute.tolist() == [False, False, True]
+    p.remove_clip(0)
+    assert [c.path for c in p.clips] == ["/b.mp4", "/c.mp4"]
+    assert p.to_dict()["clips"][1]["out_point"] == 1.0
@@ -15,3 +15,6 @@ def test_format_time_precision():
     # Ensure milliseconds rounding
     assert format_time(1.2344) == "00:01.234"
     assert format_time(1.2345) == "00:01.235"  # rounds up (half-up)
+    # Near-ties follow the decimal literal, not the binary product.
+    assert format_time(4.2364999999999995) == "00:04.236"
+    assert format_time(24.0925) == "00:24.093"
@@ -28,3 +28,22 @@ def test_marker_set():  # simplified: ensure QApplication
     w.setOutPoint()
     i, o = w.inOut()
     assert i is not None and o is not None and o >= i
+
+
+def test_drag_positions_are_throttled_but_final_one_delivered():
+    _ensure_app()
+    w = TimelineWidget()
+    w.setDuration(10.0)
+    emitted = []
+    released = []
+    w.positionChanged.connect(emitted.append)
+    w.seekRequested.connect(released.append)
+    for value in range(0, 200, 5):
+        w.slider.setValue(value)
+        w._onSliderMoved(value)
+    assert len(emitted) < 5
+    count = len(emitted)
+    w._onSliderReleased()
+    # The pending drag position is dropped; the release seek carries the final one.
+    assert len(emitted) == count and not w._drag_emit_timer.isActive()
+    assert released == [195 * 10.0 / w.slider.maximum()]
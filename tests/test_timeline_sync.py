@@ -12,14 +12,14 @@ def _ensure():
         _app = QApplication.instance() or QApplication([])
 
 
-def test_timeline_updates_during_play(tmp_path):
+def test_timeline_updates_during_play(tmp_path, load_media):
     _ensure()
     path = tmp_path / "sync.mp4"
     clip = ColorClip(size=(32, 32), color=(255, 128, 0), duration=0.4)
     clip.write_videofile(str(path), fps=24)
     clip.close()
     win = MainWindow()
-    win.loadMediaPath(str(path))
+    load_media(win, path)
     # Start playback
     win.clip_controller.play()
     start_pos = win.clip_scrub.currentPosition() if win.clip_scrub else 0.0